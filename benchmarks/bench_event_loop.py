@@ -0,0 +1,128 @@
+"""
+Measure event-loop latency while many ``PandasClient.get_meter_data`` calls
+run concurrently, with parsing on the loop (``parse_threads=0``), on the
+default parse threads and in worker processes (``parse_processes``).
+
+Requests are simulated: each chunk arrives after a fixed network delay, as
+an already decoded payload (or raw bytes for the process pool). A ticker
+task that wakes every millisecond records how late it wakes; that lag is
+what every other in-flight request waits as well. Worker processes also
+decode the JSON, and only pay off with idle cores to run on.
+
+    python benchmarks/bench_event_loop.py [meters] [points_per_meter]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from energyid.aio import PandasClient
+
+NETWORK_DELAY = 0.02
+TICK = 0.001
+
+
+def make_chunks(points: int, chunk_size: int = 672) -> list[dict]:
+    index = pd.date_range("2024-01-01", periods=points, freq="15min", tz="UTC")
+    stamps = index.strftime("%Y-%m-%dT%H:%M:%SZ").tolist()
+    return [
+        {
+            "data": [
+                {"timestamp": t, "value": float(i)}
+                for i, t in enumerate(stamps[start : start + chunk_size], start)
+            ]
+        }
+        for start in range(0, points, chunk_size)
+    ]
+
+
+async def monitor(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - t0 - TICK)
+
+
+async def run(client: PandasClient, meters: int, chunks: list[dict]):
+    bodies = [json.dumps(c).encode() for c in chunks]
+    position = {"n": 0}
+
+    def next_index() -> int:
+        i = position["n"] % len(chunks)
+        position["n"] += 1
+        return i
+
+    async def request(method, endpoint, **params):
+        await asyncio.sleep(NETWORK_DELAY)
+        return chunks[next_index()]
+
+    async def request_bytes(method, endpoint, **params):
+        await asyncio.sleep(NETWORK_DELAY)
+        return bodies[next_index()]
+
+    calls = [
+        dict(method="GET", endpoint=f"meters/m{i}/data") for i in range(len(chunks))
+    ]
+    lags: list[float] = []
+    stop = asyncio.Event()
+    with (
+        patch.object(client, "_request", side_effect=request),
+        patch.object(client, "_request_bytes", side_effect=request_bytes),
+        patch.object(client, "_get_meter_data_kwargs", return_value=calls),
+    ):
+        ticker = asyncio.ensure_future(monitor(lags, stop))
+        t0 = time.perf_counter()
+        results = await asyncio.gather(
+            *[client.get_meter_data(f"m{i}") for i in range(meters)]
+        )
+        elapsed = time.perf_counter() - t0
+        stop.set()
+        await ticker
+    assert all(len(ts) for ts in results)
+    return elapsed, np.array(lags) * 1000
+
+
+async def main(meters: int = 20, points: int = 35_040) -> None:
+    chunks = make_chunks(points)
+    print(
+        f"{meters} concurrent get_meter_data calls, {points} points in "
+        f"{len(chunks)} chunks each, {NETWORK_DELAY * 1000:.0f} ms network delay, "
+        f"{os.cpu_count()} CPUs"
+    )
+    print(f"{'':>12}  {'total':>8}  {'lag p50':>8}  {'lag p99':>8}  {'lag max':>8}")
+    modes = {
+        "inline": dict(parse_threads=0),
+        "threads": dict(),
+        "processes": dict(parse_processes=4),
+    }
+    for name, options in modes.items():
+        async with PandasClient(
+            api_key="bench",
+            max_concurrency=None,
+            max_requests_per_window=None,
+            **options,
+        ) as client:
+            if "parse_processes" in options:
+                # Start every worker outside the measurement
+                parser, empty = client._process_parser, [b'{"data": []}']
+                await asyncio.gather(
+                    *[
+                        parser.meter_data(empty, "warmup")
+                        for _ in range(options["parse_processes"])
+                    ]
+                )
+            elapsed, lags = await run(client, meters, chunks)
+        print(
+            f"{name:>12}  {elapsed * 1000:6.0f} ms  {np.percentile(lags, 50):5.1f} ms"
+            f"  {np.percentile(lags, 99):5.1f} ms  {lags.max():5.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,73 @@
+"""
+Compare the columnar meter-data parser against the previous per-chunk parser.
+
+    python benchmarks/bench_meter_data.py [points]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+from energyid.aio.clients.data_helpers import parse_meter_data_multiple
+
+
+def legacy_parse_meter_data(data: dict, meter_id: str) -> pd.Series:
+    df = pd.DataFrame(data["data"])
+    if df.empty:
+        return pd.Series(name=meter_id, dtype="float")
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    df.set_index("timestamp", inplace=True)
+    df.sort_index(inplace=True)
+    ts = df.squeeze(axis=1)
+    ts = ts.rename(meter_id)
+    return ts
+
+
+def legacy_parse_meter_data_multiple(data: list[dict], meter_id: str) -> pd.Series:
+    return pd.concat([legacy_parse_meter_data(data=d, meter_id=meter_id) for d in data])
+
+
+def make_payload(points: int, chunk_size: int = 672) -> list[dict]:
+    index = pd.date_range("2020-01-01", periods=points, freq="15min", tz="UTC")
+    stamps = index.strftime("%Y-%m-%dT%H:%M:%S.0000000Z").tolist()
+    return [
+        {
+            "data": [
+                {"timestamp": t, "value": float(i)}
+                for i, t in enumerate(stamps[start : start + chunk_size], start)
+            ]
+        }
+        for start in range(0, points, chunk_size)
+    ]
+
+
+def measure(func, payload, repeat: int = 5) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(data=payload, meter_id="m")
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    func(data=payload, meter_id="m")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main(points: int = 200_000) -> None:
+    payload = make_payload(points)
+    results = {
+        "legacy": measure(legacy_parse_meter_data_multiple, payload),
+        "columnar": measure(parse_meter_data_multiple, payload),
+    }
+    print(f"{points} points in {len(payload)} chunks")
+    for name, (seconds, peak) in results.items():
+        print(f"{name:>9}: {seconds * 1000:8.1f} ms  peak {peak / 2**20:7.1f} MiB")
+    speedup = results["legacy"][0] / results["columnar"][0]
+    print(f"speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
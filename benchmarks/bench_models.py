@@ -0,0 +1,72 @@
+"""
+Compare construction time and memory of a large record listing wrapped in
+the previous Model (instance __dict__), the current slotted Model and raw
+dicts (``raw=True``).
+
+    python benchmarks/bench_models.py [records]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from energyid.aio.models import Record
+
+
+class LegacyModel(dict):
+    def __init__(self, *args, client=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.client = client
+
+
+class LegacyRecord(LegacyModel):
+    pass
+
+
+def make_listing(records: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "recordNumber": f"EA-{i:08d}",
+            "displayName": f"Record {i}",
+            "recordType": "house",
+            "timeZone": "Europe/Brussels",
+            "city": "Gent",
+            "postalCode": "9000",
+            "country": "BE",
+            "tags": [],
+        }
+        for i in range(records)
+    ]
+
+
+def measure(wrap, listing: list[dict], repeat: int = 5) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        wrap(listing)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = wrap(listing)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, size
+
+
+def main(records: int = 50_000):
+    listing = make_listing(records)
+    client = object()
+    variants = {
+        "legacy Model": lambda d: [LegacyRecord(r, client=client) for r in d],
+        "slotted Model": lambda d: [Record(r, client=client) for r in d],
+        "raw": lambda d: d,
+    }
+    print(f"{records} records")
+    for name, wrap in variants.items():
+        seconds, size = measure(wrap, listing)
+        print(f"{name:>14}: {seconds * 1000:8.1f} ms  {size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,93 @@
+"""
+Compare the matrix-filling record-data parser against the previous
+concat-based parser on a record with many series.
+
+    python benchmarks/bench_record_data.py [series] [points]
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from energyid.aio.clients.data_helpers import parse_record_data
+
+
+def legacy_parse_single_series(d: dict, name: str | None = None) -> pd.Series:
+    if len(d) == 0:
+        return pd.Series(name=name, dtype="object")
+    df = pd.DataFrame(d)
+    df.set_index("timestamp", inplace=True)
+    df.index = pd.to_datetime(df.index, utc=True)
+    df.index = pd.DatetimeIndex(df.index)
+    df.sort_index(inplace=True)
+
+    if isinstance(df.squeeze(), pd.Series):
+        ts = df.squeeze()
+    else:
+        return pd.Series(name=name)
+    ts.index.name = None
+    ts.name = name
+    return ts
+
+
+def legacy_parse_multiple_series(
+    d: list[dict], name: str | None = None
+) -> pd.DataFrame:
+    series_list = []
+    for series in d:
+        ts = legacy_parse_single_series(series["data"], name=series["name"])
+        if ts.empty:
+            continue
+        ts.name = (name, ts.name)
+        series_list.append(ts)
+    if len(series_list) == 0:
+        return pd.DataFrame()
+    return pd.concat(series_list, axis=1)
+
+
+def legacy_parse_record_data(d: dict, name: str):
+    return pd.concat(
+        [legacy_parse_multiple_series(v["series"], name=v["name"]) for v in d["value"]],
+        axis=1,
+    )
+
+
+def make_payload(series: int, points: int) -> dict:
+    index = pd.date_range("2020-01-01", periods=points, freq="h", tz="UTC")
+    stamps = index.strftime("%Y-%m-%dT%H:%M:%S.0000000Z").tolist()
+    data = [{"timestamp": t, "value": float(i)} for i, t in enumerate(stamps)]
+    return {
+        "value": [
+            {
+                "name": f"metric{m}",
+                "series": [
+                    {"name": f"series{s}", "data": data} for s in range(series // 2)
+                ],
+            }
+            for m in range(2)
+        ]
+    }
+
+
+def best_of(func, payload, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func(payload, "x")
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(series: int = 48, points: int = 2_000) -> None:
+    payload = make_payload(series, points)
+    legacy = best_of(legacy_parse_record_data, payload)
+    matrix = best_of(parse_record_data, payload)
+    print(f"{series} series x {points} points")
+    print(f"  legacy: {legacy * 1000:8.1f} ms")
+    print(f"  matrix: {matrix * 1000:8.1f} ms")
+    print(f"speedup: {legacy / matrix:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
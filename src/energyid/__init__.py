@@ -1,8 +1,28 @@
-from .aio import JSONClient, PandasClient, Scope
+from .aio import (
+    JSONClient,
+    MeterInventory,
+    MeterReadingUploader,
+    MutationJournal,
+    PandasClient,
+    Scope,
+)
+from .archive import MemberArchive
+from .cube import RecordDataCube
+from .store import ReadingsStore
 
 __title__ = "energyid"
 __version__ = "1.0.0"
 __author__ = "EnergieID.be"
 __license__ = "MIT"
 
-__all__ = ["JSONClient", "Scope", "PandasClient"]
+__all__ = [
+    "JSONClient",
+    "Scope",
+    "PandasClient",
+    "MeterReadingUploader",
+    "MutationJournal",
+    "MeterInventory",
+    "ReadingsStore",
+    "MemberArchive",
+    "RecordDataCube",
+]
@@ -1,5 +1,21 @@
 from energyid.scope import Scope
 
+from .bulk import BulkOutcome, BulkSummary
 from .client import JSONClient, PandasClient
+from .clients.parse_pool import ProcessParser
+from .inventory import MeterInventory
+from .journal import MutationJournal
+from .uploader import MeterReadingUploader, ReadingResult
 
-__all__ = ["JSONClient", "PandasClient", "Scope"]
+__all__ = [
+    "JSONClient",
+    "PandasClient",
+    "Scope",
+    "MeterReadingUploader",
+    "ReadingResult",
+    "MutationJournal",
+    "MeterInventory",
+    "BulkOutcome",
+    "BulkSummary",
+    "ProcessParser",
+]
@@ -0,0 +1,90 @@
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+from .misc import gather_bounded
+
+DONE = "done"
+FAILED = "failed"
+DRY_RUN = "dry_run"
+
+
+@dataclass
+class BulkOutcome:
+    item: dict
+    action: str
+    status: str
+    result: object = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkSummary:
+    action: str
+    dry_run: bool
+    outcomes: list[BulkOutcome] = field(default_factory=list)
+
+    @property
+    def matched(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def done(self) -> int:
+        return sum(o.status == DONE for o in self.outcomes)
+
+    @property
+    def failed(self) -> list[BulkOutcome]:
+        return [o for o in self.outcomes if o.status == FAILED]
+
+    def __str__(self) -> str:
+        if self.dry_run:
+            return f"{self.action}: {self.matched} matched (dry run)"
+        return (
+            f"{self.action}: {self.matched} matched, {self.done} done, "
+            f"{len(self.failed)} failed"
+        )
+
+
+async def apply_bulk(
+    items: Iterable[dict],
+    func: Callable[[dict], Awaitable],
+    action: str,
+    dry_run: bool = False,
+    concurrency: int = 10,
+    on_progress: Callable[[BulkOutcome, int, int], None] | None = None,
+) -> BulkSummary:
+    """
+    Run ``func(item)`` for every item, at most ``concurrency`` at a time.
+    ``on_progress(outcome, completed, total)`` is called after every item.
+    With ``dry_run``, nothing is called and every item is reported as
+    ``"dry_run"``, so the selection can be checked first.
+    """
+    items = list(items)
+    summary = BulkSummary(action=action, dry_run=dry_run)
+    summary.outcomes = [
+        BulkOutcome(item=item, action=action, status=DRY_RUN) for item in items
+    ]
+    completed = 0
+
+    def report(outcome: BulkOutcome) -> None:
+        nonlocal completed
+        completed += 1
+        if on_progress is not None:
+            on_progress(outcome, completed, len(items))
+
+    if dry_run:
+        for outcome in summary.outcomes:
+            report(outcome)
+        return summary
+
+    def on_done(index, result, error):
+        outcome = summary.outcomes[index]
+        outcome.status = DONE if error is None else FAILED
+        outcome.result, outcome.error = result, error
+        report(outcome)
+
+    await gather_bounded(func, items, concurrency=concurrency, on_done=on_done)
+    return summary
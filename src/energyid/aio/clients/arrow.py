@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .data_helpers import (
+    extract_meter_data,
+    extract_points,
+    merge_points,
+    parse_timestamps,
+    sort_points,
+)
+from .json import JSONClient
+
+UTC_NS = pa.timestamp("ns", tz="UTC")
+
+
+def _timestamp_array(stamps: np.ndarray) -> pa.Array:
+    # Wrap the int64 buffer as-is instead of converting element by element
+    stamps = np.ascontiguousarray(stamps, dtype="int64")
+    return pa.Array.from_buffers(UTC_NS, len(stamps), [None, pa.py_buffer(stamps)])
+
+
+def _value_array(values: np.ndarray) -> pa.Array:
+    # NaN becomes null; the data buffer itself is shared with NumPy
+    return pa.array(values, type=pa.float64(), from_pandas=True)
+
+
+def _labels(labels: list, counts: list[int]) -> pa.DictionaryArray:
+    """Repeat ``labels[i]`` ``counts[i]`` times, dictionary encoded; None is null"""
+    dictionary = [label for label in dict.fromkeys(labels) if label is not None]
+    position = {label: i for i, label in enumerate(dictionary)}
+    codes = np.repeat([position.get(label, -1) for label in labels], counts)
+    codes = codes.astype("int32")
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes, mask=codes < 0), pa.array(dictionary, type=pa.string())
+    )
+
+
+def flatten_table(table: pa.Table) -> pa.Table:
+    """Unnest struct columns until none are left (``a.b.c`` column names)"""
+    while any(pa.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table
+
+
+def rows_table(rows: list[dict]) -> pa.Table:
+    """
+    Table of JSON objects with a column for every key of any row;
+    ``Table.from_pylist`` would only keep the keys of the first row.
+    """
+    if len(rows) == 0:
+        return pa.table({})
+    return pa.Table.from_struct_array(pa.array(rows))
+
+
+def listing_table(rows: list[dict]) -> pa.Table:
+    return flatten_table(rows_table(rows))
+
+
+def meter_data_table(data: list[dict]) -> pa.Table:
+    stamps, values = merge_points(*extract_meter_data(data))
+    return pa.table(
+        {"timestamp": _timestamp_array(stamps), "value": _value_array(values)}
+    )
+
+
+def meters_data_table(data: dict[str, list[dict]]) -> pa.Table:
+    """Long (timestamp, meter_id, value) table of several meters"""
+    meter_ids = list(data)
+    extracted = [merge_points(*extract_meter_data(data[m])) for m in meter_ids]
+    stamps = np.concatenate([e[0] for e in extracted] or [np.empty(0, "int64")])
+    values = np.concatenate([e[1] for e in extracted] or [np.empty(0, "float64")])
+    return pa.table(
+        {
+            "timestamp": _timestamp_array(stamps),
+            "meter_id": _labels(meter_ids, [len(e[0]) for e in extracted]),
+            "value": _value_array(values),
+        }
+    )
+
+
+def readings_table(readings: list[dict]) -> pa.Table:
+    if len(readings) == 0:
+        return pa.table({})
+    table = rows_table(readings)
+    stamps = parse_timestamps(table["timestamp"].to_numpy(zero_copy_only=False))
+    positions = np.arange(len(stamps))
+    stamps, order = sort_points(stamps, positions)
+    if order is not positions:
+        table = table.take(order)
+    column = table.schema.get_field_index("timestamp")
+    table = table.set_column(column, "timestamp", _timestamp_array(stamps))
+    return flatten_table(table)
+
+
+def record_data_table(d: dict, name: str) -> pa.Table:
+    """
+    Long (timestamp, name, series, value) table of record data.
+    ``series`` is null for data without series.
+    """
+    names, series, blocks = [], [], []
+    for value in d["value"]:
+        value_name = name if len(d["value"]) == 1 else value["name"]
+        if "data" in value:
+            names.append(value_name)
+            series.append(None)
+            blocks.append(value["data"])
+        for s in value.get("series", []):
+            names.append(value_name)
+            series.append(s["name"])
+            blocks.append(s["data"])
+    stamps, values = extract_points(blocks, shared_stamps=True)
+    counts = [len(block) for block in blocks]
+    return pa.table(
+        {
+            "timestamp": _timestamp_array(stamps),
+            "name": _labels(names, counts),
+            "series": _labels(series, counts),
+            "value": _value_array(values),
+        }
+    )
+
+
+class ArrowClient(JSONClient):
+    """
+    Client that decodes data straight into Arrow tables.
+
+    Timestamps are ``timestamp[ns, UTC]``, label columns are dictionary
+    encoded. Listings are available as flattened tables through the
+    ``*_table`` methods; the regular listing methods keep returning models.
+    """
+
+    def _convert(self, table: pa.Table):
+        return table
+
+    @staticmethod
+    def to_pandas(table: pa.Table) -> pd.DataFrame:
+        """Hand a table to pandas without copying, using Arrow-backed dtypes"""
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    async def get_meter_data(self, meter_id: str, **kwargs):
+        d = await JSONClient.get_meter_data(self, meter_id=meter_id, **kwargs)
+        return self._convert(meter_data_table(d))
+
+    async def get_meters_data(self, meter_ids: list[str], **kwargs):
+        d = await JSONClient.get_meters_data(self, meter_ids=meter_ids, **kwargs)
+        return self._convert(meters_data_table(d))
+
+    async def get_meter_readings(self, meter_id: str, **kwargs):
+        d = await JSONClient.get_meter_readings(self, meter_id=meter_id, **kwargs)
+        return self._convert(readings_table(d["readings"]))
+
+    async def get_record_data(self, record_id: int, name: str, **kwargs):
+        d = await JSONClient.get_record_data(
+            self, record_id=record_id, name=name, **kwargs
+        )
+        return self._convert(record_data_table(d, name=name))
+
+    async def get_member_records_table(self, user_id: str = "me", **kwargs):
+        records = await self.get_member_records(user_id=user_id, **kwargs)
+        return self._convert(listing_table(records))
+
+    async def get_group_records_table(self, group_id: str, **kwargs):
+        records = await self.get_group_records(group_id=group_id, **kwargs)
+        return self._convert(listing_table(records))
+
+    async def get_record_meters_table(self, record_id: int, **kwargs):
+        meters = await self.get_record_meters(record_id=record_id, **kwargs)
+        return self._convert(listing_table(meters))
+
+    async def get_group_meters_table(self, group_id: str, **kwargs):
+        meters = await self.get_group_meters(group_id=group_id, **kwargs)
+        return self._convert(listing_table(meters))
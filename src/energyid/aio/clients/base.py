@@ -1,5 +1,7 @@
 import asyncio
 import datetime as dt
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from functools import wraps
 from urllib.parse import quote
 
@@ -7,6 +9,8 @@ import aiohttp
 
 from energyid.scope import Scope
 
+from ..identity import IdentityMap
+from ..models import Model
 from .rate_limit import AsyncRequestLimiter
 
 
@@ -19,35 +23,7 @@ def authenticated(func):
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        self = args[0]
-        if self._auth_mode in ("api_key", "device_token"):
-            return await func(*args, **kwargs)
-
-        if self.token is None:
-            async with self.auth_lock:
-                if self.token is None:
-                    if self._username is not None and self._password is not None:
-                        await self.authenticate(
-                            username=self._username,
-                            password=self._password,
-                            scopes=self._scopes,
-                        )
-                    else:
-                        raise PermissionError(
-                            "You haven't authenticated yet and have not provided credentials!"
-                        )
-
-        if (
-            self._refresh_token is not None
-            and self._token_expiration_time <= dt.datetime.now(dt.timezone.utc)
-        ):
-            async with self.auth_lock:
-                if (
-                    self._refresh_token is not None
-                    and self._token_expiration_time <= dt.datetime.now(dt.timezone.utc)
-                ):
-                    await self._re_authenticate()
-
+        await args[0]._ensure_token()
         return await func(*args, **kwargs)
 
     return wrapper
@@ -74,6 +50,8 @@ class BaseClient:
         max_concurrency: int | None = 10,
         max_requests_per_window: int | None = 20,
         rate_limit_window_seconds: float = 1.0,
+        identity_map: str | None = None,
+        identity_map_size: int = 10_000,
     ):
         self._client_id = client_id
         self._client_secret = client_secret
@@ -86,6 +64,9 @@ class BaseClient:
         self._session = session
         self._auth_lock: asyncio.Lock | None = None
         self._auth_headers = {}
+        # Mutating requests sent so far; prefetched relations older than the
+        # last one are not used
+        self._mutations = 0
 
         self._request_limiter = AsyncRequestLimiter(
             max_concurrency=max_concurrency,
@@ -93,6 +74,14 @@ class BaseClient:
             rate_limit_window_seconds=rate_limit_window_seconds,
         )
 
+        # Opt-in: one shared object per record, meter, ... ("weak" or "lru");
+        # None wraps every payload in a fresh object
+        self._identity_map = (
+            None
+            if identity_map is None
+            else IdentityMap(retention=identity_map, maxsize=identity_map_size)
+        )
+
         if api_key is not None:
             self._auth_mode = "api_key"
             self._auth_headers = {"Authorization": f"apiKey {api_key}"}
@@ -129,6 +118,19 @@ class BaseClient:
             self._session = aiohttp.ClientSession()
         return self._session
 
+    @property
+    def identity_map(self) -> IdentityMap | None:
+        return self._identity_map
+
+    def _model(self, cls: type[Model], data: dict) -> Model:
+        if self._identity_map is None:
+            return cls(data, client=self)
+        return self._identity_map.resolve(cls, data, client=self)
+
+    def _forget(self, cls: type[Model], id) -> None:
+        if self._identity_map is not None:
+            self._identity_map.discard(cls, id)
+
     @property
     def token(self):
         return self._token
@@ -143,6 +145,35 @@ class BaseClient:
             0, expires_in
         )
 
+    async def _ensure_token(self) -> None:
+        if self._auth_mode in ("api_key", "device_token"):
+            return
+
+        if self.token is None:
+            async with self.auth_lock:
+                if self.token is None:
+                    if self._username is not None and self._password is not None:
+                        await self.authenticate(
+                            username=self._username,
+                            password=self._password,
+                            scopes=self._scopes,
+                        )
+                    else:
+                        raise PermissionError(
+                            "You haven't authenticated yet and have not provided credentials!"
+                        )
+
+        if (
+            self._refresh_token is not None
+            and self._token_expiration_time <= dt.datetime.now(dt.timezone.utc)
+        ):
+            async with self.auth_lock:
+                if (
+                    self._refresh_token is not None
+                    and self._token_expiration_time <= dt.datetime.now(dt.timezone.utc)
+                ):
+                    await self._re_authenticate()
+
     def _auth_params(self, username: str, password: str, scopes: set[Scope]) -> dict:
         return {
             "grant_type": "password",
@@ -200,27 +231,68 @@ class BaseClient:
             async with self.session.request(
                 method=method, url=url, headers=headers, params=kwargs
             ) as r:
-                if r.status in (401, 403):
-                    error_detail = await self._extract_error_detail(r)
-                    suffix = f" Detail: {error_detail}" if error_detail else ""
-                    raise aiohttp.ClientResponseError(
-                        request_info=r.request_info,
-                        history=r.history,
-                        status=r.status,
-                        message=(
-                            f"{r.reason}. Authorization failed for this endpoint. "
-                            "The token may be missing required permissions or expired."
-                            f"{suffix}"
-                        ),
-                        headers=r.headers,
-                    )
-                r.raise_for_status()
+                await self._raise_for_status(r)
                 if method == "DELETE" or r.status == 204:
                     return {}
                 payload = await r.json(content_type=None)
                 return {} if payload is None else payload
         finally:
             self._request_limiter.release()
+            if method != "GET":
+                self._mutations += 1
+
+    @asynccontextmanager
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+        **kwargs,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Open a request and hand over the unread response, for bodies that
+        are too large to decode at once. The limiter slot is held until the
+        response is closed.
+        """
+        await self._ensure_token()
+        url = f"{self.URL}/{quote(endpoint)}"
+        params = {k: v for k, v in kwargs.items() if v is not None}
+        headers = {**self._auth_headers, **(headers or {})}
+        # Leave the session's default timeout alone unless one is given
+        options = {} if timeout is None else {"timeout": timeout}
+
+        await self._request_limiter.acquire()
+        try:
+            async with self.session.request(
+                method=method, url=url, headers=headers, params=params, **options
+            ) as r:
+                await self._raise_for_status(r)
+                yield r
+        finally:
+            self._request_limiter.release()
+
+    async def _request_bytes(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Undecoded response body, for decoding away from the event loop"""
+        async with self._stream(method, endpoint, **kwargs) as r:
+            return await r.read()
+
+    async def _raise_for_status(self, r: aiohttp.ClientResponse) -> None:
+        if r.status in (401, 403):
+            error_detail = await self._extract_error_detail(r)
+            suffix = f" Detail: {error_detail}" if error_detail else ""
+            raise aiohttp.ClientResponseError(
+                request_info=r.request_info,
+                history=r.history,
+                status=r.status,
+                message=(
+                    f"{r.reason}. Authorization failed for this endpoint. "
+                    "The token may be missing required permissions or expired."
+                    f"{suffix}"
+                ),
+                headers=r.headers,
+            )
+        r.raise_for_status()
 
     @staticmethod
     async def _extract_error_detail(response: aiohttp.ClientResponse) -> str | None:
@@ -1,7 +1,21 @@
+import re
+from functools import lru_cache
 from itertools import pairwise
 
+import numpy as np
 import pandas as pd
 
+# Supported intervals, and the range one request covers at each of them
+METER_DATA_SPANS = {
+    "PT5M": "2D",
+    "PT15M": "7D",
+    "PT1H": "31D",
+    "P1D": "731D",
+    "P7D": "3653D",
+    "P1M": "3653D",
+    "P1Y": "3653D",
+}
+
 
 def build_meter_data_calls(
     meter_id: str,
@@ -15,18 +29,8 @@ def build_meter_data_calls(
         start = pd.to_datetime(start)
         end = pd.to_datetime(end)
 
-        freqs = {
-            "PT5M": "2D",
-            "PT15M": "7D",
-            "PT1H": "31D",
-            "P1D": "731D",
-            "P7D": "3653D",
-            "P1M": "3653D",
-            "P1Y": "3653D",
-        }
-        dates = list(
-            pd.date_range(start=start, end=end, freq=freqs[interval], normalize=True)
-        )
+        freq = METER_DATA_SPANS[interval]
+        dates = list(pd.date_range(start=start, end=end, freq=freq, normalize=True))
         dates.append(end)
         for _start, _end in pairwise(dates):
             call = base.copy()
@@ -39,62 +43,246 @@ def build_meter_data_calls(
     return calls
 
 
+_DIGIT = re.compile(r"\d")
+_OFFSET = re.compile(r"[+-]\d\d:\d\d$")
+
+
+@lru_cache(maxsize=32)
+def _timestamp_layout(shape: str) -> str:
+    """
+    Classify the shape of an ISO-8601 string (digits replaced by 0):
+    ``"utc"`` for a trailing Z, ``"offset"`` for a trailing +hh:mm, ``"naive"``
+    for no designator, ``"generic"`` for anything NumPy can't parse directly.
+    """
+    if not shape.startswith("0000-00-00"):
+        return "generic"
+    if shape.endswith("Z"):
+        return "utc"
+    if _OFFSET.search(shape):
+        return "offset"
+    if "+" in shape or "-" in shape[10:]:
+        return "generic"
+    return "naive"
+
+
+def parse_timestamps(stamps) -> np.ndarray:
+    """
+    Convert ISO-8601 strings to int64 epoch nanoseconds (UTC).
+
+    The layout is detected from the first string (layouts are cached across
+    payloads) and then checked cheaply against every string. Strings that all
+    end in Z or share one UTC offset are parsed by NumPy directly, several
+    times faster than pandas' element-wise format inference. Anything else
+    falls back to ``pd.to_datetime``.
+    """
+    stamps = np.asarray(stamps, dtype=object)
+    if len(stamps) == 0:
+        return np.empty(0, dtype="int64")
+    try:
+        layout = _timestamp_layout(_DIGIT.sub("0", stamps[0]))
+        if layout == "utc" and {s[-1] for s in stamps} == {"Z"}:
+            return _numpy_parse(stamps, strip=1)
+        if layout == "offset":
+            offsets = {s[-6:] for s in stamps}
+            if len(offsets) == 1:
+                return _numpy_parse(stamps, strip=6) - _offset_ns(offsets.pop())
+        # Strings of one naive shape have the same length; a Z or +hh:mm
+        # designator changes it, or the last or sixth from last character
+        first = stamps[0]
+        if layout == "naive" and {(len(s), s[-6], s[-1] == "Z") for s in stamps} == {
+            (len(first), first[-6], False)
+        }:
+            return _numpy_parse(stamps, strip=0)
+    except (TypeError, ValueError, IndexError):
+        pass
+    return pd.to_datetime(stamps, utc=True, format="ISO8601").as_unit("ns").asi8
+
+
+def _numpy_parse(stamps: np.ndarray, strip: int, block: int = 4096) -> np.ndarray:
+    # The sliced strings and NumPy's conversion of them are temporaries;
+    # small blocks keep them to a fraction of the result's size
+    out = np.empty(len(stamps), dtype="int64")
+    end = -strip or None
+    for i in range(0, len(stamps), block):
+        naive = [s[:end] for s in stamps[i : i + block]]
+        out[i : i + block] = np.array(naive, dtype="datetime64[ns]").view("int64")
+    return out
+
+
+def parse_timestamp_index(stamps, name: str | None = None) -> pd.DatetimeIndex:
+    """Like ``parse_timestamps``, but returns a UTC DatetimeIndex"""
+    return _utc_index(parse_timestamps(stamps), name=name)
+
+
+def _offset_ns(offset: str) -> int:
+    sign = -1 if offset[0] == "-" else 1
+    hours, minutes = int(offset[1:3]), int(offset[4:6])
+    return sign * pd.Timedelta(hours=hours, minutes=minutes).value
+
+
+def extract_points(
+    chunks: list[list[dict]], shared_stamps: bool = False
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pull lists of ``{"timestamp": ..., "value": ...}`` points into two flat
+    arrays: int64 epoch nanoseconds (UTC) and float64 values.
+    All timestamps are converted in a single call. Set ``shared_stamps`` when
+    the lists repeat the same timestamps, so each is only converted once.
+    """
+    count = sum(len(points) for points in chunks)
+    if count == 0:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="float64")
+    value_key = next(
+        k for points in chunks if points for k in points[0] if k != "timestamp"
+    )
+    stamps = np.fromiter(
+        (p["timestamp"] for points in chunks for p in points),
+        dtype=object,
+        count=count,
+    )
+    values = np.fromiter(
+        (p[value_key] for points in chunks for p in points),
+        dtype="float64",
+        count=count,
+    )
+    if shared_stamps:
+        codes, uniques = pd.factorize(stamps)
+        return parse_timestamps(uniques)[codes], values
+    return parse_timestamps(stamps), values
+
+
+def extract_meter_data(data: list[dict]) -> tuple[np.ndarray, np.ndarray]:
+    return extract_points([chunk.get("data") or [] for chunk in data])
+
+
+def _utc_index(stamps: np.ndarray, name: str | None = None) -> pd.DatetimeIndex:
+    index = pd.DatetimeIndex(stamps.view("datetime64[ns]"), name=name)
+    return index.tz_localize("UTC")
+
+
+def sort_points(stamps: np.ndarray, *arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Sort points by timestamp, skipping the sort when already ordered"""
+    if len(stamps) > 1 and (np.diff(stamps) < 0).any():
+        order = np.argsort(stamps, kind="stable")
+        return stamps[order], *(a[order] for a in arrays)
+    return stamps, *arrays
+
+
+def merge_points(stamps: np.ndarray, *arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Merge the points of consecutive chunks that are each sorted into a
+    strictly increasing sequence.
+
+    Chunks share their boundary dates (``build_meter_data_calls`` reuses each
+    end date as the next start). Where timestamps repeat, the point of the
+    later chunk wins. Chunks that arrive in order need no sort at all, so the
+    merge is a single linear pass; otherwise a stable sort merges the sorted
+    runs.
+    """
+    stamps, *arrays = sort_points(stamps, *arrays)
+    if len(stamps) > 1:
+        keep = np.empty(len(stamps), dtype=bool)
+        np.not_equal(stamps[:-1], stamps[1:], out=keep[:-1])
+        keep[-1] = True
+        if not keep.all():
+            return stamps[keep], *(a[keep] for a in arrays)
+    return stamps, *arrays
+
+
+def _sorted_series(
+    stamps: np.ndarray,
+    values: np.ndarray,
+    name,
+    index_name: str | None = None,
+    merge: bool = False,
+) -> pd.Series:
+    stamps, values = (merge_points if merge else sort_points)(stamps, values)
+    return pd.Series(values, index=_utc_index(stamps, name=index_name), name=name)
+
+
+def _fill_matrix(
+    stamps: np.ndarray, values: np.ndarray, columns: np.ndarray, width: int
+) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """Scatter points into a NaN-filled (timestamps x width) matrix"""
+    grid = np.unique(stamps)
+    matrix = np.full((len(grid), width), np.nan)
+    # Where points share a timestamp and column, the last one wins
+    matrix[np.searchsorted(grid, stamps), columns] = values
+    return _utc_index(grid), matrix
+
+
 def parse_meter_data(data: dict, meter_id: str) -> pd.Series:
-    df = pd.DataFrame(data["data"])
-    if df.empty:
-        return pd.Series(name=meter_id, dtype="float")
-    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-    df.set_index("timestamp", inplace=True)
-    df.sort_index(inplace=True)
-    ts = df.squeeze(axis=1)
-    ts = ts.rename(meter_id)
-    return ts
+    return parse_meter_data_multiple(data=[data], meter_id=meter_id)
 
 
 def parse_meter_data_multiple(data: list[dict], meter_id: str) -> pd.Series:
-    return pd.concat([parse_meter_data(data=d, meter_id=meter_id) for d in data])
+    stamps, values = extract_meter_data(data)
+    return _sorted_series(
+        stamps, values, name=meter_id, index_name="timestamp", merge=True
+    )
+
 
+def parse_meters_data(data: dict[str, list[dict]], long: bool = False) -> pd.DataFrame:
+    """
+    Parse the chunks of several meters into one time-by-meter frame.
+    The values are written straight into a preallocated matrix on the union
+    of the timestamps.
+    With ``long=True`` a (timestamp, meter_id, value) frame is returned instead.
+    """
+    meter_ids = list(data)
+    extracted = [extract_meter_data(data[meter_id]) for meter_id in meter_ids]
+    stamps = np.concatenate([e[0] for e in extracted] or [np.empty(0, "int64")])
+    values = np.concatenate([e[1] for e in extracted] or [np.empty(0, "float64")])
+    columns = np.repeat(np.arange(len(meter_ids)), [len(e[0]) for e in extracted])
+    index, matrix = _fill_matrix(stamps, values, columns, width=len(meter_ids))
+
+    if not long:
+        return pd.DataFrame(matrix, index=index, columns=meter_ids)
+
+    rows, cols = np.nonzero(~np.isnan(matrix))
+    return pd.DataFrame(
+        {
+            "timestamp": index[rows],
+            "meter_id": pd.Categorical.from_codes(cols, categories=meter_ids),
+            "value": matrix[rows, cols],
+        }
+    )
 
-def parse_single_series(d: dict, name: str | None = None) -> pd.Series:
+
+def parse_single_series(d: list[dict], name: str | None = None) -> pd.Series:
     if len(d) == 0:
         return pd.Series(name=name, dtype="object")
-    df = pd.DataFrame(d)
-    df.set_index("timestamp", inplace=True)
-    df.index = pd.to_datetime(df.index, utc=True)
-    df.index = pd.DatetimeIndex(df.index)
-    df.sort_index(inplace=True)
-
-    if isinstance(df.squeeze(), pd.Series):
-        ts = df.squeeze()
-    else:
-        return pd.Series(name=name)
-    ts.index.name = None
-    ts.name = name
-    return ts
+    stamps, values = extract_points([d])
+    return _sorted_series(stamps, values, name=name)
 
 
-def parse_multiple_series(d: list[dict], name: str | None = None) -> pd.DataFrame:
-    series_list = []
-    for series in d:
-        ts = parse_single_series(series["data"], name=series["name"])
-        if ts.empty:
-            continue
-        ts.name = (name, ts.name)
-        series_list.append(ts)
-    if len(series_list) == 0:
+def _parse_series_frame(labels: list[tuple], blocks: list[list[dict]]) -> pd.DataFrame:
+    """
+    Build one frame with ``labels`` as MultiIndex columns from a list of
+    point lists, filling a single preallocated matrix.
+    """
+    if len(blocks) == 0:
         return pd.DataFrame()
-    return pd.concat(series_list, axis=1)
+    stamps, values = extract_points(blocks, shared_stamps=True)
+    columns = np.repeat(np.arange(len(blocks)), [len(points) for points in blocks])
+    index, matrix = _fill_matrix(stamps, values, columns, width=len(blocks))
+    return pd.DataFrame(matrix, index=index, columns=pd.MultiIndex.from_tuples(labels))
+
+
+def parse_multiple_series(d: list[dict], name: str | None = None) -> pd.DataFrame:
+    series = [s for s in d if len(s["data"]) > 0]
+    return _parse_series_frame(
+        labels=[(name, s["name"]) for s in series],
+        blocks=[s["data"] for s in series],
+    )
 
 
 def parse_multiple_values(d: list[dict]) -> pd.DataFrame:
-    values_list = []
-    for values in d:
-        name = values["name"]
-        data = parse_multiple_series(values["series"], name=name)
-        values_list.append(data)
-    if len(values_list) == 0:
-        return pd.DataFrame()
-    return pd.concat(values_list, axis=1)
+    series = [(v["name"], s) for v in d for s in v["series"] if len(s["data"]) > 0]
+    return _parse_series_frame(
+        labels=[(name, s["name"]) for name, s in series],
+        blocks=[s["data"] for _, s in series],
+    )
 
 
 def parse_record_data(d: dict, name: str):
@@ -108,3 +296,102 @@ def parse_record_data(d: dict, name: str):
         raise ValueError("Data block not found")
 
     return parse_multiple_values(d["value"])
+
+
+def format_timestamps(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Vectorized ISO-8601 UTC strings (``2024-01-01T00:00:00Z``). Seconds get
+    as many decimals as the most precise timestamp needs, so distinct
+    timestamps give distinct strings.
+    """
+    nanos = index.tz_convert("UTC").as_unit("ns").asi8
+    unit = next(
+        (
+            u
+            for u, step in (("s", 10**9), ("ms", 10**6), ("us", 10**3))
+            if not (nanos % step).any()
+        ),
+        "ns",
+    )
+    stamps = nanos.view("datetime64[ns]")
+    return np.char.add(np.datetime_as_string(stamps, unit=unit), "Z")
+
+
+def validate_readings(ts: pd.Series, cumulative: bool = False) -> list[str]:
+    """
+    Check a series of readings before uploading anything.
+    Returns a list of problems, empty when the series is fine.
+    """
+    problems = []
+    if not isinstance(ts.index, pd.DatetimeIndex):
+        return ["index is not a DatetimeIndex"]
+    if ts.index.tz is None:
+        problems.append("timestamps are timezone-naive")
+    nan = ts.isna()
+    if nan.any():
+        problems.append(f"{nan.sum()} missing values, first at {ts.index[nan][0]}")
+    duplicated = ts.index.duplicated()
+    if duplicated.any():
+        first = ts.index[duplicated][0]
+        problems.append(f"{duplicated.sum()} duplicate timestamps, first at {first}")
+    if cumulative:
+        values = ts.sort_index(kind="stable").dropna()
+        decreasing = values.diff() < 0
+        if decreasing.any():
+            first = values.index[decreasing][0]
+            problems.append(
+                f"cumulative readings decrease {decreasing.sum()} times, "
+                f"first at {first}"
+            )
+    return problems
+
+
+# NumPy and nullable integer dtypes by lowercase name, e.g. "uint8": "UInt8"
+_NULLABLE_INTS = {
+    f"{sign}int{bits}": f"{sign.upper()}Int{bits}"
+    for sign in ("", "u")
+    for bits in (8, 16, 32, 64)
+}
+
+
+def _compact_column(s: pd.Series, values: str, category_ratio: float) -> pd.Series:
+    kind = s.dtype.kind
+    if kind == "f":
+        return s.astype("Float32" if values == "nullable" else "float32")
+    if kind in "iu":
+        s = pd.to_numeric(s, downcast="unsigned" if kind == "u" else "integer")
+        if values == "nullable":
+            return s.astype(_NULLABLE_INTS[s.dtype.name.lower()])
+        return s
+    if kind == "O" and len(s) > 0:
+        if s.nunique(dropna=True) <= category_ratio * len(s):
+            return s.astype("category")
+    return s
+
+
+def compact(
+    obj: pd.Series | pd.DataFrame, values: str = "float32", category_ratio=0.5
+) -> pd.Series | pd.DataFrame:
+    """
+    Shrink a parsed Series or DataFrame in memory.
+
+    Floats become float32 (``values="float32"``, about 7 significant digits)
+    or nullable Float32 (``values="nullable"``), integers are downcast, and
+    object columns whose distinct values are at most ``category_ratio`` of
+    their length (status codes, units...) become categorical.
+    The number of bytes saved is reported in ``obj.attrs["memory_saved"]``.
+    """
+    if values not in ("float32", "nullable"):
+        raise ValueError('values must be "float32" or "nullable"')
+    before = obj.memory_usage(deep=True)
+    if isinstance(obj, pd.Series):
+        out = _compact_column(obj, values=values, category_ratio=category_ratio)
+    else:
+        out = obj.copy(deep=False)
+        for i in range(obj.shape[1]):
+            out.isetitem(i, _compact_column(obj.iloc[:, i], values, category_ratio))
+    after = out.memory_usage(deep=True)
+    if isinstance(obj, pd.DataFrame):
+        before, after = before.sum(), after.sum()
+    out.attrs["memory_saved"] = int(before - after)
+    return out
@@ -1,4 +1,5 @@
 from .catalogs import CatalogsMixin
+from .exports import ExportsMixin
 from .groups import GroupsMixin
 from .members import MembersMixin
 from .meters import MetersMixin
@@ -9,6 +10,7 @@ from .transfers import TransfersMixin
 
 __all__ = [
     "CatalogsMixin",
+    "ExportsMixin",
     "GroupsMixin",
     "MembersMixin",
     "MetersMixin",
@@ -0,0 +1,269 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import aiohttp
+
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+# Seconds before the first retry; doubles per attempt, up to 30
+RETRY_BACKOFF = 1.0
+
+
+def _retryable(error: Exception) -> bool:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, aiohttp.ClientError | asyncio.TimeoutError)
+
+
+def _content_total(response: aiohttp.ClientResponse) -> int | None:
+    """Full size of the resource from Content-Range or Content-Length"""
+    if response.status == 206:
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        return int(total) if total.isdigit() else None
+    return response.content_length
+
+
+def _unsatisfiable_total(error: Exception) -> int | None:
+    """Resource size from a 416 response's ``Content-Range: bytes */total``"""
+    if not (isinstance(error, aiohttp.ClientResponseError) and error.status == 416):
+        return None
+    total = (error.headers or {}).get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _split(total: int, segments: int) -> list[list[int]]:
+    """``[start, end, position]`` of every segment, end exclusive"""
+    size = -(-total // segments) if total else 0
+    return [
+        [start, min(start + size, total), start] for start in range(0, total, size or 1)
+    ]
+
+
+def file_checksum(path: str | os.PathLike, algorithm: str = "sha256") -> str:
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        while block := f.read(8 << 20):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ArchiveDownload:
+    """
+    State of one resumable archive download.
+
+    Bytes go to ``<path>.part``; ``<path>.part.json`` records the total size
+    and how far every segment got, so an interrupted download continues
+    where it stopped.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.part = path.with_name(path.name + ".part")
+        self.state_path = path.with_name(path.name + ".part.json")
+        self.total: int | None = None
+        self.segments: list[list] = []
+        # Segments save from worker threads
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        if not (self.state_path.exists() and self.part.exists()):
+            return False
+        with open(self.state_path) as f:
+            state = json.load(f)
+        self.total, self.segments = state["total"], state["segments"]
+        return True
+
+    def save(self) -> None:
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with self._lock:
+            with open(tmp_path, "w") as f:
+                json.dump({"total": self.total, "segments": self.segments}, f)
+            os.replace(tmp_path, self.state_path)
+
+    def write(self, f, data: bytes, segment: list) -> None:
+        # Flushed before the new position is saved, so the state never
+        # claims bytes that only lived in a buffer
+        f.write(data)
+        f.flush()
+        segment[2] += len(data)
+        self.save()
+
+    def start(self, total: int | None, segments: int) -> None:
+        self.total = total
+        if total is None:
+            # Size unknown: one segment that runs until the body ends
+            self.segments = [[0, None, 0]]
+        else:
+            self.segments = _split(total, segments)
+        with open(self.part, "wb") as f:
+            if total:
+                f.truncate(total)
+        self.save()
+
+    @property
+    def downloaded(self) -> int:
+        return sum(position - start for start, _, position in self.segments)
+
+    def finish(self) -> None:
+        os.replace(self.part, self.path)
+        self.state_path.unlink()
+
+
+class ExportsMixin:
+    async def _archive_size(
+        self, endpoint: str, timeout: aiohttp.ClientTimeout
+    ) -> int | None:
+        """Archive size if the server serves byte ranges, else None"""
+        async with self._stream(
+            "GET", endpoint, headers={"Range": "bytes=0-0"}, timeout=timeout
+        ) as r:
+            return _content_total(r) if r.status == 206 else None
+
+    async def _download_segment(
+        self,
+        endpoint: str,
+        download: ArchiveDownload,
+        segment: list,
+        timeout: aiohttp.ClientTimeout,
+        chunk_size: int,
+        retries: int,
+        on_progress: Callable[[int, int | None], None] | None,
+    ) -> None:
+        attempt = 0
+        while segment[1] is None or segment[2] < segment[1]:
+            start, end, position = segment
+            headers = {}
+            if position > 0 or end is not None:
+                last = "" if end is None else end - 1
+                headers["Range"] = f"bytes={position}-{last}"
+            try:
+                async with self._stream(
+                    "GET", endpoint, headers=headers, timeout=timeout
+                ) as r:
+                    if headers and r.status != 206:
+                        if len(download.segments) > 1:
+                            raise RuntimeError("The server stopped serving ranges")
+                        # Range ignored: the body starts from the beginning
+                        segment[2] = position = 0
+                    if end is None:
+                        download.total = _content_total(r)
+                    with open(download.part, "r+b") as f:
+                        f.seek(position)
+                        if end is None:
+                            await asyncio.to_thread(f.truncate)
+                        buffer = bytearray()
+                        async for chunk in r.content.iter_chunked(1 << 16):
+                            buffer += chunk
+                            if len(buffer) >= chunk_size:
+                                await self._flush(f, buffer, download, segment)
+                                self._progress(download, on_progress)
+                        if buffer:
+                            await self._flush(f, buffer, download, segment)
+                            self._progress(download, on_progress)
+                expected = end if end is not None else download.total
+                if expected is not None and segment[2] < expected:
+                    raise aiohttp.ClientPayloadError("Response ended early")
+                if end is None:
+                    segment[1] = segment[2]
+                    await asyncio.to_thread(download.save)
+            except Exception as e:
+                if end is None and _unsatisfiable_total(e) == position:
+                    # The body was complete, but the process stopped before
+                    # saving that; nothing is left to fetch
+                    download.total = segment[1] = position
+                    await asyncio.to_thread(download.save)
+                    continue
+                attempt += 1
+                if attempt > retries or not _retryable(e):
+                    raise
+                await asyncio.sleep(min(RETRY_BACKOFF * 2 ** (attempt - 1), 30))
+
+    @staticmethod
+    async def _flush(f, buffer: bytearray, download: ArchiveDownload, segment: list):
+        data = bytes(buffer)
+        buffer.clear()
+        await asyncio.to_thread(download.write, f, data, segment)
+
+    @staticmethod
+    def _progress(download: ArchiveDownload, on_progress) -> None:
+        if on_progress is not None:
+            on_progress(download.downloaded, download.total)
+
+    async def download_member_archive(
+        self,
+        member_id: str,
+        path: str | os.PathLike,
+        segments: int = 1,
+        checksum: str | None = None,
+        on_progress: Callable[[int, int | None], None] | None = None,
+        chunk_size: int = 4 << 20,
+        retries: int = 5,
+        read_timeout: float = 300,
+    ) -> Path:
+        """
+        Download a member's data archive (a zip) to ``path``.
+
+        The body is streamed into ``<path>.part`` in ``chunk_size`` blocks
+        that are written off the event loop. Dropped connections are resumed
+        with HTTP Range requests, up to ``retries`` times per segment, and a
+        new call with the same ``path`` continues an interrupted download.
+        With ``segments > 1`` and a server that serves ranges, the archive is
+        fetched in that many parallel ranges.
+
+        ``checksum`` (``"sha256:<hex>"``, or any ``hashlib`` algorithm) is
+        verified before the file is moved to ``path``; a mismatch raises
+        ValueError and discards the download. ``on_progress(done, total)`` is
+        called after every block; ``total`` is None while unknown.
+        """
+        if segments < 1:
+            raise ValueError("segments must be >= 1")
+        endpoint = f"export/members/{member_id}/archive"
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=read_timeout)
+        download = ArchiveDownload(Path(path))
+
+        if not download.load():
+            total = None
+            if segments > 1:
+                total = await self._archive_size(endpoint, timeout)
+            download.start(total, segments if total is not None else 1)
+
+        tasks = [
+            asyncio.ensure_future(
+                self._download_segment(
+                    endpoint,
+                    download,
+                    segment,
+                    timeout=timeout,
+                    chunk_size=chunk_size,
+                    retries=retries,
+                    on_progress=on_progress,
+                )
+            )
+            for segment in download.segments
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if checksum is not None:
+            algorithm, _, expected = checksum.rpartition(":")
+            actual = await asyncio.to_thread(
+                file_checksum, download.part, algorithm or "sha256"
+            )
+            if actual != expected.lower():
+                download.part.unlink()
+                download.state_path.unlink()
+                raise ValueError(
+                    f"Checksum mismatch for {download.path}: "
+                    f"expected {expected}, got {actual}"
+                )
+        download.finish()
+        return download.path
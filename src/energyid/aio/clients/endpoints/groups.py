@@ -1,37 +1,51 @@
-from ...models import Group, Member, Meter, Record
+from ...models import Group, Member, Meter, ModelList, Record
 
 
 class GroupsMixin:
     async def get_group(self, group_id: str, **kwargs) -> Group:
         endpoint = f"groups/{group_id}"
         d = await self._request("GET", endpoint, **kwargs)
-        return Group(d, client=self)
+        return self._model(Group, d)
 
     async def get_group_records(
-        self, group_id: str, take: int = 200, skip: int = 0, **kwargs
-    ) -> list[Record]:
+        self,
+        group_id: str,
+        take: int = 200,
+        skip: int = 0,
+        raw: bool = False,
+        **kwargs,
+    ) -> list[Record] | list[dict]:
         endpoint = f"groups/{group_id}/records"
         d = await self._request("GET", endpoint, take=take, skip=skip, **kwargs)
-        return [Record(r, client=self) for r in d]
+        if raw:
+            return d
+        return ModelList(self._model(Record, r) for r in d)
 
     async def get_group_members(
         self, group_id: str, take: int = 200, skip: int = 0
     ) -> list[Member]:
         endpoint = f"groups/{group_id}/members"
         d = await self._request("GET", endpoint, take=take, skip=skip)
-        return [Member(u, client=self) for u in d]
+        return ModelList(self._model(Member, u) for u in d)
 
     async def get_group_meters(
-        self, group_id: str, take: int = 200, skip: int = 0, **kwargs
-    ) -> list[Meter]:
+        self,
+        group_id: str,
+        take: int = 200,
+        skip: int = 0,
+        raw: bool = False,
+        **kwargs,
+    ) -> list[Meter] | list[dict]:
         endpoint = f"groups/{group_id}/meters"
         d = await self._request("GET", endpoint, take=take, skip=skip, **kwargs)
-        return [Meter(m, client=self) for m in d]
+        if raw:
+            return d
+        return ModelList(self._model(Meter, m) for m in d)
 
     async def get_group_my_records(self, group_id: str, **kwargs) -> list[Record]:
         endpoint = f"groups/{group_id}/records/mine"
         d = await self._request("GET", endpoint, **kwargs)
-        return [Record(r, client=self) for r in d]
+        return ModelList(self._model(Record, r) for r in d)
 
     async def get_group_admins(self, group_id: str) -> list[dict]:
         endpoint = f"groups/{group_id}/admins"
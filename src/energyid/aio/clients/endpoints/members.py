@@ -1,11 +1,11 @@
-from ...models import Group, Member, Record
+from ...models import Group, Member, ModelList, Record
 
 
 class MembersMixin:
     async def get_member(self, user_id: str = "me") -> Member:
         endpoint = f"members/{user_id}"
         d = await self._request("GET", endpoint)
-        return Member(d, client=self)
+        return self._model(Member, d)
 
     async def update_member(
         self,
@@ -22,7 +22,7 @@ class MembersMixin:
             initials=initials,
             biography=biography,
         )
-        return Member(d, client=self)
+        return self._model(Member, d)
 
     async def get_member_limits(self, user_id: str = "me") -> list[dict]:
         endpoint = f"members/{user_id}/limits"
@@ -31,22 +31,22 @@ class MembersMixin:
     async def set_member_language(self, user_id: str, lang: str) -> Member:
         endpoint = f"members/{user_id}/lang"
         d = await self._request("PUT", endpoint, lang=lang)
-        return Member(d, client=self)
+        return self._model(Member, d)
 
     async def set_member_default_record(self, user_id: str, record_id: str) -> Member:
         endpoint = f"members/{user_id}/defaultRecord"
         d = await self._request("PUT", endpoint, recordId=record_id)
-        return Member(d, client=self)
+        return self._model(Member, d)
 
     async def set_member_default_record_page(self, user_id: str, page: str) -> Member:
         endpoint = f"members/{user_id}/defaultRecordPage"
         d = await self._request("PUT", endpoint, page=page)
-        return Member(d, client=self)
+        return self._model(Member, d)
 
     async def get_member_groups(self, user_id: str = "me", **kwargs) -> list[Group]:
         endpoint = f"members/{user_id}/groups"
         d = await self._request("GET", endpoint, **kwargs)
-        return [Group(g, client=self) for g in d]
+        return ModelList(self._model(Group, g) for g in d)
 
     async def get_member_records(
         self,
@@ -54,7 +54,8 @@ class MembersMixin:
         filter: str | None = None,
         accessLevel: str | None = None,
         expand: str | None = None,
-    ) -> list[Record]:
+        raw: bool = False,
+    ) -> list[Record] | list[dict]:
         endpoint = f"members/{user_id}/records"
         d = await self._request(
             "GET",
@@ -63,4 +64,6 @@ class MembersMixin:
             accessLevel=accessLevel,
             expand=expand,
         )
-        return [Record(r, client=self) for r in d]
+        if raw:
+            return d
+        return ModelList(self._model(Record, r) for r in d)
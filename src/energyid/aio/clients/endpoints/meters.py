@@ -1,8 +1,11 @@
 import asyncio
+from collections.abc import Callable, Iterable
 
 import pandas as pd
 
+from ...bulk import BulkSummary, apply_bulk
 from ...models import Meter
+from ...uploader import MeterReadingUploader
 from ..data_helpers import build_meter_data_calls
 
 
@@ -10,7 +13,7 @@ class MetersMixin:
     async def get_meter(self, meter_id: str) -> Meter:
         endpoint = f"meters/{meter_id}"
         d = await self._request("GET", endpoint)
-        return Meter(d, client=self)
+        return self._model(Meter, d)
 
     async def get_meter_readings(
         self,
@@ -34,9 +37,13 @@ class MetersMixin:
         endpoint = f"meters/{meter_id}/readings"
         return await self._request("POST", endpoint, value=value, timestamp=timestamp)
 
+    def meter_reading_uploader(self, **kwargs) -> MeterReadingUploader:
+        """Uploader that sends many readings concurrently, with backpressure"""
+        return MeterReadingUploader(client=self, **kwargs)
+
     async def _create_meter(self, **kwargs) -> Meter:
         d = await self._request("POST", "meters", **kwargs)
-        return Meter(d, client=self)
+        return self._model(Meter, d)
 
     async def create_meter(
         self,
@@ -59,7 +66,7 @@ class MetersMixin:
     async def hide_meter(self, meter_id: str, hidden: bool = True) -> Meter:
         endpoint = f"meters/{meter_id}/hidden"
         d = await self._request("POST", endpoint, hidden=hidden)
-        return Meter(d, client=self)
+        return self._model(Meter, d)
 
     async def close_meter(self, meter_id: str, closed: bool = True) -> dict:
         endpoint = f"meters/{meter_id}/closed"
@@ -68,7 +75,57 @@ class MetersMixin:
     async def edit_meter(self, meter_id: str, **kwargs) -> Meter:
         endpoint = f"meters/{meter_id}"
         d = await self._request("PUT", endpoint, **kwargs)
-        return Meter(d, client=self)
+        return self._model(Meter, d)
+
+    async def _select_meters(
+        self,
+        record_ids: int | str | Iterable[int | str],
+        predicate: Callable[[Meter], bool],
+    ) -> list[Meter]:
+        if isinstance(record_ids, int | str):
+            record_ids = [record_ids]
+        listings = await asyncio.gather(
+            *[self.get_record_meters(record_id=r) for r in record_ids]
+        )
+        return [meter for meters in listings for meter in meters if predicate(meter)]
+
+    async def hide_meters_where(
+        self,
+        record_ids: int | str | Iterable[int | str],
+        predicate: Callable[[Meter], bool],
+        hidden: bool = True,
+        **kwargs,
+    ) -> BulkSummary:
+        """
+        Hide (or unhide) every meter of the given records for which
+        ``predicate`` is true. Keyword arguments go to ``apply_bulk``.
+        """
+        meters = await self._select_meters(record_ids, predicate)
+        return await apply_bulk(
+            meters,
+            lambda m: self.hide_meter(meter_id=m.id, hidden=hidden),
+            action="hide_meter",
+            **kwargs,
+        )
+
+    async def close_meters_where(
+        self,
+        record_ids: int | str | Iterable[int | str],
+        predicate: Callable[[Meter], bool],
+        closed: bool = True,
+        **kwargs,
+    ) -> BulkSummary:
+        """
+        Close (or reopen) every meter of the given records for which
+        ``predicate`` is true. Keyword arguments go to ``apply_bulk``.
+        """
+        meters = await self._select_meters(record_ids, predicate)
+        return await apply_bulk(
+            meters,
+            lambda m: self.close_meter(meter_id=m.id, closed=closed),
+            action="close_meter",
+            **kwargs,
+        )
 
     @staticmethod
     def _get_meter_data_kwargs(
@@ -94,6 +151,31 @@ class MetersMixin:
         requests = [self._request(**call) for call in calls]
         return list(await asyncio.gather(*requests))
 
+    async def get_meters_data(
+        self,
+        meter_ids: list[str],
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        interval: str = "P1D",
+    ) -> dict[str, list[dict]]:
+        """
+        Fetch data for many meters at once.
+        The chunks of all meters are scheduled together, so the request
+        limiter stays saturated instead of draining between meters.
+        """
+        calls = [
+            (meter_id, call)
+            for meter_id in meter_ids
+            for call in self._get_meter_data_kwargs(
+                meter_id=meter_id, start=start, end=end, interval=interval
+            )
+        ]
+        responses = await asyncio.gather(*[self._request(**call) for _, call in calls])
+        data = {meter_id: [] for meter_id in meter_ids}
+        for (meter_id, _), response in zip(calls, responses):
+            data[meter_id].append(response)
+        return data
+
     async def get_meter_reading(self, meter_id: str, key: str) -> dict:
         endpoint = f"meters/{meter_id}/readings/{key}"
         return await self._request("GET", endpoint)
@@ -119,6 +201,7 @@ class MetersMixin:
     async def delete_meter(self, meter_id: str) -> None:
         endpoint = f"meters/{meter_id}"
         await self._request("DELETE", endpoint)
+        self._forget(Meter, meter_id)
 
     async def delete_meter_reading(self, meter_id: str, key: str) -> None:
         endpoint = f"meters/{meter_id}/readings/{key}"
@@ -1,27 +1,87 @@
-from ...models import Group, Meter, Record
+from collections.abc import Callable, Hashable, Iterable
+
+import pandas as pd
+
+from ...bulk import BulkSummary, apply_bulk
+from ...journal import MutationJournal
+from ...misc import gather_bounded
+from ...models import Group, Meter, ModelList, Record
+
+REQUIRED_RECORD_FIELDS = (
+    "displayName",
+    "recordType",
+    "city",
+    "postalCode",
+    "country",
+    "category",
+)
+
+
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def record_payload(row: dict, columns: dict[str, str] | None = None) -> dict:
+    """
+    Map a row to ``create_record`` API fields. Column names may be
+    snake_case argument names (``display_name``) or API names
+    (``displayName``); ``columns`` renames columns first. Missing values
+    are left out.
+    """
+    columns = columns or {}
+    payload = {}
+    for name, value in row.items():
+        if value is None:
+            continue
+        payload[_camel(columns.get(name, name))] = value
+    return payload
+
+
+def _key_func(key: str | Callable | None) -> Callable[[dict], Hashable] | None:
+    if key is None:
+        return None
+    if callable(key):
+        func = key
+    else:
+        # Payloads are camelCased, so a snake_case key would never match
+        field = _camel(key)
+
+        def func(d: dict):
+            return d.get(field)
+
+    def key_of(d: dict) -> Hashable:
+        # Keys go into sets; lists such as tags are compared as tuples
+        value = func(d)
+        return tuple(value) if isinstance(value, list) else value
+
+    return key_of
 
 
 class RecordsMixin:
     async def get_record(self, record_id: int, **kwargs) -> Record:
         endpoint = f"records/{record_id}"
         d = await self._request("GET", endpoint, **kwargs)
-        return Record(d, client=self)
+        return self._model(Record, d)
 
     async def get_record_meters(
-        self, record_id: int, filter: dict = None, **kwargs
-    ) -> list[Meter]:
+        self, record_id: int, filter: dict = None, raw: bool = False, **kwargs
+    ) -> list[Meter] | list[dict]:
         endpoint = f"records/{record_id}/meters"
         d = await self._request("GET", endpoint, **kwargs)
-        meters = [Meter(m, client=self) for m in d]
+        meters = d if raw else ModelList(self._model(Meter, m) for m in d)
         if filter:
-            for key in filter:
-                meters = [meter for meter in meters if meter[key] == filter[key]]
+            meters = type(meters)(
+                meter
+                for meter in meters
+                if all(meter[key] == value for key, value in filter.items())
+            )
         return meters
 
     async def get_record_groups(self, record_id: int, **kwargs) -> list[Group]:
         endpoint = f"records/{record_id}/groups"
         d = await self._request("GET", endpoint, **kwargs)
-        return [Group(g, client=self) for g in d]
+        return ModelList(self._model(Group, g) for g in d)
 
     async def get_record_data(
         self,
@@ -163,7 +223,7 @@ class RecordsMixin:
 
     async def _create_record(self, **kwargs) -> Record:
         d = await self._request("POST", "records", **kwargs)
-        return Record(d, client=self)
+        return self._model(Record, d)
 
     async def create_record(
         self,
@@ -224,13 +284,135 @@ class RecordsMixin:
     async def edit_record(self, record_id: int, **kwargs) -> Record:
         endpoint = f"records/{record_id}"
         d = await self._request("PUT", endpoint, **kwargs)
-        return Record(d, client=self)
+        return self._model(Record, d)
 
     async def delete_record(self, record_id: int) -> None:
         endpoint = f"records/{record_id}"
         await self._request("DELETE", endpoint)
+        self._forget(Record, record_id)
 
     async def get_record_definitions(self, record_id: str) -> list[dict]:
         endpoint = f"records/{record_id}/definitions"
         d = await self._request("GET", endpoint)
         return d["data"]
+
+    async def create_records_bulk(
+        self,
+        rows: Iterable[dict] | pd.DataFrame,
+        key: str | Callable[[dict], Hashable] | None = "displayName",
+        columns: dict[str, str] | None = None,
+        existing: Iterable[dict] | None = None,
+        user_id: str = "me",
+        concurrency: int = 10,
+        journal: MutationJournal | None = None,
+    ) -> list[dict]:
+        """
+        Create a record for every row of a DataFrame or iterable of dicts,
+        at most ``concurrency`` at a time (on top of the request limiter).
+        See ``record_payload`` for how columns map to record fields.
+
+        Rows whose ``key`` matches an existing record are skipped. ``key`` is
+        a field name (``displayName`` or ``display_name``) or a function of a
+        record (and of a row's payload) returning a hashable value or a list,
+        e.g. ``lambda r: next((t for t in r.get("tags", []) if
+        t.startswith("site:")), None)``. Lists are compared as tuples.
+        Existing records are ``get_member_records(user_id)`` unless given;
+        ``key=None`` skips the check. With a ``journal``, identical rows share
+        one journal entry, so only the first is created and the others are
+        duplicates.
+
+        Returns one dict per row with its ``key``, ``status`` ("created",
+        "exists", "duplicate" of an earlier row, "invalid" or "failed"), the
+        created ``record`` and the ``error``. With a ``journal``, records
+        created by an earlier run are not created again.
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.astype(object).where(rows.notna(), None)
+            rows = rows.to_dict("records")
+        payloads = [record_payload(row, columns) for row in rows]
+        key_of = _key_func(key)
+
+        known, seen = set(), set()
+        if key_of is not None:
+            if existing is None:
+                existing = await self.get_member_records(user_id=user_id)
+            known = {key_of(record) for record in existing} - {None}
+
+        results, todo = [], []
+        for payload in payloads:
+            k = None if key_of is None else key_of(payload)
+            result = {"key": k, "status": None, "record": None, "error": None}
+            if k is None and journal is not None:
+                # Identical rows would run at once under one journal entry
+                k = journal.make_key("create_record", **payload)
+            results.append(result)
+            missing = [f for f in REQUIRED_RECORD_FIELDS if f not in payload]
+            if missing:
+                result["status"] = "invalid"
+                result["error"] = ValueError(f"missing {', '.join(missing)}")
+            elif k in known:
+                result["status"] = "exists"
+            elif k in seen:
+                result["status"] = "duplicate"
+            else:
+                todo.append((result, payload))
+                if k is not None:
+                    seen.add(k)
+
+        async def create(payload: dict) -> Record:
+            if journal is None:
+                return await self._create_record(**payload)
+            record = await journal.run(
+                self._create_record, operation="create_record", **payload
+            )
+            return self._model(Record, record)
+
+        outcomes = await gather_bounded(
+            create, [payload for _, payload in todo], concurrency=concurrency
+        )
+        for (result, _), (record, error) in zip(todo, outcomes):
+            result["status"] = "created" if error is None else "failed"
+            result["record"] = record
+            result["error"] = error
+        return results
+
+    async def delete_records_where(
+        self, predicate: Callable[[Record], bool], user_id: str = "me", **kwargs
+    ) -> BulkSummary:
+        """
+        Delete every record of ``user_id`` for which ``predicate`` is true.
+        ``dry_run``, ``concurrency`` and ``on_progress`` go to ``apply_bulk``;
+        do a dry run first to check the selection.
+        """
+        records = await self.get_member_records(user_id=user_id)
+        return await apply_bulk(
+            [r for r in records if predicate(r)],
+            lambda r: self.delete_record(record_id=r.id),
+            action="delete_record",
+            **kwargs,
+        )
+
+    async def edit_records_where(
+        self,
+        predicate: Callable[[Record], bool],
+        changes: dict | Callable[[Record], dict],
+        user_id: str = "me",
+        **kwargs,
+    ) -> BulkSummary:
+        """
+        Edit every record of ``user_id`` for which ``predicate`` is true with
+        ``changes``, or with ``changes(record)`` to edit each record
+        differently. Keyword arguments go to ``apply_bulk``.
+        """
+        records = await self.get_member_records(user_id=user_id)
+
+        async def edit(record: Record) -> Record:
+            fields = changes(record) if callable(changes) else changes
+            return await self.edit_record(record_id=record.id, **fields)
+
+        return await apply_bulk(
+            [r for r in records if predicate(r)],
+            edit,
+            action="edit_record",
+            **kwargs,
+        )
@@ -1,10 +1,10 @@
-from ...models import Group
+from ...models import Group, ModelList
 
 
 class SearchMixin:
     async def search_groups(self, q: str = None, **kwargs) -> list[Group]:
         d = await self._request("GET", "search/groups", q=q, **kwargs)
-        return [Group(g, client=self) for g in d]
+        return ModelList(self._model(Group, g) for g in d)
 
     async def search_services(
         self, q: str = None, top: int = 100, skip: int = 0, **kwargs
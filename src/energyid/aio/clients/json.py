@@ -1,6 +1,7 @@
 from .base import BaseClient
 from .endpoints import (
     CatalogsMixin,
+    ExportsMixin,
     GroupsMixin,
     MembersMixin,
     MetersMixin,
@@ -13,6 +14,7 @@ from .endpoints import (
 
 class JSONClient(
     CatalogsMixin,
+    ExportsMixin,
     GroupsMixin,
     MembersMixin,
     MetersMixin,
@@ -1,26 +1,110 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from json import JSONDecodeError
+
 import pandas as pd
 
+from energyid.cube import RecordDataCube
+
+from ..models import Record
+from ..uploader import ReadingResult
 from .data_helpers import (
+    compact,
+    format_timestamps,
     parse_meter_data,
     parse_meter_data_multiple,
+    parse_meters_data,
     parse_multiple_series,
     parse_multiple_values,
     parse_record_data,
     parse_single_series,
+    parse_timestamp_index,
+    validate_readings,
 )
 from .json import JSONClient
+from .parse_pool import ProcessParser
 
 
 class PandasClient(JSONClient):
+    def __init__(
+        self,
+        *args,
+        compact: bool | str = False,
+        parse_processes: int | ProcessParser | None = None,
+        parse_executor: Executor | None = None,
+        parse_threads: int = 2,
+        parse_queue: int = 8,
+        **kwargs,
+    ):
+        """
+        Set ``compact`` to True (float32 values) or "nullable" (nullable
+        Float32 values) to shrink every parsed result, see
+        ``data_helpers.compact``. The bytes saved per result are reported in
+        its ``attrs["memory_saved"]``.
+
+        With ``parse_processes`` (a number of worker processes, or a
+        ``ProcessParser`` shared between clients), ``get_meter_data``
+        decodes and parses responses in worker processes instead of on the
+        event loop. A pool created here is shut down by ``close``.
+
+        Parsing of other responses runs on ``parse_executor``, by default a
+        pool of ``parse_threads`` threads created on first use and shut down
+        by ``close`` (``parse_threads=0`` parses on the event loop). NumPy
+        and pandas release the GIL for much of the work, so the loop keeps
+        serving other requests meanwhile. At most ``parse_queue`` parses
+        are queued or running at once; further responses wait, holding
+        their unparsed payload only.
+        """
+        super().__init__(*args, **kwargs)
+        self._compact = "float32" if compact is True else compact
+        self._owns_parser = isinstance(parse_processes, int)
+        if self._owns_parser:
+            parse_processes = ProcessParser(max_workers=parse_processes)
+        self._process_parser = parse_processes
+        self._parse_executor = parse_executor
+        self._parse_threads = parse_threads if parse_executor is None else 0
+        self._parse_slots = asyncio.Semaphore(parse_queue)
+
+    async def close(self):
+        await super().close()
+        if self._owns_parser:
+            self._process_parser.shutdown(wait=False)
+        if self._parse_threads and self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=False)
+            self._parse_executor = None
+
+    async def _parse(self, func: Callable, *args, **kwargs):
+        """Run ``func`` on the parse executor, or inline without one"""
+        if self._parse_executor is None:
+            if not self._parse_threads:
+                return func(*args, **kwargs)
+            self._parse_executor = ThreadPoolExecutor(
+                max_workers=self._parse_threads, thread_name_prefix="energyid-parse"
+            )
+        async with self._parse_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._parse_executor, partial(func, *args, **kwargs)
+            )
+
+    def _finalize(self, obj):
+        if not self._compact or obj.empty:
+            return obj
+        return compact(obj, values=self._compact)
+
     async def get_meter_readings(self, meter_id: str, **kwargs) -> pd.DataFrame:
         d = await JSONClient.get_meter_readings(self, meter_id=meter_id, **kwargs)
         df = pd.DataFrame(d["readings"])
         if df.empty:
             return df
-        df["timestamp"] = pd.DatetimeIndex(pd.to_datetime(df["timestamp"], utc=True))
+        df["timestamp"] = parse_timestamp_index(df["timestamp"].to_numpy())
         df.set_index("timestamp", inplace=True)
         df.sort_index(inplace=True)
-        return df
+        return self._finalize(df)
 
     @staticmethod
     def _parse_meter_data(data: dict, meter_id: str) -> pd.Series:
@@ -45,8 +129,79 @@ class PandasClient(JSONClient):
         return parse_record_data(d=d, name=name)
 
     async def get_meter_data(self, meter_id: str, **kwargs) -> pd.Series:
+        if self._process_parser is not None:
+            calls = self._get_meter_data_kwargs(meter_id=meter_id, **kwargs)
+            payloads = await asyncio.gather(
+                *[self._request_bytes(**call) for call in calls]
+            )
+            ts = await self._process_parser.meter_data(payloads, meter_id=meter_id)
+            return await self._parse(self._finalize, ts)
         d = await JSONClient.get_meter_data(self, meter_id=meter_id, **kwargs)
-        return self._parse_meter_data_multiple(data=d, meter_id=meter_id)
+        return await self._parse(self._meter_data_result, d, meter_id)
+
+    def _meter_data_result(self, data: list[dict], meter_id: str) -> pd.Series:
+        return self._finalize(
+            self._parse_meter_data_multiple(data=data, meter_id=meter_id)
+        )
+
+    async def iter_meter_data(
+        self,
+        meter_id: str,
+        start: str | pd.Timestamp | None = None,
+        end: str | pd.Timestamp | None = None,
+        interval: str = "P1D",
+        buffer: int = 4,
+    ) -> AsyncIterator[pd.Series]:
+        """
+        Yield the data of a meter chunk by chunk, in time order, as soon as
+        each chunk is ready. At most ``buffer`` chunks are requested ahead of
+        the consumer, which bounds memory regardless of the range.
+
+        Consecutive chunks share their boundary date. As in
+        ``get_meter_data`` the later chunk wins, so the last point of every
+        chunk is held back until the next chunk shows whether it repeats it.
+        """
+        if buffer < 1:
+            raise ValueError("buffer must be >= 1")
+        calls = iter(
+            self._get_meter_data_kwargs(
+                meter_id=meter_id, start=start, end=end, interval=interval
+            )
+        )
+        pending: deque[asyncio.Task] = deque()
+        held = None
+        try:
+            for call in islice(calls, buffer):
+                pending.append(asyncio.ensure_future(self._request(**call)))
+            while pending:
+                d = await pending.popleft()
+                for call in islice(calls, 1):
+                    pending.append(asyncio.ensure_future(self._request(**call)))
+                ts = await self._parse(
+                    self._parse_meter_data, data=d, meter_id=meter_id
+                )
+                if ts.empty:
+                    continue
+                if held is not None and held.index[-1] < ts.index[0]:
+                    ts = pd.concat([held, ts])
+                held = ts.iloc[-1:]
+                if len(ts) > 1:
+                    yield self._finalize(ts.iloc[:-1])
+            if held is not None:
+                yield self._finalize(held)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_meters_data(
+        self, meter_ids: list[str], long: bool = False, **kwargs
+    ) -> pd.DataFrame:
+        d = await JSONClient.get_meters_data(self, meter_ids=meter_ids, **kwargs)
+        return await self._parse(self._meters_data_result, d, long)
+
+    def _meters_data_result(self, data: dict, long: bool) -> pd.DataFrame:
+        return self._finalize(parse_meters_data(data=data, long=long))
 
     async def get_record_data(
         self, record_id: int, name, record=None, **kwargs
@@ -54,7 +209,158 @@ class PandasClient(JSONClient):
         d = await JSONClient.get_record_data(
             self, record_id=record_id, name=name, **kwargs
         )
-        data = self._parse_record_data(d, name)
-        if record is None:
+        if record is None and self.identity_map is not None:
+            record = self.identity_map.get(Record, record_id)
+        if record is None or "timeZone" not in record:
             record = await self.get_record(record_id=record_id)
-        return data.tz_convert(record.timezone)
+        return await self._parse(self._record_data_result, d, name, record.timezone)
+
+    def _record_data_result(self, d, name, timezone: str):
+        return self._finalize(self._parse_record_data(d, name).tz_convert(timezone))
+
+    async def get_group_data(
+        self,
+        group_id: str,
+        names: list[str],
+        start: str,
+        end: str,
+        interval: str = "day",
+        records: list[Record] | None = None,
+        on_progress: Callable[[int, int], None] | None = None,
+        local_time: bool = True,
+        **kwargs,
+    ) -> RecordDataCube:
+        """
+        Harvest record data of a whole group into a records x time x metrics
+        cube. All (record, metric) requests run concurrently under the limiter.
+        ``on_progress(completed, total)`` is called after every request.
+
+        The cube holds one value per record, timestamp and metric: when a
+        response has several series (e.g. when ``grouping`` is set), the
+        series are summed per timestamp. ``local_time`` goes to
+        ``RecordDataCube.from_series``; pass False for sub-daily intervals
+        that cross a DST fall-back.
+        """
+        if records is None:
+            group = await self.get_group(group_id=group_id)
+            records = [record async for record in group.get_records()]
+        missing = [record for record in records if "timeZone" not in record]
+        await asyncio.gather(*[record.extend_info() for record in missing])
+        timezones = {record.id: record.timezone for record in records}
+
+        pairs = [(record.id, name) for record in records for name in names]
+        completed = 0
+
+        async def fetch(record_id, name: str) -> dict:
+            nonlocal completed
+            d = await JSONClient.get_record_data(
+                self,
+                record_id=record_id,
+                name=name,
+                start=start,
+                end=end,
+                interval=interval,
+                **kwargs,
+            )
+            completed += 1
+            if on_progress is not None:
+                on_progress(completed, len(pairs))
+            return d
+
+        responses = await asyncio.gather(
+            *[fetch(record_id, name) for record_id, name in pairs]
+        )
+
+        def series():
+            for (record_id, name), d in zip(pairs, responses):
+                data = self._parse_record_data(d, name)
+                if isinstance(data, pd.DataFrame):
+                    # One series per grouping value; the cube takes their total
+                    data = data.sum(axis=1, min_count=1)
+                yield record_id, name, data
+
+        return await self._parse(
+            RecordDataCube.from_series,
+            series(),
+            timezones=timezones,
+            local_time=local_time,
+        )
+
+    async def upload_readings(
+        self,
+        meter_id: str,
+        data: pd.Series | pd.DataFrame,
+        cumulative: bool = False,
+        skip_existing: bool = True,
+        **kwargs,
+    ) -> pd.DataFrame:
+        """
+        Upload a series of readings (or a frame with a ``value`` column)
+        indexed by tz-aware timestamps.
+
+        The whole series is validated before any request is sent: missing
+        values, duplicate or timezone-naive timestamps and, with
+        ``cumulative=True``, decreasing values raise a ValueError listing
+        every problem. With ``skip_existing``, readings at or before the
+        meter's latest reading are not sent again.
+        Extra keyword arguments go to ``meter_reading_uploader``.
+
+        Returns a frame with the value, status ("sent", "skipped" or
+        "failed") and error of every reading.
+        """
+        ts = data["value"] if isinstance(data, pd.DataFrame) else data
+        problems = validate_readings(ts, cumulative=cumulative)
+
+        latest = None
+        if skip_existing and not problems:
+            try:
+                reading = await self.get_meter_latest_reading(meter_id=meter_id)
+            except JSONDecodeError:
+                reading = {}
+            if reading and reading.get("timestamp") is not None:
+                latest = parse_timestamp_index([reading["timestamp"]])[0]
+                if cumulative and reading.get("value") is not None:
+                    newer = ts[ts.index > latest]
+                    if len(newer) and newer.min() < reading["value"]:
+                        problems.append(
+                            "cumulative readings drop below the latest reading "
+                            f"({reading['value']} at {latest})"
+                        )
+        if problems:
+            raise ValueError(
+                f"Readings for meter {meter_id} were not uploaded: "
+                + "; ".join(problems)
+            )
+
+        ts = ts.sort_index()
+        stamps = format_timestamps(ts.index)
+        status = pd.Series("skipped", index=ts.index, dtype=object)
+        errors = pd.Series(None, index=ts.index, dtype=object)
+        send = ts.index > latest if latest is not None else slice(None)
+        positions = {s: i for i, s in enumerate(stamps)}
+
+        def on_result(result: ReadingResult):
+            i = positions[result.timestamp]
+            status.iat[i] = "sent" if result.ok else "failed"
+            errors.iat[i] = None if result.ok else result.error
+
+        async with self.meter_reading_uploader(
+            on_result=on_result, **kwargs
+        ) as uploader:
+            for timestamp, value in zip(stamps[send], ts.to_numpy()[send].tolist()):
+                await uploader.put(meter_id, str(timestamp), value)
+
+        return pd.DataFrame({"value": ts, "status": status, "error": errors})
+
+    async def create_records_bulk(
+        self, rows: pd.DataFrame | list[dict], **kwargs
+    ) -> pd.DataFrame:
+        """
+        ``JSONClient.create_records_bulk``, returning the results as a frame
+        with the index of ``rows`` when it is a DataFrame.
+        """
+        results = await JSONClient.create_records_bulk(self, rows=rows, **kwargs)
+        index = rows.index if isinstance(rows, pd.DataFrame) else None
+        return pd.DataFrame(
+            results, index=index, columns=["key", "status", "record", "error"]
+        )
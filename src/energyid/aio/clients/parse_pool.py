@@ -0,0 +1,102 @@
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from .data_helpers import _utc_index, extract_meter_data, merge_points
+
+
+def _parse_meter_points(payloads: list[bytes]) -> tuple[str | None, int]:
+    """
+    Worker side: decode and parse meter data chunks into one shared memory
+    block of ``n`` int64 timestamps followed by ``n`` float64 values.
+    Returns the block's name and ``n``.
+    """
+    stamps, values = merge_points(
+        *extract_meter_data([json.loads(p) for p in payloads])
+    )
+    n = len(stamps)
+    if n == 0:
+        return None, 0
+    shm = SharedMemory(create=True, size=16 * n)
+    try:
+        np.ndarray(n, dtype="int64", buffer=shm.buf)[:] = stamps
+        np.ndarray(n, dtype="float64", buffer=shm.buf, offset=8 * n)[:] = values
+    finally:
+        # The block outlives this handle; the parent unlinks it
+        shm.close()
+    return shm.name, n
+
+
+def _take_points(name: str | None, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Parent side: copy the points out of a worker's block and free it"""
+    if name is None:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="float64")
+    shm = SharedMemory(name=name)
+    try:
+        stamps = np.frombuffer(shm.buf, dtype="int64", count=n).copy()
+        values = np.frombuffer(shm.buf, dtype="float64", count=n, offset=8 * n).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return stamps, values
+
+
+def _discard_points(future: Future) -> None:
+    """Free the block of a parse whose caller has gone away"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    name, _ = future.result()
+    if name is not None:
+        shm = SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
+
+
+class ProcessParser:
+    """
+    Parses meter data in a pool of worker processes.
+
+    JSON decoding and parsing of large responses are CPU-bound and hold the
+    GIL, so with many concurrent ``get_meter_data`` calls the event loop
+    (and with it the request limiter) waits on the parser. Here the raw
+    response bodies go to the workers instead. Each result comes back as a
+    single shared memory block of timestamps and values, so it isn't
+    pickled through a pipe, only copied out once.
+
+    Workers are started with "forkserver" where available ("spawn"
+    elsewhere): forking a process that runs an event loop and its threads
+    is unsafe.
+    """
+
+    def __init__(self, max_workers: int | None = None, mp_context=None):
+        if mp_context is None:
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            mp_context = multiprocessing.get_context(method)
+        # Workers inherit the tracker, so the blocks they create are
+        # unregistered again when the parent unlinks them
+        resource_tracker.ensure_running()
+        self._pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    async def meter_data(self, payloads: list[bytes], meter_id: str) -> pd.Series:
+        """Same result as ``parse_meter_data_multiple`` on the decoded bodies"""
+        future = self._pool.submit(_parse_meter_points, payloads)
+        try:
+            name, n = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A parse that is already running still creates its block
+            future.add_done_callback(_discard_points)
+            raise
+        stamps, values = _take_points(name, n)
+        return pd.Series(
+            values, index=_utc_index(stamps, name="timestamp"), name=meter_id
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=True)
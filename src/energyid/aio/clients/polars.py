@@ -0,0 +1,14 @@
+import polars as pl
+import pyarrow as pa
+
+from .arrow import ArrowClient
+
+
+class PolarsClient(ArrowClient):
+    """
+    ArrowClient that returns Polars frames.
+    Polars adopts the Arrow buffers, so no extra conversion pass is made.
+    """
+
+    def _convert(self, table: pa.Table) -> pl.DataFrame:
+        return pl.from_arrow(table)
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import os
+import shutil
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .clients.arrow import listing_table, readings_table
+from .clients.json import JSONClient
+from .misc import gather_bounded
+from .models import Record
+
+
+@dataclass
+class ExportSummary:
+    records: int = 0
+    meters: int = 0
+    readings: int = 0
+    skipped: int = 0
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    # Records whose meters could not be listed, by record id
+    failed_records: dict[str, BaseException] = field(default_factory=dict)
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table | None:
+    """``table`` with exactly the columns of ``schema``, or None if it can't"""
+    if not set(table.column_names) <= set(schema.names):
+        return None
+    columns = []
+    for f in schema:
+        if f.name in table.column_names:
+            column = table[f.name]
+            if column.type != f.type:
+                try:
+                    column = column.cast(f.type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    return None
+        else:
+            column = pa.nulls(len(table), type=f.type)
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class MeterWriter:
+    """
+    Writes the pages of one meter's readings into Parquet files, one row
+    group per page. A page whose columns don't fit the open file starts the
+    next ``part-<n>.parquet``. Files are written under a temporary directory
+    that only replaces ``path`` once the meter is complete.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        # Dataset readers skip names starting with "_"
+        self.tmp_path = path.with_name(f"_{path.name}.tmp")
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+        self.tmp_path.mkdir(parents=True)
+        self.parts = 0
+        self.rows = 0
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, table: pa.Table) -> None:
+        if self._writer is not None:
+            conformed = _conform(table, self._writer.schema)
+            if conformed is None:
+                self._writer.close()
+                self._writer = None
+            else:
+                table = conformed
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self.tmp_path / f"part-{self.parts}.parquet", table.schema
+            )
+            self.parts += 1
+        self._writer.write_table(table)
+        self.rows += len(table)
+
+    def commit(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+
+class AccountExport:
+    """
+    Export every record, meter and reading of a member to Parquet.
+
+    Layout under ``path``::
+
+        records.parquet
+        meters.parquet
+        readings/record_id=<id>/meter_id=<id>/part-<n>.parquet
+        checkpoint.json
+
+    Nested metadata is flattened to ``a.b`` columns once, when the records
+    and meters tables are built. Meters are exported ``concurrency`` at a
+    time (all requests still go through the client's limiter); each
+    meter's readings are streamed page by page into its Parquet file, so
+    memory stays at about one page per meter in flight. Parquet encoding
+    runs off the event loop.
+
+    ``checkpoint.json`` lists the finished meters, so running the export
+    again only fetches the meters that are missing or failed. Records whose
+    meters could not be listed are left out of this run and recorded in the
+    checkpoint as failed; the next run lists them again. The readings
+    directory is a hive-partitioned dataset:
+
+        pl.scan_parquet("export/readings/**/*.parquet", hive_partitioning=True)
+    """
+
+    CHECKPOINT_FILE = "checkpoint.json"
+
+    def __init__(
+        self,
+        client: JSONClient,
+        path: str | os.PathLike,
+        user_id: str = "me",
+        concurrency: int = 8,
+        take: int = 1000,
+        on_meter: Callable[[dict, int], None] | None = None,
+    ):
+        self.client = client
+        self.path = Path(path)
+        self.user_id = user_id
+        self.concurrency = concurrency
+        self.take = take
+        self.on_meter = on_meter
+        self.checkpoint: dict[str, dict] = {}
+        self.failed_records: dict[str, str] = {}
+
+    def _load_checkpoint(self) -> None:
+        checkpoint_path = self.path / self.CHECKPOINT_FILE
+        if checkpoint_path.exists():
+            with open(checkpoint_path) as f:
+                state = json.load(f)
+            self.checkpoint = state["meters"]
+            self.failed_records = state.get("failed_records", {})
+
+    def _write_checkpoint(self) -> None:
+        tmp_path = self.path / f"{self.CHECKPOINT_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"meters": self.checkpoint, "failed_records": self.failed_records}, f
+            )
+        os.replace(tmp_path, self.path / self.CHECKPOINT_FILE)
+
+    async def _write_listing(self, rows: list[dict], name: str) -> None:
+        table = listing_table(rows)
+        await asyncio.to_thread(pq.write_table, table, self.path / f"{name}.parquet")
+
+    async def _export_meter(self, meter: dict) -> int:
+        meter_id = str(meter["id"])
+        directory = (
+            self.path
+            / "readings"
+            / f"record_id={meter['recordId']}"
+            / f"meter_id={meter_id}"
+        )
+        writer = MeterWriter(directory)
+        try:
+            next_row_key = None
+            while True:
+                # The JSON method, as subclasses return frames or tables
+                page = await JSONClient.get_meter_readings(
+                    self.client,
+                    meter_id=meter_id,
+                    take=self.take,
+                    nextRowKey=next_row_key,
+                )
+                readings = page.get("readings") or []
+                if readings:
+                    await asyncio.to_thread(writer.write, readings_table(readings))
+                next_row_key = page.get("nextRowKey")
+                if not readings or not next_row_key:
+                    break
+            await asyncio.to_thread(writer.commit)
+        except BaseException:
+            await asyncio.to_thread(writer.abort)
+            raise
+        self.checkpoint[meter_id] = {"rows": writer.rows, "parts": writer.parts}
+        self._write_checkpoint()
+        if self.on_meter is not None:
+            self.on_meter(meter, writer.rows)
+        return writer.rows
+
+    async def run(self) -> ExportSummary:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._load_checkpoint()
+        summary = ExportSummary()
+
+        records = await self.client.get_member_records(user_id=self.user_id, raw=True)
+        record_ids = [Record.id_of(r) for r in records]
+        listings = await gather_bounded(
+            lambda r: self.client.get_record_meters(record_id=r, raw=True),
+            record_ids,
+            concurrency=self.concurrency,
+        )
+        meters = []
+        self.failed_records = {}
+        for record_id, (record_meters, error) in zip(record_ids, listings):
+            if error is not None:
+                summary.failed_records[str(record_id)] = error
+                self.failed_records[str(record_id)] = repr(error)
+                continue
+            for meter in record_meters:
+                # The record is the partition key, whatever the payload says
+                meters.append({**meter, "recordId": record_id})
+        self._write_checkpoint()
+        await self._write_listing(records, "records")
+        await self._write_listing(meters, "meters")
+        summary.records, summary.meters = len(records), len(meters)
+
+        todo = [m for m in meters if str(m["id"]) not in self.checkpoint]
+        summary.skipped = len(meters) - len(todo)
+        outcomes = await gather_bounded(
+            self._export_meter, todo, concurrency=self.concurrency
+        )
+        for meter, (rows, error) in zip(todo, outcomes):
+            if error is None:
+                summary.readings += rows
+            else:
+                summary.failed[str(meter["id"])] = error
+        return summary
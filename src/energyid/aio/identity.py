@@ -0,0 +1,83 @@
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, TypeVar
+
+from .models import Model
+
+if TYPE_CHECKING:
+    from .client import JSONClient
+
+M = TypeVar("M", bound=Model)
+
+WEAK = "weak"
+LRU = "lru"
+
+
+class IdentityMap:
+    """
+    One canonical model object per entity type and id.
+
+    ``resolve`` merges a payload into the object already known for that
+    entity, so a record listed by a group, fetched with ``get_record`` and
+    extended with ``extend_info`` is a single object holding every field
+    seen so far. Ids are compared as strings, since some endpoints return
+    them as numbers and others as text; the identifying fields keep the
+    value first seen, so ``obj.id`` does not change type between calls.
+
+    With ``retention="weak"`` objects are kept as long as something else
+    references them; with ``"lru"`` the ``maxsize`` most recently used
+    objects are kept alive.
+    """
+
+    def __init__(self, retention: str = WEAK, maxsize: int = 10_000):
+        if retention not in (WEAK, LRU):
+            raise ValueError(f"retention must be {WEAK!r} or {LRU!r}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.retention = retention
+        self.maxsize = maxsize
+        self._objects: weakref.WeakValueDictionary | OrderedDict = (
+            weakref.WeakValueDictionary() if retention == WEAK else OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @staticmethod
+    def _key(cls: type[Model], id) -> tuple[str, str]:
+        return cls.__name__, str(id)
+
+    def get(self, cls: type[M], id) -> M | None:
+        key = self._key(cls, id)
+        obj = self._objects.get(key)
+        if obj is not None and self.retention == LRU:
+            self._objects.move_to_end(key)
+        return obj
+
+    def resolve(self, cls: type[M], data: dict, client: "JSONClient") -> M:
+        """Merge ``data`` into the canonical object, creating it if needed"""
+        id = cls.id_of(data)
+        if id is None:
+            return cls(data, client=client)
+        obj = self.get(cls, id)
+        if obj is None:
+            obj = cls(data, client=client)
+            self._store(self._key(cls, id), obj)
+        elif obj is not data:
+            kept = {field: obj[field] for field in cls.ID_FIELDS if field in obj}
+            dict.update(obj, data)
+            dict.update(obj, kept)
+            # Relations prefetched for the old state may no longer match
+            obj._prefetched = None
+        return obj
+
+    def _store(self, key: tuple[str, str], obj: Model) -> None:
+        self._objects[key] = obj
+        if self.retention == LRU and len(self._objects) > self.maxsize:
+            self._objects.popitem(last=False)
+
+    def discard(self, cls: type[Model], id) -> None:
+        self._objects.pop(self._key(cls, id), None)
+
+    def clear(self) -> None:
+        self._objects.clear()
@@ -0,0 +1,157 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import JSONClient
+
+# Fields absent from a payload are indexed with these values
+DEFAULTS = {"hidden": False, "closed": False}
+
+
+class MeterInventory:
+    """
+    In-memory meter index for fast attribute queries.
+
+    Meters are indexed by ``metric``, ``unit``, ``readingType``, ``hidden``,
+    ``closed`` and ``record``. ``query`` intersects the index entries of
+    every criterion, starting from the smallest, so it never scans the whole
+    inventory:
+
+        inventory.query(metric="electricityImport", record=[1, 2], hidden=False)
+
+    A list, tuple or set as criterion matches any of its values. Criteria on
+    other fields are checked on the indexed candidates only.
+
+    ``load_records`` (re)lists the meters of some records and ``refresh``
+    reloads every known record; only the changed meters are re-indexed.
+    """
+
+    FIELDS = ("metric", "unit", "readingType", "hidden", "closed")
+
+    def __init__(self, meters: Iterable[dict] = ()):
+        self._meters: dict[str, dict] = {}
+        self._keys: dict[str, dict[str, Hashable]] = {}
+        self._index: dict[str, defaultdict[Hashable, set]] = {
+            field: defaultdict(set) for field in (*self.FIELDS, "record")
+        }
+        self.add_many(meters)
+
+    def __len__(self) -> int:
+        return len(self._meters)
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._meters.values())
+
+    def __contains__(self, meter_id: str) -> bool:
+        return meter_id in self._meters
+
+    def get(self, meter_id: str) -> dict | None:
+        return self._meters.get(meter_id)
+
+    @property
+    def record_ids(self) -> list:
+        return [r for r, meters in self._index["record"].items() if meters]
+
+    def _index_keys(self, meter: dict, record_id) -> dict[str, Hashable]:
+        keys = {field: meter.get(field, DEFAULTS.get(field)) for field in self.FIELDS}
+        keys["record"] = meter.get("recordId") if record_id is None else record_id
+        return keys
+
+    def add(self, meter: dict, record_id=None) -> None:
+        """Add or replace a meter; ``record_id`` if the payload lacks one"""
+        meter_id = meter["id"]
+        if record_id is None and meter_id in self._keys:
+            record_id = self._keys[meter_id]["record"]
+        keys = self._index_keys(meter, record_id)
+        old = self._keys.get(meter_id)
+        if old != keys:
+            if old is not None:
+                self._unindex(meter_id, old)
+            for field, key in keys.items():
+                self._index[field][key].add(meter_id)
+            self._keys[meter_id] = keys
+        self._meters[meter_id] = meter
+
+    def add_many(self, meters: Iterable[dict], record_id=None) -> None:
+        for meter in meters:
+            self.add(meter, record_id=record_id)
+
+    def remove(self, meter_id: str) -> None:
+        keys = self._keys.pop(meter_id, None)
+        if keys is not None:
+            self._unindex(meter_id, keys)
+            del self._meters[meter_id]
+
+    def _unindex(self, meter_id: str, keys: dict[str, Hashable]) -> None:
+        for field, key in keys.items():
+            ids = self._index[field][key]
+            ids.discard(meter_id)
+            if not ids:
+                del self._index[field][key]
+
+    def _candidates(self, field: str, value) -> set:
+        index = self._index[field]
+        if isinstance(value, list | tuple | set | frozenset):
+            return set().union(*(index.get(v, ()) for v in value))
+        return index.get(value, set())
+
+    def query(self, **criteria) -> list[dict]:
+        indexed = {f: v for f, v in criteria.items() if f in self._index}
+        others = {f: v for f, v in criteria.items() if f not in self._index}
+        if indexed:
+            sets = sorted((self._candidates(f, v) for f, v in indexed.items()), key=len)
+            ids = sets[0].intersection(*sets[1:])
+        else:
+            ids = self._meters
+        meters = [self._meters[i] for i in ids]
+        if others:
+            meters = [
+                m
+                for m in meters
+                if all(m.get(field) == value for field, value in others.items())
+            ]
+        return meters
+
+    def counts(self, field: str) -> dict[Hashable, int]:
+        """Number of meters per value of an indexed field"""
+        return {key: len(ids) for key, ids in self._index[field].items()}
+
+    async def load_records(self, client: "JSONClient", record_ids: Iterable) -> None:
+        """
+        List the meters of the given records concurrently and make them the
+        inventory's meters for those records: new meters are added, changed
+        ones re-indexed and meters that are gone removed.
+        """
+        record_ids = list(record_ids)
+        listings = await asyncio.gather(
+            *[client.get_record_meters(record_id=r) for r in record_ids]
+        )
+        for record_id, meters in zip(record_ids, listings):
+            current = {m["id"] for m in meters}
+            for meter_id in list(self._index["record"].get(record_id, ())):
+                if meter_id not in current:
+                    self.remove(meter_id)
+            self.add_many(meters, record_id=record_id)
+
+    async def refresh(self, client: "JSONClient") -> None:
+        """Reload the meters of every record in the inventory"""
+        await self.load_records(client, [r for r in self.record_ids if r is not None])
+
+    @classmethod
+    async def from_member(
+        cls, client: "JSONClient", user_id: str = "me"
+    ) -> "MeterInventory":
+        records = await client.get_member_records(user_id=user_id)
+        inventory = cls()
+        await inventory.load_records(client, [r.id for r in records])
+        return inventory
+
+    @classmethod
+    async def from_group(
+        cls, client: "JSONClient", group_id: str, **kwargs
+    ) -> "MeterInventory":
+        """Keyword arguments go to ``Group.get_meters`` (e.g. ``amount``)"""
+        group = await client.get_group(group_id=group_id)
+        return cls([meter async for meter in group.get_meters(**kwargs)])
@@ -0,0 +1,205 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+PENDING = "pending"
+APPLIED = "applied"
+FAILED = "failed"
+
+
+class MutationJournal:
+    """
+    Crash-safe SQLite journal of mutations and their outcomes.
+
+    ``run`` writes the intended mutation *before* sending it and its outcome
+    after, keyed by an idempotency key derived from the operation and its
+    arguments. When a job is restarted with the same journal, mutations that
+    were already applied are skipped and their stored result is returned, so
+    the job resumes where it stopped.
+
+    Mutations that were sent but never got an outcome (the process died
+    mid-request) stay ``pending`` and are sent again on the next run; check
+    ``in_doubt`` first for operations that must not be repeated.
+
+    ``run`` does its SQLite writes in a thread, so the commits don't hold up
+    the event loop, and concurrent calls with the same key share a single
+    mutation.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        # One connection, used from the loop and from worker threads
+        self._lock = threading.Lock()
+        self._running: dict[str, asyncio.Task] = {}
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mutations (
+                key TEXT PRIMARY KEY,
+                operation TEXT NOT NULL,
+                arguments TEXT NOT NULL,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    @staticmethod
+    def make_key(operation: str, **arguments) -> str:
+        payload = json.dumps([operation, arguments], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def status(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status FROM mutations WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _result(self, key: str):
+        with self._lock:
+            (result,) = self._db.execute(
+                "SELECT result FROM mutations WHERE key = ?", (key,)
+            ).fetchone()
+        return None if result is None else json.loads(result)
+
+    def record_intent(self, key: str, operation: str, arguments: dict) -> None:
+        with self._lock:
+            self._write(
+                """
+                INSERT INTO mutations (key, operation, arguments, status,
+                                       attempts, updated_at)
+                VALUES (?, ?, ?, ?, 1, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    status = excluded.status,
+                    error = NULL,
+                    attempts = attempts + 1,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    key,
+                    operation,
+                    json.dumps(arguments, sort_keys=True, default=str),
+                    PENDING,
+                    time.time(),
+                ),
+            )
+
+    def record_outcome(
+        self, key: str, result=None, error: BaseException | None = None
+    ) -> None:
+        with self._lock:
+            self._write(
+                "UPDATE mutations SET status = ?, result = ?, error = ?, "
+                "updated_at = ? WHERE key = ?",
+                (
+                    APPLIED if error is None else FAILED,
+                    None if result is None else json.dumps(result, default=str),
+                    None if error is None else repr(error),
+                    time.time(),
+                    key,
+                ),
+            )
+
+    def _write(self, sql: str, params: tuple) -> None:
+        self._db.execute(sql, params)
+        self._db.commit()
+
+    async def run(
+        self,
+        func: Callable[..., Awaitable],
+        operation: str | None = None,
+        idempotency_key: str | None = None,
+        **arguments,
+    ):
+        """
+        Apply ``func(**arguments)`` at most once per idempotency key, which is
+        derived from the operation (by default the function name) and the
+        arguments unless given. Failed mutations are retried on the next
+        call; the exception is re-raised. A call with the key of a mutation
+        that is still running waits for that one and shares its outcome.
+
+            record = await journal.run(client.create_record, display_name=...)
+        """
+        if operation is None:
+            operation = func.__name__
+        key = idempotency_key
+        if key is None:
+            key = self.make_key(operation, **arguments)
+        running = self._running.get(key)
+        if running is not None:
+            # Cancelling this caller must not cancel the other one's mutation
+            return await asyncio.shield(running)
+        task = asyncio.ensure_future(self._apply(key, operation, func, arguments))
+        self._running[key] = task
+        task.add_done_callback(lambda _: self._running.pop(key, None))
+        return await task
+
+    async def _apply(
+        self, key: str, operation: str, func: Callable[..., Awaitable], arguments
+    ):
+        if await asyncio.to_thread(self.status, key) == APPLIED:
+            return await asyncio.to_thread(self._result, key)
+        await asyncio.to_thread(self.record_intent, key, operation, arguments)
+        try:
+            result = await func(**arguments)
+        except Exception as e:
+            await asyncio.to_thread(self.record_outcome, key, error=e)
+            raise
+        await asyncio.to_thread(self.record_outcome, key, result=result)
+        return result
+
+    def entries(self, status: str | None = None) -> list[dict]:
+        query = (
+            "SELECT key, operation, arguments, status, error, attempts FROM mutations"
+        )
+        params = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY rowid", params).fetchall()
+        return [
+            {
+                "key": key,
+                "operation": operation,
+                "arguments": json.loads(arguments),
+                "status": status,
+                "error": error,
+                "attempts": attempts,
+            }
+            for key, operation, arguments, status, error, attempts in rows
+        ]
+
+    def in_doubt(self) -> list[dict]:
+        """Mutations that were sent without a recorded outcome"""
+        return self.entries(status=PENDING)
+
+    def failed(self) -> list[dict]:
+        return self.entries(status=FAILED)
+
+    def summary(self) -> dict[str, int]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM mutations GROUP BY status"
+            ).fetchall()
+        return dict(rows)
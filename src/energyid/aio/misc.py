@@ -1,5 +1,5 @@
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Iterable
 
 from energyid.misc import skip_tops
 
@@ -20,3 +20,32 @@ async def handle_skip_take_limit(
                 yield element
         else:
             break
+
+
+async def gather_bounded(
+    func: Callable[..., Awaitable],
+    items: Iterable,
+    concurrency: int = 10,
+    on_done: Callable | None = None,
+) -> list[tuple[object, BaseException | None]]:
+    """
+    Run ``func(item)`` for every item with at most ``concurrency`` running at
+    once. Returns ``(result, error)`` per item, in input order; exceptions are
+    captured instead of cancelling the other calls. ``on_done(index, result,
+    error)`` is called as each item finishes.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(index, item):
+        async with semaphore:
+            try:
+                outcome = await func(item), None
+            except Exception as e:
+                outcome = None, e
+        if on_done is not None:
+            on_done(index, *outcome)
+        return outcome
+
+    return list(await asyncio.gather(*[run(i, item) for i, item in enumerate(items)]))
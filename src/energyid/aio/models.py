@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 from json import JSONDecodeError
 
@@ -8,20 +10,62 @@ if TYPE_CHECKING:
 
 
 class Model(dict):
+    """
+    API object as a dict, bound to the client that fetched it.
+    Models have no instance ``__dict__``, which keeps large listings small;
+    pass ``raw=True`` to the listing methods to get plain dicts instead.
+    """
+
+    __slots__ = ("client", "_prefetched", "__weakref__")
+
+    # Related objects that ``ModelList.prefetch`` can fetch, by name
+    RELATIONS: dict[str, Callable[["Model"], Awaitable]] = {}
+    # Fields identifying the object, kept as first seen when payloads merge
+    ID_FIELDS: tuple[str, ...] = ("id",)
+
     def __init__(self, *args, client=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.client: "JSONClient" = client
+        self._prefetched: dict | None = None
+
+    def prefetched(self, relation: str):
+        """
+        Result of an earlier ``prefetch`` of ``relation``, or None if there
+        is none or the client has sent a mutation since it started.
+        """
+        if self._prefetched is None or relation not in self._prefetched:
+            return None
+        mutations, result = self._prefetched[relation]
+        if mutations != self.client._mutations:
+            return None
+        return result
 
     @property
     def id(self) -> str | int:
         return self["id"]
 
+    @classmethod
+    def id_of(cls, data: dict) -> str | int | None:
+        """Id of a payload of this type, without wrapping it"""
+        return data.get("id")
+
 
 class Member(Model):
+    __slots__ = ()
+
+    RELATIONS = {
+        "groups": lambda m: m.client.get_member_groups(user_id=m.id),
+        "records": lambda m: m.client.get_member_records(user_id=m.id),
+    }
+
     async def get_groups(self, filter="all") -> list["Group"]:
+        if filter == "all" and (groups := self.prefetched("groups")) is not None:
+            return groups
         return await self.client.get_member_groups(user_id=self.id, filter=filter)
 
     async def get_records(self) -> list["Record"]:
+        if (records := self.prefetched("records")) is not None:
+            return records
         return await self.client.get_member_records(user_id=self.id)
 
     async def get_limits(self) -> list[dict]:
@@ -44,6 +88,8 @@ class Member(Model):
 
 
 class Meter(Model):
+    __slots__ = ()
+
     async def create_reading(self, timestamp: str, value: int | float) -> dict:
         return await self.client.create_meter_reading(
             meter_id=self.id, timestamp=timestamp, value=value
@@ -96,6 +142,14 @@ class Meter(Model):
 
 
 class Record(Model):
+    __slots__ = ()
+
+    RELATIONS = {
+        "meters": lambda r: r.client.get_record_meters(record_id=r.id),
+        "groups": lambda r: r.client.get_record_groups(record_id=r.id),
+    }
+    ID_FIELDS = ("id", "recordId")
+
     @property
     def id(self) -> str | int:
         try:
@@ -103,6 +157,10 @@ class Record(Model):
         except KeyError:
             return self["recordId"]
 
+    @classmethod
+    def id_of(cls, data: dict) -> str | int | None:
+        return data.get("id", data.get("recordId"))
+
     @property
     def timezone(self) -> str:
         return self["timeZone"]
@@ -116,9 +174,13 @@ class Record(Model):
         dict.update(self, record)
 
     async def get_meters(self, **kwargs) -> list[Meter]:
+        if not kwargs and (meters := self.prefetched("meters")) is not None:
+            return meters
         return await self.client.get_record_meters(record_id=self.id, **kwargs)
 
     async def get_groups(self) -> list["Group"]:
+        if (groups := self.prefetched("groups")) is not None:
+            return groups
         return await self.client.get_record_groups(record_id=self.id)
 
     async def get_data(self, name: str, start: str, end: str, **kwargs) -> dict:
@@ -185,6 +247,8 @@ class Record(Model):
 
 
 class Group(Model):
+    __slots__ = ()
+
     async def get_records(self, amount: int | None = None, chunk_size=200, **kwargs):
         if amount is None:
             amount = self.get("recordCount")
@@ -250,5 +314,39 @@ class Group(Model):
 
 
 class Organization(Model):
+    __slots__ = ()
+
     async def get_groups(self, lang: str | None = None) -> list[Group]:
         return await self.client.get_organization_groups(org_id=self.id, lang=lang)
+
+
+class ModelList(list):
+    """List of models returned by the listing methods"""
+
+    async def prefetch(self, *relations: str) -> "ModelList":
+        """
+        Fetch related objects of every item at once, e.g.
+        ``await records.prefetch("meters", "groups")``. The requests run
+        concurrently under the client's limiter; afterwards
+        ``record.get_meters()`` and ``record.get_groups()`` return the
+        prefetched results without a request, until the client sends its
+        next mutation. Returns the list itself.
+        """
+        calls = []
+        for item in self:
+            for relation in relations:
+                if relation not in item.RELATIONS:
+                    raise ValueError(
+                        f"{type(item).__name__} has no relation {relation!r}"
+                    )
+                calls.append((item, relation))
+        # A mutation sent while the requests run makes the results stale
+        mutations = [item.client._mutations for item, _ in calls]
+        results = await asyncio.gather(
+            *[item.RELATIONS[relation](item) for item, relation in calls]
+        )
+        for (item, relation), n, result in zip(calls, mutations, results):
+            if item._prefetched is None:
+                item._prefetched = {}
+            item._prefetched[relation] = (n, result)
+        return self
@@ -0,0 +1,151 @@
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .journal import MutationJournal
+
+if TYPE_CHECKING:
+    from .client import JSONClient
+
+
+@dataclass
+class ReadingResult:
+    meter_id: str
+    timestamp: str
+    value: int | float
+    response: dict | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MeterReadingUploader:
+    """
+    Buffered, concurrent uploader for meter readings.
+
+    ``put`` queues a reading and only blocks when ``max_pending`` readings are
+    waiting, which pushes back on fast producers. A reading for a meter and
+    timestamp that is still waiting is replaced rather than sent twice.
+    ``concurrency`` workers send the readings; every request still goes
+    through the client's request limiter.
+
+    Failed readings are collected in ``errors``; pass ``on_result`` to see
+    every outcome. Exceptions raised by ``on_result`` don't stop the upload;
+    they are collected in ``callback_errors``. Use as an async context
+    manager, or call ``close`` to wait for everything to be sent.
+
+    With a ``journal``, every reading is recorded before and after it is
+    sent, and readings applied by an earlier run are not sent again.
+    """
+
+    def __init__(
+        self,
+        client: "JSONClient",
+        concurrency: int = 10,
+        max_pending: int = 1000,
+        on_result: Callable[[ReadingResult], None] | None = None,
+        journal: MutationJournal | None = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        self.client = client
+        self._concurrency = concurrency
+        self._max_pending = max_pending
+        self._on_result = on_result
+        self._journal = journal
+        self._queue: asyncio.Queue | None = None
+        self._pending: dict[tuple[str, str], int | float] = {}
+        self._workers: list[asyncio.Task] = []
+        self._closed = False
+        self.sent = 0
+        self.deduplicated = 0
+        self.errors: list[ReadingResult] = []
+        self.callback_errors: list[Exception] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_pending)
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self._concurrency)
+            ]
+
+    async def put(self, meter_id: str, timestamp: str, value: int | float) -> None:
+        if self._closed:
+            raise RuntimeError("Uploader is closed")
+        self._start()
+        key = (meter_id, timestamp)
+        if key in self._pending:
+            self._pending[key] = value
+            self.deduplicated += 1
+            return
+        # Registered before waiting for room, so a duplicate put meanwhile
+        # replaces the value instead of queueing the key twice
+        self._pending[key] = value
+        try:
+            await self._queue.put(key)
+        except asyncio.CancelledError:
+            # Never queued, so a later put for the key must queue it again
+            self._pending.pop(key, None)
+            raise
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            value = self._pending.pop(key, None)
+            try:
+                await self._send(*key, value)
+            except Exception as e:
+                # A dead worker would leave flush() waiting forever
+                self.errors.append(ReadingResult(*key, value=value, error=e))
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, meter_id: str, timestamp: str, value: int | float) -> None:
+        result = ReadingResult(meter_id=meter_id, timestamp=timestamp, value=value)
+        try:
+            if self._journal is None:
+                result.response = await self.client.create_meter_reading(
+                    meter_id=meter_id, value=value, timestamp=timestamp
+                )
+            else:
+                result.response = await self._journal.run(
+                    self.client.create_meter_reading,
+                    operation="create_meter_reading",
+                    meter_id=meter_id,
+                    value=value,
+                    timestamp=timestamp,
+                )
+            self.sent += 1
+        except Exception as e:
+            result.error = e
+            self.errors.append(result)
+        if self._on_result is not None:
+            try:
+                self._on_result(result)
+            except Exception as e:
+                self.callback_errors.append(e)
+
+    async def flush(self) -> None:
+        """Wait until every queued reading has been sent"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush, then stop the workers. Further ``put`` calls raise."""
+        self._closed = True
+        await self.flush()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
@@ -0,0 +1,169 @@
+import fnmatch
+import json
+import os
+import threading
+import zipfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+import pandas as pd
+
+LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+
+class MemberArchive:
+    """
+    Read a member export archive (see ``download_member_archive``) without
+    extracting it.
+
+    Entries are decompressed while they are read: ``iter_chunks`` yields a
+    CSV or JSON-lines entry in DataFrames of ``chunksize`` rows, so an entry
+    never has to fit in memory or on disk. ``read_many`` decompresses and
+    parses several entries in parallel threads (zlib and the CSV parser run
+    without the GIL), each with its own handle on the zip file. Those handles
+    are closed when ``read_many`` is done.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._local = threading.local()
+        self._handles: dict[threading.Thread, zipfile.ZipFile] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self._zip.close()
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    def _close_finished(self) -> None:
+        """Close the handles of threads that have exited"""
+        with self._lock:
+            for thread in [t for t in self._handles if not t.is_alive()]:
+                self._handles.pop(thread).close()
+
+    def entries(self) -> list[zipfile.ZipInfo]:
+        return [info for info in self._zip.infolist() if not info.is_dir()]
+
+    def names(self, pattern: str | None = None) -> list[str]:
+        """Entry names, optionally filtered by a glob such as ``"*.csv"``"""
+        names = [info.filename for info in self.entries()]
+        if pattern is not None:
+            names = fnmatch.filter(names, pattern)
+        return names
+
+    def summary(self) -> pd.DataFrame:
+        """Size and compressed size of every entry"""
+        return pd.DataFrame(
+            [
+                {
+                    "name": info.filename,
+                    "size": info.file_size,
+                    "compressed_size": info.compress_size,
+                }
+                for info in self.entries()
+            ],
+            columns=["name", "size", "compressed_size"],
+        )
+
+    def _handle(self) -> zipfile.ZipFile:
+        # One ZipFile per thread, so parallel reads don't share a file position
+        if threading.current_thread() is threading.main_thread():
+            return self._zip
+        handle = getattr(self._local, "zip", None)
+        if handle is None:
+            handle = self._local.zip = zipfile.ZipFile(self.path)
+            with self._lock:
+                self._handles[threading.current_thread()] = handle
+        return handle
+
+    def open(self, name: str) -> IO[bytes]:
+        """Binary stream of an entry, decompressed as it is read"""
+        return self._handle().open(name)
+
+    def iter_chunks(
+        self, name: str, chunksize: int = 100_000, **kwargs
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a ``.csv``, ``.jsonl``/``.ndjson`` or ``.json`` entry as
+        DataFrames. CSV and JSON lines come in chunks of ``chunksize`` rows;
+        a JSON document is parsed at once and flattened with
+        ``pd.json_normalize``. Keyword arguments go to the pandas reader.
+        """
+        lower = name.lower()
+        with self.open(name) as f:
+            if lower.endswith(".csv"):
+                yield from pd.read_csv(f, chunksize=chunksize, **kwargs)
+            elif lower.endswith(LINES_SUFFIXES):
+                yield from pd.read_json(f, lines=True, chunksize=chunksize, **kwargs)
+            elif lower.endswith(".json"):
+                yield pd.json_normalize(json.load(f), **kwargs)
+            else:
+                raise ValueError(f"Don't know how to parse {name}")
+
+    def read(self, name: str, **kwargs) -> pd.DataFrame:
+        chunks = list(self.iter_chunks(name, **kwargs))
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def read_arrow(self, name: str, **kwargs):
+        """
+        Read a ``.csv`` or JSON-lines entry into an Arrow table (needs
+        pyarrow). Keyword arguments go to the pyarrow reader.
+        """
+        import pyarrow.csv
+        import pyarrow.json
+
+        lower = name.lower()
+        with self.open(name) as f:
+            if lower.endswith(".csv"):
+                return pyarrow.csv.read_csv(f, **kwargs)
+            if lower.endswith(LINES_SUFFIXES):
+                return pyarrow.json.read_json(f, **kwargs)
+        raise ValueError(f"Don't know how to read {name} into Arrow")
+
+    def read_many(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int = 4,
+        arrow: bool = False,
+        **kwargs,
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Read several entries (all CSV and JSON entries by default) in
+        ``max_workers`` threads, yielding ``(name, frame)`` in input order.
+        At most ``2 * max_workers`` parsed entries wait to be consumed.
+        With ``arrow=True`` entries are read with ``read_arrow``.
+        """
+        if names is None:
+            names = [
+                n
+                for n in self.names()
+                if n.lower().endswith((".csv", ".json", *LINES_SUFFIXES))
+            ]
+        read = self.read_arrow if arrow else self.read
+        pending = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for name in names:
+                    pending.append((name, pool.submit(read, name, **kwargs)))
+                    if len(pending) >= 2 * max_workers:
+                        name, future = pending.popleft()
+                        yield name, future.result()
+                while pending:
+                    name, future = pending.popleft()
+                    yield name, future.result()
+        finally:
+            # The pool's threads have been joined; their handles are unused
+            self._close_finished()
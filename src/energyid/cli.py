@@ -0,0 +1,377 @@
+"""
+``energyid`` command line: bulk export, group harvest, meter backfill and
+readings import.
+
+    energyid --api-key KEY export ./export --concurrency 8
+    energyid harvest GROUP_ID --metric electricityImport --start 2024-01-01 ...
+    energyid backfill METER_ID ... --store ./cache --start 2020-01-01
+    energyid import readings.csv --meter-column meter_id --journal import.db
+
+The API key can also come from ``ENERGYID_API_KEY``. Every command prints a
+JSON summary of the run on stdout (or to ``--summary``), and shows its
+progress with throughput and ETA on stderr.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import pandas as pd
+
+from .aio import JSONClient, MutationJournal, PandasClient
+from .aio.clients.data_helpers import METER_DATA_SPANS
+from .store import ReadingsStore
+
+
+class Progress:
+    """Single updating stderr line with counts, throughput and ETA"""
+
+    def __init__(
+        self,
+        label: str,
+        total: int | None = None,
+        unit: str = "items",
+        enabled: bool = True,
+        interval: float = 0.5,
+        stream=None,
+    ):
+        self.label = label
+        self.total = total
+        self.unit = unit
+        self.enabled = enabled
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.done = 0
+        self.started = time.monotonic()
+        self._shown = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def line(self) -> str:
+        rate = self.done / self.elapsed if self.elapsed > 0 else 0.0
+        text = f"{self.label}: {self.done}"
+        if self.total is not None:
+            text += f"/{self.total}"
+        text += f" {self.unit}, {rate:.1f}/s"
+        if self.total is not None and rate > 0:
+            remaining = max(self.total - self.done, 0) / rate
+            text += f", ETA {time.strftime('%H:%M:%S', time.gmtime(remaining))}"
+        return text
+
+    def update(self, n: int = 1) -> None:
+        self.done += n
+        now = time.monotonic()
+        if self.enabled and now - self._shown >= self.interval:
+            self._shown = now
+            self.stream.write("\r" + self.line())
+            self.stream.flush()
+
+    def close(self) -> None:
+        if self.enabled:
+            self.stream.write("\r" + self.line() + "\n")
+            self.stream.flush()
+
+
+async def _export(client: JSONClient, args, progress: Callable) -> dict:
+    from .aio.export import AccountExport
+
+    bar = progress("meters", unit="meters")
+    export = AccountExport(
+        client,
+        args.directory,
+        user_id=args.user_id,
+        concurrency=args.concurrency,
+        take=args.take,
+        on_meter=lambda meter, rows: bar.update(),
+    )
+    summary = await export.run()
+    bar.close()
+    return {
+        "records": summary.records,
+        "meters": summary.meters,
+        "readings": summary.readings,
+        "skipped": summary.skipped,
+        "failed": {k: repr(v) for k, v in summary.failed.items()},
+        "failed_records": {k: repr(v) for k, v in summary.failed_records.items()},
+    }
+
+
+async def _harvest(client: PandasClient, args, progress: Callable) -> dict:
+    bar = progress("requests", unit="requests")
+
+    def on_progress(completed: int, total: int) -> None:
+        bar.total = total
+        bar.update()
+
+    cube = await client.get_group_data(
+        group_id=args.group_id,
+        names=args.metric,
+        start=args.start,
+        end=args.end,
+        interval=args.interval,
+        on_progress=on_progress,
+    )
+    bar.close()
+    frames = []
+    for metric in cube.metrics:
+        frame = cube.metric(metric).rename_axis(index="timestamp", columns="record")
+        frame = frame.stack().rename("value").reset_index()
+        frame.insert(2, "metric", metric)
+        frames.append(frame)
+    columns = ["timestamp", "record", "metric", "value"]
+    data = (
+        pd.concat(frames, ignore_index=True)
+        if frames
+        else pd.DataFrame(columns=columns)
+    )
+    output = Path(args.output)
+    if output.suffix == ".parquet":
+        data.to_parquet(output, index=False)
+    else:
+        data.to_csv(output, index=False)
+    return {
+        "records": len(cube.record_ids),
+        "metrics": cube.metrics,
+        "timestamps": len(cube.timestamps),
+        "rows": len(data),
+        "output": str(output),
+    }
+
+
+def _utc(value: str | pd.Timestamp) -> pd.Timestamp:
+    """Timestamp in UTC; naive times are taken as UTC"""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tz is None else ts.tz_convert("UTC")
+
+
+async def _backfill(client: PandasClient, args, progress: Callable) -> dict:
+    store = ReadingsStore(args.store)
+    bar = progress("points", unit="points")
+    written, failed = {}, {}
+    # Without an end the API returns a single unchunked response
+    end = _utc(args.end if args.end is not None else pd.Timestamp.now(tz="UTC"))
+
+    async def backfill(meter_id: str) -> None:
+        if meter_id in store and store.length(meter_id):
+            # Continue from the last stored point
+            start = pd.Timestamp(int(store.timestamps(meter_id)[-1]), tz="UTC")
+        elif args.start is not None:
+            start = _utc(args.start)
+        else:
+            raise ValueError("not in the store yet, --start is required")
+        written[meter_id] = 0
+        async for chunk in client.iter_meter_data(
+            meter_id=meter_id,
+            start=start,
+            end=end,
+            interval=args.interval,
+            buffer=args.buffer,
+        ):
+            n = store.append(meter_id, chunk)
+            written[meter_id] += n
+            bar.update(n)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(meter_id: str) -> None:
+        async with semaphore:
+            try:
+                await backfill(meter_id)
+            except Exception as e:
+                failed[meter_id] = repr(e)
+
+    await asyncio.gather(*[bounded(m) for m in args.meter_id])
+    bar.close()
+    return {"written": written, "failed": failed, "store": str(args.store)}
+
+
+async def _import(client: PandasClient, args, progress: Callable) -> dict:
+    data = pd.read_csv(args.file)
+    data[args.timestamp_column] = pd.to_datetime(
+        data[args.timestamp_column], utc=args.utc, format="ISO8601"
+    )
+    if args.meter_id is not None:
+        groups = [(args.meter_id, data)]
+    else:
+        groups = list(data.groupby(args.meter_column, sort=False))
+
+    bar = progress("readings", total=len(data), unit="readings")
+    journal = MutationJournal(args.journal) if args.journal else None
+    counts, failed = {}, {}
+    try:
+        for meter_id, frame in groups:
+            ts = frame.set_index(args.timestamp_column)[args.value_column]
+            try:
+                result = await client.upload_readings(
+                    str(meter_id),
+                    ts,
+                    cumulative=args.cumulative,
+                    concurrency=args.concurrency,
+                    max_pending=args.max_pending,
+                    journal=journal,
+                )
+            except ValueError as e:
+                failed[str(meter_id)] = str(e)
+                bar.update(len(ts))
+                continue
+            counts[str(meter_id)] = result["status"].value_counts().to_dict()
+            if n := counts[str(meter_id)].get("failed"):
+                failed[str(meter_id)] = f"{n} readings failed"
+            bar.update(len(ts))
+    finally:
+        if journal is not None:
+            journal.close()
+    bar.close()
+    return {"meters": counts, "failed": failed}
+
+
+COMMANDS = {
+    "export": _export,
+    "harvest": _harvest,
+    "backfill": _backfill,
+    "import": _import,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="energyid", description="Bulk jobs against the EnergyID API"
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("ENERGYID_API_KEY"),
+        help="API key (default: $ENERGYID_API_KEY)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=10,
+        help="requests in flight at once (default: 10)",
+    )
+    parser.add_argument(
+        "--requests-per-window",
+        type=int,
+        default=20,
+        help="requests started per rate window (default: 20)",
+    )
+    parser.add_argument(
+        "--rate-window",
+        type=float,
+        default=1.0,
+        help="length of the rate window in seconds (default: 1)",
+    )
+    parser.add_argument(
+        "--summary",
+        default="-",
+        help="where to write the JSON run summary (default: stdout)",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="don't show progress on stderr"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser(
+        "export", help="export an account's records, meters and readings to Parquet"
+    )
+    export.add_argument("directory", help="output directory (resumable)")
+    export.add_argument("--user-id", default="me")
+    export.add_argument(
+        "--concurrency", type=int, default=8, help="meters exported at once"
+    )
+    export.add_argument(
+        "--take", type=int, default=1000, help="readings per page request"
+    )
+
+    harvest = commands.add_parser(
+        "harvest", help="record data of a whole group to CSV or Parquet"
+    )
+    harvest.add_argument("group_id")
+    harvest.add_argument("--metric", action="append", required=True)
+    harvest.add_argument("--start", required=True)
+    harvest.add_argument("--end", required=True)
+    harvest.add_argument("--interval", default="day")
+    harvest.add_argument("--output", required=True, help="a .csv or .parquet file")
+
+    backfill = commands.add_parser(
+        "backfill", help="fetch meter data into a local ReadingsStore"
+    )
+    backfill.add_argument("meter_id", nargs="+")
+    backfill.add_argument("--store", required=True, help="cache directory")
+    backfill.add_argument("--start", help="ignored for meters already in the store")
+    backfill.add_argument("--end", help="default: now")
+    backfill.add_argument(
+        "--interval",
+        default="P1D",
+        choices=list(METER_DATA_SPANS),
+        help="resolution of the stored data (default: P1D)",
+    )
+    backfill.add_argument(
+        "--buffer", type=int, default=4, help="chunks requested ahead per meter"
+    )
+    backfill.add_argument(
+        "--concurrency", type=int, default=4, help="meters backfilled at once"
+    )
+
+    upload = commands.add_parser("import", help="upload readings from a CSV file")
+    upload.add_argument("file")
+    meter = upload.add_mutually_exclusive_group(required=True)
+    meter.add_argument("--meter-id", help="all rows belong to this meter")
+    meter.add_argument("--meter-column", help="column with the meter id of each row")
+    upload.add_argument("--timestamp-column", default="timestamp")
+    upload.add_argument("--value-column", default="value")
+    upload.add_argument(
+        "--utc",
+        action="store_true",
+        help="read timestamps without an offset as UTC",
+    )
+    upload.add_argument("--cumulative", action="store_true")
+    upload.add_argument("--concurrency", type=int, default=10)
+    upload.add_argument(
+        "--max-pending", type=int, default=1000, help="readings buffered per meter"
+    )
+    upload.add_argument("--journal", help="SQLite journal that makes reruns resume")
+    return parser
+
+
+async def run(args: argparse.Namespace) -> dict:
+    def progress(label: str, total: int | None = None, unit: str = "items"):
+        return Progress(label, total=total, unit=unit, enabled=not args.quiet)
+
+    started = time.monotonic()
+    async with PandasClient(
+        api_key=args.api_key,
+        max_concurrency=args.max_concurrency,
+        max_requests_per_window=args.requests_per_window,
+        rate_limit_window_seconds=args.rate_window,
+    ) as client:
+        result = await COMMANDS[args.command](client, args, progress)
+    return {
+        "command": args.command,
+        "elapsed_seconds": round(time.monotonic() - started, 3),
+        **result,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.api_key is None:
+        parser.error("an API key is required (--api-key or $ENERGYID_API_KEY)")
+    summary = asyncio.run(run(args))
+    text = json.dumps(summary, indent=2, default=str)
+    if args.summary == "-":
+        print(text)
+    else:
+        Path(args.summary).write_text(text + "\n")
+    return 1 if summary.get("failed") or summary.get("failed_records") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+class RecordDataCube:
+    """
+    Dense records x timestamps x metrics array of record data.
+
+    Timestamps are local wall-clock times (tz-naive) by default: every
+    record's data is converted to its own timezone once when the cube is
+    built, so daily and monthly buckets of records in different timezones
+    line up. Sub-daily data that crosses a DST fall-back needs a UTC index
+    instead (``local_time=False`` in ``from_series``).
+    Missing points are NaN.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        record_ids: list,
+        timestamps: pd.DatetimeIndex,
+        metrics: list[str],
+        timezones: dict | None = None,
+    ):
+        if values.shape != (len(record_ids), len(timestamps), len(metrics)):
+            raise ValueError(
+                f"values has shape {values.shape}, expected "
+                f"{(len(record_ids), len(timestamps), len(metrics))}"
+            )
+        self.values = values
+        self.record_ids = list(record_ids)
+        self.timestamps = timestamps
+        self.metrics = list(metrics)
+        self.timezones = timezones or {}
+        self._record_pos = {r: i for i, r in enumerate(self.record_ids)}
+        self._metric_pos = {m: i for i, m in enumerate(self.metrics)}
+
+    @classmethod
+    def from_series(
+        cls,
+        series: Iterable[tuple[object, str, pd.Series]],
+        timezones: dict | None = None,
+        local_time: bool = True,
+    ) -> "RecordDataCube":
+        """
+        Build a cube from ``(record_id, metric, series)`` triples.
+
+        With ``local_time``, series with a tz-aware index are converted to
+        the record's timezone from ``timezones`` (UTC if unknown) before the
+        tz is dropped; a ValueError is raised if that would merge points of
+        a series, as the repeated hour of a DST fall-back does for sub-daily
+        data. With ``local_time=False`` the cube has a tz-aware UTC index
+        (tz-naive series are taken as UTC).
+        """
+        timezones = timezones or {}
+        record_ids, metrics = {}, {}
+        utc, local, values, record_idx, metric_idx = [], [], [], [], []
+        keys = []
+        for record_id, metric, ts in series:
+            r = record_ids.setdefault(record_id, len(record_ids))
+            m = metrics.setdefault(metric, len(metrics))
+            if ts.empty:
+                continue
+            index = pd.DatetimeIndex(ts.index)
+            if index.tz is None:
+                local.append(index.as_unit("ns").asi8)
+                utc.append(local[-1])
+            else:
+                utc.append(index.tz_convert("UTC").as_unit("ns").asi8)
+                index = index.tz_convert(timezones.get(record_id, "UTC"))
+                local.append(index.tz_localize(None).as_unit("ns").asi8)
+            keys.append((record_id, metric))
+            values.append(np.asarray(ts.to_numpy(), dtype="float64"))
+            record_idx.append(np.full(len(ts), r, dtype="intp"))
+            metric_idx.append(np.full(len(ts), m, dtype="intp"))
+
+        if local_time:
+            for key, lo, u in zip(keys, local, utc):
+                if len(np.unique(lo)) != len(np.unique(u)):
+                    raise ValueError(
+                        f"local times of {key} repeat (DST fall-back), so points "
+                        "would merge; use local_time=False for a UTC index"
+                    )
+        stamps = local if local_time else utc
+
+        if stamps:
+            stamps = np.concatenate(stamps)
+            grid = np.unique(stamps)
+        else:
+            grid = np.empty(0, dtype="int64")
+
+        cube = np.full((len(record_ids), len(grid), len(metrics)), np.nan)
+        if len(grid):
+            cube[
+                np.concatenate(record_idx),
+                np.searchsorted(grid, stamps),
+                np.concatenate(metric_idx),
+            ] = np.concatenate(values)
+        timestamps = pd.DatetimeIndex(grid.view("datetime64[ns]"))
+        if not local_time:
+            timestamps = timestamps.tz_localize("UTC")
+        return cls(
+            values=cube,
+            record_ids=list(record_ids),
+            timestamps=timestamps,
+            metrics=list(metrics),
+            timezones=timezones,
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.values.shape
+
+    def metric(self, name: str) -> pd.DataFrame:
+        """Timestamps x records frame of a single metric"""
+        return pd.DataFrame(
+            self.values[:, :, self._metric_pos[name]].T,
+            index=self.timestamps,
+            columns=self.record_ids,
+        )
+
+    def record(self, record_id) -> pd.DataFrame:
+        """Timestamps x metrics frame of a single record"""
+        return pd.DataFrame(
+            self.values[self._record_pos[record_id]],
+            index=self.timestamps,
+            columns=self.metrics,
+        )
+
+    def _reduce(self, func, *args) -> pd.DataFrame:
+        return pd.DataFrame(
+            func(self.values, *args, axis=0),
+            index=self.timestamps,
+            columns=self.metrics,
+        )
+
+    def sum(self) -> pd.DataFrame:
+        """Sum over records, per timestamp and metric"""
+        return self._reduce(np.nansum)
+
+    def mean(self) -> pd.DataFrame:
+        """Mean over records, per timestamp and metric"""
+        return self._reduce(np.nanmean)
+
+    def percentile(self, q: float) -> pd.DataFrame:
+        """Percentile (0-100) over records, per timestamp and metric"""
+        return self._reduce(np.nanpercentile, q)
+
+    def totals(self) -> pd.DataFrame:
+        """Records x metrics totals over the whole period"""
+        return pd.DataFrame(
+            np.nansum(self.values, axis=1),
+            index=self.record_ids,
+            columns=self.metrics,
+        )
+
+    def normalize(self, by: pd.Series | dict | None = None) -> "RecordDataCube":
+        """
+        Divide every record by a per-record factor, e.g. floor surface or
+        number of occupants. Without ``by``, every record is divided by its
+        own total per metric, giving each record's profile over time.
+        """
+        if by is None:
+            factors = np.nansum(self.values, axis=1, keepdims=True)
+        else:
+            by = pd.Series(by, dtype="float64").reindex(self.record_ids)
+            factors = by.to_numpy()[:, None, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = self.values / factors
+        return RecordDataCube(
+            values=values,
+            record_ids=self.record_ids,
+            timestamps=self.timestamps,
+            metrics=self.metrics,
+            timezones=self.timezones,
+        )
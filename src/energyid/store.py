@@ -0,0 +1,144 @@
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class ReadingsStore:
+    """
+    Append-only on-disk store of meter series.
+
+    Every meter gets two flat files: ``<stem>.ts`` with int64 epoch
+    nanoseconds (UTC) and ``<stem>.val`` with float64 values.
+    ``index.json`` maps meter ids to their file stem.
+    Reads go through ``np.memmap``, so many processes can share one dataset
+    through the page cache without parsing anything at startup.
+
+    If a crash interrupts an append between the two files, reads only see
+    the points present in both, and the next append truncates the longer
+    file back to match.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, str] = self._load_index()
+
+    def _load_index(self) -> dict[str, str]:
+        index_path = self.path / self.INDEX_FILE
+        if not index_path.exists():
+            return {}
+        with open(index_path) as f:
+            return json.load(f)["meters"]
+
+    def _write_index(self) -> None:
+        tmp_path = self.path / f"{self.INDEX_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"meters": self._index}, f)
+        os.replace(tmp_path, self.path / self.INDEX_FILE)
+
+    def _files(self, meter_id: str) -> tuple[Path, Path]:
+        stem = self._index[meter_id]
+        return self.path / f"{stem}.ts", self.path / f"{stem}.val"
+
+    def __contains__(self, meter_id: str) -> bool:
+        return meter_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def meter_ids(self) -> list[str]:
+        return list(self._index)
+
+    def length(self, meter_id: str) -> int:
+        ts_path, val_path = self._files(meter_id)
+        return min(ts_path.stat().st_size, val_path.stat().st_size) // 8
+
+    def timestamps(self, meter_id: str) -> np.ndarray:
+        """Read-only int64 epoch-nanosecond view of a meter's timestamps"""
+        return self._memmap(meter_id, "int64", 0)
+
+    def values(self, meter_id: str) -> np.ndarray:
+        """Read-only float64 view of a meter's values"""
+        return self._memmap(meter_id, "float64", 1)
+
+    def _memmap(self, meter_id: str, dtype: str, which: int) -> np.ndarray:
+        path = self._files(meter_id)[which]
+        n = self.length(meter_id)
+        if n == 0:
+            # np.memmap refuses to map empty files
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(n,))
+
+    def append(self, meter_id: str, data: pd.Series) -> int:
+        """
+        Append a series with a DatetimeIndex to a meter.
+        Points at or before the last stored timestamp are dropped, so
+        re-appending an overlapping range is harmless.
+        Returns the number of points written.
+        """
+        index = pd.DatetimeIndex(data.index)
+        if index.tz is None:
+            index = index.tz_localize("UTC")
+        stamps = index.tz_convert("UTC").as_unit("ns").asi8
+        values = np.asarray(data.to_numpy(), dtype="float64")
+
+        if len(stamps) > 1 and not (np.diff(stamps) > 0).all():
+            order = np.argsort(stamps, kind="stable")
+            stamps, values = stamps[order], values[order]
+            keep = np.append(stamps[1:] != stamps[:-1], True)
+            stamps, values = stamps[keep], values[keep]
+
+        if meter_id in self._index:
+            n = self.length(meter_id)
+            for path in self._files(meter_id):
+                if path.stat().st_size > 8 * n:
+                    # Left over from an interrupted append
+                    os.truncate(path, 8 * n)
+            if n > 0:
+                last = self.timestamps(meter_id)[-1]
+                mask = stamps > last
+                stamps, values = stamps[mask], values[mask]
+        else:
+            self._index[meter_id] = f"m{len(self._index):06d}"
+            for path in self._files(meter_id):
+                path.touch()
+            self._write_index()
+
+        ts_path, val_path = self._files(meter_id)
+        with open(ts_path, "ab") as f:
+            f.write(np.ascontiguousarray(stamps, dtype="int64").tobytes())
+        with open(val_path, "ab") as f:
+            f.write(np.ascontiguousarray(values, dtype="float64").tobytes())
+        return len(stamps)
+
+    def get(self, meter_id: str, tz: str | None = None) -> pd.Series:
+        """
+        Return a meter as a Series backed directly by the memory map.
+
+        The index is tz-naive UTC, because localizing a DatetimeIndex always
+        copies it. Pass ``tz`` to get an aware index at the cost of that copy;
+        the values stay zero-copy either way.
+        """
+        stamps = self.timestamps(meter_id)
+        index = pd.DatetimeIndex(np.asarray(stamps).view("datetime64[ns]"), copy=False)
+        if tz is not None:
+            index = index.tz_localize("UTC").tz_convert(tz)
+        return pd.Series(
+            np.asarray(self.values(meter_id)), index=index, name=meter_id, copy=False
+        )
+
+    def to_frame(self, meter_ids: list[str] | None = None) -> pd.DataFrame:
+        """Align several meters on the union of their timestamps (copies)"""
+        if meter_ids is None:
+            meter_ids = self.meter_ids
+        return pd.concat([self.get(m) for m in meter_ids], axis=1)
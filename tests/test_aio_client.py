@@ -2,17 +2,23 @@
 
 import asyncio
 import inspect
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
+import pandas as pd
 import pytest
 
 from energyid.aio.client import (
     JSONClient as AsyncJSONClient,
     PandasClient as AsyncPandasClient,
 )
+from energyid.aio.clients.data_helpers import parse_meter_data_multiple
 from energyid.aio.clients.rate_limit import AsyncRequestLimiter
+from energyid.aio.journal import MutationJournal
+from energyid.aio.models import Record
 
 
 # ── Structural Tests ─────────────────────────────────────────
@@ -49,12 +55,15 @@ class TestAsyncClientExists:
         "close_meter",
         "edit_meter",
         "get_meter_data",
+        "get_meters_data",
         "get_meter_reading",
         "edit_meter_reading",
         "edit_meter_reading_status",
         "ignore_meter_reading",
         "delete_meter",
         "delete_meter_reading",
+        "hide_meters_where",
+        "close_meters_where",
         "get_organization",
         "get_organization_groups",
         "get_record",
@@ -74,6 +83,9 @@ class TestAsyncClientExists:
         "create_record",
         "edit_record",
         "delete_record",
+        "create_records_bulk",
+        "delete_records_where",
+        "edit_records_where",
         "get_record_definitions",
         "search_groups",
         "search_services",
@@ -82,6 +94,7 @@ class TestAsyncClientExists:
         "cancel_transfer",
         "accept_transfer",
         "decline_transfer",
+        "download_member_archive",
     ]
 
     def test_all_methods_exist(self):
@@ -226,13 +239,20 @@ class TestAsyncPandasClient:
     EXPECTED_METHODS = [
         "get_meter_readings",
         "get_meter_data",
+        "get_meters_data",
         "get_record_data",
+        "get_group_data",
+        "upload_readings",
+        "create_records_bulk",
     ]
 
     def test_all_methods_exist(self):
         for method_name in self.EXPECTED_METHODS:
             assert hasattr(AsyncPandasClient, method_name)
 
+    def test_iter_meter_data_is_async_generator(self):
+        assert inspect.isasyncgenfunction(AsyncPandasClient.iter_meter_data)
+
     def test_all_methods_are_coroutines(self):
         for method_name in self.EXPECTED_METHODS:
             method = getattr(AsyncPandasClient, method_name)
@@ -390,6 +410,208 @@ class TestAsyncFunctionalRecords:
             assert bm == {}
 
 
+class TestAsyncFunctionalRecordsBulk:
+    def setup_method(self):
+        self.client = AsyncPandasClient(api_key="test-key")
+        self.rows = pd.DataFrame(
+            {
+                "display_name": ["Home", "Office", "Shed", "Office", "Barn"],
+                "record_type": "house",
+                "city": "Gent",
+                "postal_code": "9000",
+                "country": "BE",
+                "category": ["home", "home", "home", "home", None],
+                "floor_surface": [120.0, None, 12.5, 80.0, 40.0],
+            },
+            index=list("abcde"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_create_records_bulk(self):
+        async def fake_request(method, endpoint, **kwargs):
+            if method == "GET":
+                return [{"id": 1, "displayName": "Home"}]
+            if kwargs["displayName"] == "Shed":
+                raise aiohttp.ClientError("boom")
+            return {"id": 2, **kwargs}
+
+        with patch.object(self.client, "_request", side_effect=fake_request) as req:
+            result = await self.client.create_records_bulk(self.rows)
+
+        assert result.index.tolist() == list("abcde")
+        assert result["status"].tolist() == [
+            "exists",
+            "created",
+            "failed",
+            "duplicate",
+            "invalid",
+        ]
+        assert isinstance(result.loc["b", "record"], Record)
+        assert isinstance(result.loc["c", "error"], aiohttp.ClientError)
+        assert "category" in str(result.loc["e", "error"])
+        posts = [c.kwargs for c in req.call_args_list if c.args[0] == "POST"]
+        assert len(posts) == 2
+        office = next(p for p in posts if p["displayName"] == "Office")
+        assert office["postalCode"] == "9000"
+        assert "floorSurface" not in office
+
+    @pytest.mark.asyncio
+    async def test_create_records_bulk_by_tag_with_journal(self, tmp_path):
+        rows = [
+            {
+                "displayName": f"Site {i}",
+                "recordType": "house",
+                "city": "Gent",
+                "postalCode": "9000",
+                "country": "BE",
+                "category": "home",
+                "tags": [f"site:{i}"],
+            }
+            for i in range(3)
+        ]
+
+        def site(record):
+            return next((t for t in record.get("tags", []) if t[:5] == "site:"), None)
+
+        existing = [{"id": 1, "tags": ["site:0"]}]
+        with MutationJournal(tmp_path / "journal.db") as journal:
+            for _ in range(2):
+                with patch.object(
+                    self.client, "_request", return_value={"id": 9}
+                ) as req:
+                    results = await AsyncJSONClient.create_records_bulk(
+                        self.client,
+                        rows,
+                        key=site,
+                        existing=existing,
+                        journal=journal,
+                    )
+                assert [r["key"] for r in results] == ["site:0", "site:1", "site:2"]
+                assert [r["status"] for r in results] == ["exists"] + ["created"] * 2
+            # The second run replays the journal instead of posting again
+            req.assert_not_called()
+        assert results[1]["record"].id == 9
+
+    @pytest.mark.asyncio
+    async def test_create_records_bulk_snake_case_key(self):
+        existing = [{"id": 1, "postalCode": "9000"}]
+        with patch.object(self.client, "_request", return_value={"id": 2}) as req:
+            result = await self.client.create_records_bulk(
+                self.rows, key="postal_code", existing=existing
+            )
+        assert set(result["status"]) == {"exists", "invalid"}
+        req.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_records_bulk_list_key(self):
+        rows = self.rows.iloc[:3].assign(tags=[["a"], ["b"], ["a"]])
+        existing = [{"id": 1, "tags": ["b"]}]
+        with patch.object(self.client, "_request", return_value={"id": 2}) as req:
+            result = await self.client.create_records_bulk(
+                rows, key="tags", existing=existing
+            )
+        assert result["status"].tolist() == ["created", "exists", "duplicate"]
+        assert result["key"].tolist() == [("a",), ("b",), ("a",)]
+        assert req.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_create_records_bulk_identical_rows_with_journal(self, tmp_path):
+        rows = self.rows.iloc[[1, 1, 2]]
+        with (
+            MutationJournal(tmp_path / "journal.db") as journal,
+            patch.object(self.client, "_request", return_value={"id": 2}) as req,
+        ):
+            result = await self.client.create_records_bulk(
+                rows, key=None, journal=journal
+            )
+        assert result["status"].tolist() == ["created", "duplicate", "created"]
+        assert result["key"].isna().all()
+        assert req.call_count == 2
+
+
+class TestAsyncPrefetch:
+    def setup_method(self):
+        self.client = AsyncJSONClient(api_key="test-key")
+
+    @staticmethod
+    async def fake_request(method, endpoint, **kwargs):
+        if endpoint == "members/me/records":
+            return [{"id": 1}, {"id": 2}]
+        record_id = endpoint.split("/")[1]
+        if endpoint.endswith("meters"):
+            return [{"id": f"meter-{record_id}"}]
+        return [{"id": f"group-{record_id}"}]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_meters_and_groups(self):
+        with patch.object(
+            self.client, "_request", side_effect=self.fake_request
+        ) as req:
+            records = await self.client.get_member_records()
+            assert await records.prefetch("meters", "groups") is records
+            assert req.call_count == 5
+            meters = await records[1].get_meters()
+            groups = await records[0].get_groups()
+            assert req.call_count == 5
+            # Arguments bypass the prefetched result
+            await records[1].get_meters(filter={"id": "meter-2"})
+            assert req.call_count == 6
+        assert [m.id for m in meters] == ["meter-2"]
+        assert [g.id for g in groups] == ["group-1"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_unknown_relation(self):
+        with patch.object(
+            self.client, "_request", side_effect=self.fake_request
+        ) as req:
+            records = await self.client.get_member_records()
+            with pytest.raises(ValueError, match="no relation 'readings'"):
+                await records.prefetch("meters", "readings")
+        assert req.call_count == 1
+
+    @staticmethod
+    def server(meters: list):
+        """A session whose record 1 has ``meters``; POSTs add one"""
+
+        def request(method, url, **kwargs):
+            if method == "POST":
+                meters.append(kwargs["params"]["displayName"])
+                return _mock_aiohttp_response({"id": 9})
+            if url.endswith("records/1/meters"):
+                return _mock_aiohttp_response([{"id": m} for m in meters])
+            return _mock_aiohttp_response([{"id": 1}])
+
+        return request
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stale_after_mutation(self):
+        meters = ["a"]
+        with patch.object(
+            self.client.session, "request", side_effect=self.server(meters)
+        ):
+            records = await self.client.get_member_records()
+            record = records[0]
+            await records.prefetch("meters")
+            assert [m.id for m in await record.get_meters()] == ["a"]
+            await self.client.create_meter(
+                1, "b", "electricityImport", "kWh", "counter"
+            )
+            assert [m.id for m in await record.get_meters()] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_stale_after_refetch(self):
+        client = AsyncJSONClient(api_key="test-key", identity_map="weak")
+        meters = ["a"]
+        with patch.object(client.session, "request", side_effect=self.server(meters)):
+            records = await client.get_member_records()
+            await records.prefetch("meters")
+            # Changed on the server, then listed again
+            meters.append("b")
+            (record,) = await client.get_member_records()
+            assert record is records[0]
+            assert [m.id for m in await record.get_meters()] == ["a", "b"]
+
+
 class TestAsyncRequestParsing:
     @pytest.mark.asyncio
     async def test_request_uses_lenient_json_content_type(self):
@@ -409,7 +631,8 @@ class TestAsyncRequestParsing:
             mock_resp.json.assert_awaited_once_with(content_type=None)
 
     @pytest.mark.asyncio
-    async def test_request_propagates_unauthorized(self):
+    @pytest.mark.parametrize("request_method", ["_request", "_request_bytes"])
+    async def test_request_propagates_unauthorized(self, request_method):
         client = AsyncJSONClient(api_key="test-key")
         mock_resp = MagicMock()
         mock_resp.status = 401
@@ -428,9 +651,10 @@ class TestAsyncRequestParsing:
 
         with patch.object(client.session, "request", return_value=mock_cm):
             with pytest.raises(aiohttp.ClientResponseError) as exc:
-                await client._request("GET", "groups/x/admins")
+                await getattr(client, request_method)("GET", "groups/x/admins")
             assert exc.value.status == 401
             assert "Authorization failed for this endpoint" in exc.value.message
+            assert "Detail: unauthorized" in exc.value.message
 
 
 class TestAsyncFunctionalGroups:
@@ -451,6 +675,17 @@ class TestAsyncFunctionalGroups:
             records = await self.client.get_group_records("grp1")
             assert len(records) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_group_records_raw_and_compact(self):
+        mock_cm = _mock_aiohttp_response([{"id": 1}])
+        with patch.object(self.client.session, "request", return_value=mock_cm):
+            raw = await self.client.get_group_records("grp1", raw=True)
+            records = await self.client.get_group_records("grp1")
+        assert type(raw[0]) is dict
+        assert isinstance(records[0], Record)
+        assert records[0].client is self.client
+        assert not hasattr(records[0], "__dict__")
+
     @pytest.mark.asyncio
     async def test_get_group_meters(self):
         mock_cm = _mock_aiohttp_response([{"id": "m1"}])
@@ -508,6 +743,345 @@ class TestAsyncFunctionalMeters:
             await self.client.delete_meter("m1")
 
 
+class TestAsyncFunctionalPandasMeters:
+    def setup_method(self):
+        self.client = AsyncPandasClient(api_key="test-key")
+
+    @pytest.mark.asyncio
+    async def test_get_meter_readings(self):
+        mock_cm = _mock_aiohttp_response(
+            {
+                "readings": [
+                    {"timestamp": "2024-01-02T00:00:00Z", "value": 2, "status": "VAL"},
+                    {"timestamp": "2024-01-01T00:00:00Z", "value": 1, "status": "VAL"},
+                ]
+            }
+        )
+        with patch.object(self.client.session, "request", return_value=mock_cm):
+            df = await self.client.get_meter_readings("m1")
+        assert str(df.index.tz) == "UTC"
+        assert df.index.is_monotonic_increasing
+        assert df["value"].tolist() == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_meters_data_wide_and_long(self):
+        payloads = {
+            "m1": {
+                "data": [
+                    {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0},
+                    {"timestamp": "2024-01-02T00:00:00Z", "value": 2.0},
+                ]
+            },
+            "m2": {"data": [{"timestamp": "2024-01-02T00:00:00Z", "value": 5.0}]},
+        }
+
+        def side_effect(method, url, **kwargs):
+            meter_id = url.split("/meters/")[1].split("/")[0]
+            return _mock_aiohttp_response(payloads[meter_id])
+
+        with patch.object(self.client.session, "request", side_effect=side_effect):
+            wide = await self.client.get_meters_data(["m1", "m2"])
+            long = await self.client.get_meters_data(["m1", "m2"], long=True)
+
+        assert list(wide.columns) == ["m1", "m2"]
+        assert len(wide) == 2
+        assert str(wide.index.tz) == "UTC"
+        assert wide["m2"].isna().sum() == 1
+        assert wide.loc["2024-01-02", "m2"].item() == 5.0
+        assert list(long.columns) == ["timestamp", "meter_id", "value"]
+        assert len(long) == 3
+
+    @pytest.mark.asyncio
+    async def test_iter_meter_data_bounded_and_ordered(self):
+        state = {"active": 0, "peak": 0}
+
+        async def fake_request(method, endpoint, start=None, end=None, **kwargs):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later chunks finish first
+            await asyncio.sleep(0.001 * (10 - int(start[-2:])))
+            state["active"] -= 1
+            return {"data": [{"timestamp": f"{start}T00:00:00Z", "value": 1.0}]}
+
+        with patch.object(self.client, "_request", side_effect=fake_request):
+            chunks = [
+                ts
+                async for ts in self.client.iter_meter_data(
+                    "m1",
+                    start="2024-01-01",
+                    end="2024-01-08",
+                    interval="PT5M",
+                    buffer=2,
+                )
+            ]
+
+        assert len(chunks) == 4
+        starts = [ts.index[0] for ts in chunks]
+        assert starts == sorted(starts)
+        assert state["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_iter_meter_data_deduplicates_boundaries(self):
+        async def fake_request(method, endpoint, start=None, end=None, **kwargs):
+            return {
+                "data": [
+                    {"timestamp": f"{start}T00:00:00Z", "value": 1.0},
+                    {"timestamp": f"{end}T00:00:00Z", "value": 2.0},
+                ]
+            }
+
+        with patch.object(self.client, "_request", side_effect=fake_request):
+            chunks = [
+                ts
+                async for ts in self.client.iter_meter_data(
+                    "m1", start="2024-01-01", end="2024-01-05", interval="PT5M"
+                )
+            ]
+
+        ts = pd.concat(chunks)
+        assert ts.index.is_unique
+        assert len(ts) == 3
+        # The boundary point comes from the later chunk
+        assert ts.tolist() == [1.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_compact_mode(self):
+        client = AsyncPandasClient(api_key="test-key", compact=True)
+        mock_cm = _mock_aiohttp_response(
+            {
+                "data": [
+                    {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0},
+                    {"timestamp": "2024-01-02T00:00:00Z", "value": 2.0},
+                ]
+            }
+        )
+        with patch.object(client.session, "request", return_value=mock_cm):
+            ts = await client.get_meter_data("m1")
+        assert ts.dtype == "float32"
+        assert ts.attrs["memory_saved"] == 8
+
+
+class TestAsyncPandasParseExecutor:
+    DATA = {
+        "data": [
+            {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0},
+            {"timestamp": "2024-01-02T00:00:00Z", "value": 2.0},
+        ]
+    }
+
+    @staticmethod
+    def _recording_parse(threads: list):
+        def parse(self, data, meter_id):
+            threads.append(threading.current_thread())
+            return parse_meter_data_multiple(data=data, meter_id=meter_id)
+
+        return parse
+
+    @pytest.mark.asyncio
+    async def test_parses_off_the_event_loop(self):
+        threads = []
+        client = AsyncPandasClient(api_key="test-key")
+        with (
+            patch.object(client, "_request", AsyncMock(return_value=self.DATA)),
+            patch.object(
+                AsyncPandasClient,
+                "_parse_meter_data_multiple",
+                self._recording_parse(threads),
+            ),
+        ):
+            ts = await client.get_meter_data("m1")
+        await client.close()
+        assert ts.tolist() == [1.0, 2.0]
+        assert threads[0] is not threading.main_thread()
+        assert threads[0].name.startswith("energyid-parse")
+
+    @pytest.mark.asyncio
+    async def test_inline_without_threads(self):
+        threads = []
+        client = AsyncPandasClient(api_key="test-key", parse_threads=0)
+        with (
+            patch.object(client, "_request", AsyncMock(return_value=self.DATA)),
+            patch.object(
+                AsyncPandasClient,
+                "_parse_meter_data_multiple",
+                self._recording_parse(threads),
+            ),
+        ):
+            await client.get_meter_data("m1")
+        assert threads == [threading.main_thread()]
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded(self):
+        running, peak = 0, 0
+        lock = threading.Lock()
+
+        def parse(self, data, meter_id):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return pd.Series(dtype="float64", name=meter_id)
+
+        executor = ThreadPoolExecutor(max_workers=8)
+        client = AsyncPandasClient(
+            api_key="test-key", parse_executor=executor, parse_queue=2
+        )
+        with (
+            patch.object(client, "_request", AsyncMock(return_value=self.DATA)),
+            patch.object(AsyncPandasClient, "_parse_meter_data_multiple", parse),
+        ):
+            await asyncio.gather(*[client.get_meter_data(f"m{i}") for i in range(8)])
+        await client.close()
+        assert peak == 2
+        # A caller's executor is left running
+        assert executor.submit(int).result() == 0
+        executor.shutdown()
+
+
+class TestAsyncFunctionalPandasUpload:
+    def setup_method(self):
+        self.client = AsyncPandasClient(api_key="test-key")
+        self.ts = pd.Series(
+            [1.0, 2.0, 3.0],
+            index=pd.date_range("2024-01-01", periods=3, freq="h", tz="UTC"),
+        )
+
+    @pytest.mark.asyncio
+    async def test_validation_fails_before_any_request(self):
+        ts = pd.Series(
+            [3.0, None, 1.0],
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-01", "2024-01-02"]),
+        )
+        with patch.object(self.client, "_request") as request:
+            with pytest.raises(ValueError) as exc:
+                await self.client.upload_readings("m1", ts, cumulative=True)
+        request.assert_not_called()
+        message = str(exc.value)
+        assert "timezone-naive" in message
+        assert "missing values" in message
+        assert "duplicate timestamps" in message
+        assert "decrease" in message
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_and_reports(self):
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint.endswith("latest"):
+                return {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0}
+            if kwargs["value"] == 3.0:
+                raise aiohttp.ClientError("boom")
+            return {}
+
+        with patch.object(self.client, "_request", side_effect=fake_request) as req:
+            result = await self.client.upload_readings("m1", self.ts, cumulative=True)
+
+        assert result["status"].tolist() == ["skipped", "sent", "failed"]
+        assert isinstance(result["error"].iloc[2], aiohttp.ClientError)
+        posted = [c.kwargs for c in req.call_args_list if c.args[0] == "POST"]
+        assert {p["timestamp"] for p in posted} == {
+            "2024-01-01T01:00:00Z",
+            "2024-01-01T02:00:00Z",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sub_second_timestamps(self):
+        ts = pd.Series(
+            [1.0, 2.0, 3.0],
+            index=pd.DatetimeIndex(
+                [
+                    "2024-01-01 00:00:00",
+                    "2024-01-01 00:00:00.25",
+                    "2024-01-01 00:00:01",
+                ],
+                tz="UTC",
+            ),
+        )
+
+        async def fake_request(method, endpoint, **kwargs):
+            if kwargs.get("value") == 2.0:
+                raise aiohttp.ClientError("boom")
+            return {}
+
+        with patch.object(self.client, "_request", side_effect=fake_request) as req:
+            result = await self.client.upload_readings("m1", ts, skip_existing=False)
+
+        assert result["status"].tolist() == ["sent", "failed", "sent"]
+        posted = [c.kwargs["timestamp"] for c in req.call_args_list]
+        assert sorted(posted) == [
+            "2024-01-01T00:00:00.000Z",
+            "2024-01-01T00:00:00.250Z",
+            "2024-01-01T00:00:01.000Z",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cumulative_below_latest_reading(self):
+        async def fake_request(method, endpoint, **kwargs):
+            return {"timestamp": "2023-12-31T00:00:00Z", "value": 10.0}
+
+        with patch.object(self.client, "_request", side_effect=fake_request):
+            with pytest.raises(ValueError, match="latest reading"):
+                await self.client.upload_readings("m1", self.ts, cumulative=True)
+
+
+class TestAsyncFunctionalPandasGroups:
+    def setup_method(self):
+        self.client = AsyncPandasClient(api_key="test-key")
+
+    @pytest.mark.asyncio
+    async def test_get_group_data(self):
+        def side_effect(method, url, **kwargs):
+            if url.endswith("/records"):
+                return _mock_aiohttp_response(
+                    [
+                        {"id": 1, "timeZone": "UTC"},
+                        {"id": 2, "timeZone": "Europe/Brussels"},
+                    ]
+                )
+            if url.endswith("groups/grp1"):
+                return _mock_aiohttp_response({"id": "grp1", "recordCount": 2})
+            # Daily data comes at local midnight of each record
+            offset = "+01:00" if "records/2/" in url else "Z"
+            return _mock_aiohttp_response(
+                {
+                    "value": [
+                        {
+                            "name": "x",
+                            "data": [
+                                {
+                                    "timestamp": f"2024-01-01T00:00:00{offset}",
+                                    "value": 1.0,
+                                },
+                                {
+                                    "timestamp": f"2024-01-02T00:00:00{offset}",
+                                    "value": 2.0,
+                                },
+                            ],
+                        }
+                    ]
+                }
+            )
+
+        progress = []
+        with patch.object(self.client.session, "request", side_effect=side_effect):
+            cube = await self.client.get_group_data(
+                "grp1",
+                ["electricityImport", "gasImport"],
+                "2024-01-01",
+                "2024-01-02",
+                on_progress=lambda done, total: progress.append((done, total)),
+            )
+
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert cube.record_ids == [1, 2]
+        assert cube.metrics == ["electricityImport", "gasImport"]
+        assert cube.timezones == {1: "UTC", 2: "Europe/Brussels"}
+        assert cube.shape == (2, 2, 2)
+        assert cube.timestamps[0] == pd.Timestamp("2024-01-01")
+        assert cube.sum()["gasImport"].tolist() == [2.0, 4.0]
+
+
 class TestAsyncFunctionalTransfers:
     def setup_method(self):
         self.client = AsyncJSONClient(api_key="test-key")
@@ -0,0 +1,89 @@
+"""Tests for the streaming member-archive reader."""
+
+import json
+import os
+import threading
+import zipfile
+
+import pandas as pd
+import pytest
+
+from energyid import MemberArchive
+
+
+@pytest.fixture
+def archive_path(tmp_path):
+    path = tmp_path / "archive.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("records/", "")
+        zf.writestr(
+            "readings/m1.csv",
+            "timestamp,value\n"
+            + "".join(f"2024-01-01T{h:02d}:00:00Z,{h}\n" for h in range(24)),
+        )
+        zf.writestr("readings/m2.csv", "timestamp,value\n2024-01-01T00:00:00Z,5\n")
+        zf.writestr(
+            "records.json",
+            json.dumps([{"id": 1, "address": {"city": "Gent"}}, {"id": 2}]),
+        )
+        zf.writestr("activity.jsonl", "\n".join(json.dumps({"n": i}) for i in range(5)))
+        zf.writestr("README.txt", "hello")
+    return path
+
+
+class TestMemberArchive:
+    def test_names_and_summary(self, archive_path):
+        with MemberArchive(archive_path) as archive:
+            assert archive.names("readings/*.csv") == [
+                "readings/m1.csv",
+                "readings/m2.csv",
+            ]
+            assert "records/" not in archive.names()
+            summary = archive.summary()
+        assert len(summary) == 5
+        assert (summary["size"] > 0).all()
+
+    def test_iter_chunks(self, archive_path):
+        with MemberArchive(archive_path) as archive:
+            chunks = list(archive.iter_chunks("readings/m1.csv", chunksize=10))
+            assert [len(c) for c in chunks] == [10, 10, 4]
+            lines = list(archive.iter_chunks("activity.jsonl", chunksize=2))
+            assert [len(c) for c in lines] == [2, 2, 1]
+            records = archive.read("records.json")
+            assert records["address.city"].tolist()[0] == "Gent"
+            with pytest.raises(ValueError):
+                archive.read("README.txt")
+
+    def test_read_many_parallel_in_order(self, archive_path):
+        threads = set()
+        with MemberArchive(archive_path) as archive:
+            read = archive.read
+
+            def spy(name, **kwargs):
+                threads.add(threading.get_ident())
+                return read(name, **kwargs)
+
+            archive.read = spy
+            results = list(archive.read_many(max_workers=2))
+        assert [name for name, _ in results] == [
+            "readings/m1.csv",
+            "readings/m2.csv",
+            "records.json",
+            "activity.jsonl",
+        ]
+        assert all(isinstance(frame, pd.DataFrame) for _, frame in results)
+        assert threading.get_ident() not in threads
+
+    def test_read_many_closes_thread_handles(self, archive_path):
+        with MemberArchive(archive_path) as archive:
+            open_files = len(os.listdir("/proc/self/fd"))
+            for _ in range(3):
+                list(archive.read_many(max_workers=2))
+            assert archive._handles == {}
+            assert len(os.listdir("/proc/self/fd")) == open_files
+
+    def test_read_arrow(self, archive_path):
+        pytest.importorskip("pyarrow")
+        with MemberArchive(archive_path) as archive:
+            tables = dict(archive.read_many(["readings/m1.csv"], arrow=True))
+        assert tables["readings/m1.csv"].num_rows == 24
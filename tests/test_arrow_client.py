@@ -0,0 +1,88 @@
+"""Tests for the Arrow and Polars clients."""
+
+import inspect
+from unittest.mock import patch
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from energyid.aio.clients.arrow import ArrowClient  # noqa: E402
+
+from .test_aio_client import _mock_aiohttp_response  # noqa: E402
+
+
+def _points(*values):
+    return [
+        {"timestamp": f"2024-01-0{i + 1}T00:00:00Z", "value": v}
+        for i, v in enumerate(values)
+    ]
+
+
+class TestArrowClient:
+    EXPECTED_METHODS = [
+        "get_meter_data",
+        "get_meters_data",
+        "get_meter_readings",
+        "get_record_data",
+        "get_member_records_table",
+        "get_group_records_table",
+        "get_record_meters_table",
+        "get_group_meters_table",
+    ]
+
+    def setup_method(self):
+        self.client = ArrowClient(api_key="test-key")
+
+    def test_all_methods_are_coroutines(self):
+        for method_name in self.EXPECTED_METHODS:
+            assert inspect.iscoroutinefunction(getattr(ArrowClient, method_name))
+
+    @pytest.mark.asyncio
+    async def test_get_meter_data(self):
+        mock_cm = _mock_aiohttp_response({"data": _points(1.0, None)})
+        with patch.object(self.client.session, "request", return_value=mock_cm):
+            table = await self.client.get_meter_data("m1")
+        assert table.schema.field("timestamp").type == pa.timestamp("ns", tz="UTC")
+        assert table["value"].to_pylist() == [1.0, None]
+        df = ArrowClient.to_pandas(table)
+        assert str(df["value"].dtype) == "double[pyarrow]"
+
+    @pytest.mark.asyncio
+    async def test_get_record_data(self):
+        mock_cm = _mock_aiohttp_response(
+            {
+                "value": [
+                    {"name": "a", "series": [{"name": "s1", "data": _points(1, 2)}]},
+                    {"name": "b", "data": _points(3)},
+                ]
+            }
+        )
+        with patch.object(self.client.session, "request", return_value=mock_cm):
+            table = await self.client.get_record_data(1, "x", start="a", end="b")
+        assert table.num_rows == 3
+        assert table["name"].to_pylist() == ["a", "a", "b"]
+        assert table["series"].to_pylist() == ["s1", "s1", None]
+
+    @pytest.mark.asyncio
+    async def test_listing_is_flattened(self):
+        mock_cm = _mock_aiohttp_response(
+            [{"id": "m1", "record": {"id": 1, "owner": {"name": "x"}}}]
+        )
+        with patch.object(self.client.session, "request", return_value=mock_cm):
+            table = await self.client.get_record_meters_table(1)
+        assert table.column_names == ["id", "record.id", "record.owner.name"]
+
+
+class TestPolarsClient:
+    @pytest.mark.asyncio
+    async def test_returns_polars_frame(self):
+        pl = pytest.importorskip("polars")
+        from energyid.aio.clients.polars import PolarsClient
+
+        client = PolarsClient(api_key="test-key")
+        mock_cm = _mock_aiohttp_response({"readings": _points(1, 2)[::-1]})
+        with patch.object(client.session, "request", return_value=mock_cm):
+            df = await client.get_meter_readings("m1")
+        assert isinstance(df, pl.DataFrame)
+        assert df["value"].to_list() == [1, 2]
@@ -0,0 +1,115 @@
+"""Tests for predicate-driven bulk mutations."""
+
+import asyncio
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+from energyid.aio import JSONClient
+from energyid.aio.bulk import apply_bulk
+from energyid.aio.models import Meter, Record
+
+
+class TestApplyBulk:
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_and_progress(self):
+        inflight = peak = 0
+        progress = []
+
+        async def func(item):
+            nonlocal inflight, peak
+            inflight += 1
+            peak = max(peak, inflight)
+            await asyncio.sleep(0.001)
+            inflight -= 1
+            if item["id"] == 3:
+                raise ValueError("nope")
+            return item["id"] * 10
+
+        items = [{"id": i} for i in range(8)]
+        summary = await apply_bulk(
+            items,
+            func,
+            action="test",
+            concurrency=3,
+            on_progress=lambda o, done, total: progress.append((done, total)),
+        )
+
+        assert peak == 3
+        assert progress == [(i, 8) for i in range(1, 9)]
+        assert summary.matched == 8
+        assert summary.done == 7
+        assert [o.item["id"] for o in summary.failed] == [3]
+        assert summary.outcomes[2].result == 20
+        assert str(summary) == "test: 8 matched, 7 done, 1 failed"
+
+    @pytest.mark.asyncio
+    async def test_dry_run_calls_nothing(self):
+        async def func(item):
+            raise AssertionError("called")
+
+        summary = await apply_bulk([{"id": 1}], func, action="test", dry_run=True)
+        assert [o.status for o in summary.outcomes] == ["dry_run"]
+        assert str(summary) == "test: 1 matched (dry run)"
+
+
+class TestBulkEndpoints:
+    def setup_method(self):
+        self.client = JSONClient(api_key="test-key")
+
+    @pytest.mark.asyncio
+    async def test_delete_records_where(self):
+        records = [
+            Record({"id": i, "displayName": name}, client=self.client)
+            for i, name in enumerate(["script 1", "home", "script 2"])
+        ]
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "records/2":
+                raise aiohttp.ClientError("boom")
+
+        with (
+            patch.object(self.client, "get_member_records", return_value=records),
+            patch.object(self.client, "_request", side_effect=fake_request) as req,
+        ):
+            summary = await self.client.delete_records_where(
+                lambda r: r["displayName"].startswith("script")
+            )
+
+        assert {c.args for c in req.call_args_list} == {
+            ("DELETE", "records/0"),
+            ("DELETE", "records/2"),
+        }
+        assert summary.done == 1
+        assert summary.failed[0].item.id == 2
+
+    @pytest.mark.asyncio
+    async def test_edit_records_where_per_record_changes(self):
+        records = [Record({"id": 1, "displayName": "a"}, client=self.client)]
+        with (
+            patch.object(self.client, "get_member_records", return_value=records),
+            patch.object(self.client, "_request", return_value={"id": 1}) as req,
+        ):
+            await self.client.edit_records_where(
+                lambda r: True, lambda r: {"displayName": r["displayName"].upper()}
+            )
+        req.assert_called_once_with("PUT", "records/1", displayName="A")
+
+    @pytest.mark.asyncio
+    async def test_close_meters_where_dry_run(self):
+        def meters(record_id):
+            return [
+                Meter({"id": f"{record_id}-{kind}", "metric": kind}, client=self.client)
+                for kind in ("electricity", "gas")
+            ]
+
+        with (
+            patch.object(self.client, "get_record_meters", side_effect=meters),
+            patch.object(self.client, "_request") as req,
+        ):
+            summary = await self.client.close_meters_where(
+                [1, 2], lambda m: m["metric"] == "gas", dry_run=True
+            )
+        req.assert_not_called()
+        assert [o.item.id for o in summary.outcomes] == ["1-gas", "2-gas"]
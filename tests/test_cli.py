@@ -0,0 +1,203 @@
+"""Tests for the energyid command line."""
+
+import io
+import json
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from energyid import ReadingsStore
+from energyid.cube import RecordDataCube
+from energyid.aio import PandasClient
+from energyid.cli import Progress, build_parser, main
+
+
+def _summary(capsys) -> dict:
+    return json.loads(capsys.readouterr().out)
+
+
+class TestParser:
+    def test_limits_and_api_key_from_env(self, monkeypatch):
+        monkeypatch.setenv("ENERGYID_API_KEY", "env-key")
+        args = build_parser().parse_args(
+            ["--max-concurrency", "4", "--rate-window", "2", "backfill", "m1", "m2"]
+            + ["--store", "cache"]
+        )
+        assert args.api_key == "env-key"
+        assert (args.max_concurrency, args.rate_window) == (4, 2.0)
+        assert args.meter_id == ["m1", "m2"]
+
+    def test_missing_api_key(self, monkeypatch):
+        monkeypatch.delenv("ENERGYID_API_KEY", raising=False)
+        with pytest.raises(SystemExit):
+            main(["backfill", "m1", "--store", "cache"])
+
+
+class TestProgress:
+    def test_line_with_eta(self):
+        progress = Progress(
+            "readings", total=100, unit="readings", stream=io.StringIO()
+        )
+        progress.started -= 10
+        progress.update(50)
+        assert progress.line().startswith("readings: 50/100 readings, 5.0/s")
+        assert progress.line().endswith("ETA 00:00:10")
+
+    def test_disabled_writes_nothing(self):
+        stream = io.StringIO()
+        progress = Progress("points", enabled=False, stream=stream)
+        progress.update(3)
+        progress.close()
+        assert stream.getvalue() == ""
+
+
+class TestCommands:
+    def test_import_groups_by_meter(self, tmp_path, capsys):
+        path = tmp_path / "readings.csv"
+        pd.DataFrame(
+            {
+                "meter": ["a", "a", "b"],
+                "timestamp": [
+                    "2024-01-01T00:00:00Z",
+                    "2024-01-02T00:00:00Z",
+                    "2024-01-01T00:00:00Z",
+                ],
+                "value": [1.0, 2.0, 3.0],
+            }
+        ).to_csv(path, index=False)
+        uploaded = {}
+
+        async def upload_readings(self, meter_id, ts, **kwargs):
+            uploaded[meter_id] = ts
+            return pd.DataFrame({"status": "sent"}, index=ts.index)
+
+        with patch.object(PandasClient, "upload_readings", upload_readings):
+            code = main(
+                ["--api-key", "k", "--quiet", "import", str(path)]
+                + ["--meter-column", "meter"]
+            )
+        assert code == 0
+        assert len(uploaded["a"]) == 2
+        assert str(uploaded["b"].index.tz) == "UTC"
+        summary = _summary(capsys)
+        assert summary["command"] == "import"
+        assert summary["meters"] == {"a": {"sent": 2}, "b": {"sent": 1}}
+
+    def test_backfill_continues_from_store(self, tmp_path, capsys):
+        store = ReadingsStore(tmp_path)
+        index = pd.date_range("2024-01-01", periods=4, freq="h", tz="UTC")
+        store.append("m1", pd.Series([1.0, 2.0, 3.0, 4.0], index=index))
+        starts = {}
+
+        async def iter_meter_data(self, meter_id, start=None, **kwargs):
+            starts[meter_id] = start
+            index = pd.date_range("2024-01-01 03:00", periods=3, freq="h", tz="UTC")
+            yield pd.Series([4.0, 5.0, 6.0], index=index)
+
+        summary_path = tmp_path / "summary.json"
+        with patch.object(PandasClient, "iter_meter_data", iter_meter_data):
+            code = main(
+                ["--api-key", "k", "--quiet", "--summary", str(summary_path)]
+                + ["backfill", "m1", "m2", "--store", str(tmp_path)]
+                + ["--start", "2023-01-01"]
+            )
+        assert code == 0
+        assert starts["m1"] == pd.Timestamp("2024-01-01 03:00", tz="UTC")
+        assert starts["m2"] == pd.Timestamp("2023-01-01", tz="UTC")
+        summary = json.loads(summary_path.read_text())
+        assert summary["written"] == {"m1": 2, "m2": 3}
+        assert capsys.readouterr().out == ""
+
+    def test_failures_set_exit_code(self, tmp_path, capsys):
+        async def iter_meter_data(self, meter_id, **kwargs):
+            raise RuntimeError("boom")
+            yield
+
+        with patch.object(PandasClient, "iter_meter_data", iter_meter_data):
+            code = main(
+                ["--api-key", "k", "--quiet", "backfill", "m1"]
+                + ["--store", str(tmp_path), "--start", "2024-01-01"]
+            )
+        assert code == 1
+        assert "boom" in _summary(capsys)["failed"]["m1"]
+
+    def test_backfill_requests_chunks_up_to_now(self, tmp_path, capsys):
+        store = ReadingsStore(tmp_path)
+        yesterday = pd.Timestamp.now(tz="UTC").floor("D") - pd.Timedelta(days=1)
+        store.append("m1", pd.Series([1.0], index=[yesterday]))
+        params = []
+
+        async def request(self, method, endpoint, **kwargs):
+            params.append((endpoint, kwargs))
+            return {"data": []}
+
+        with patch.object(PandasClient, "_request", request):
+            code = main(
+                ["--api-key", "k", "--quiet", "backfill", "m1", "m2"]
+                + ["--store", str(tmp_path), "--start", "2024-01-01"]
+                + ["--interval", "PT1H"]
+            )
+        assert code == 0
+        today = pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d")
+        calls = {endpoint: [] for endpoint, _ in params}
+        for endpoint, kwargs in params:
+            assert kwargs["interval"] == "PT1H"
+            calls[endpoint].append(kwargs)
+        resumed, new = calls["meters/m1/data"], calls["meters/m2/data"]
+        assert resumed[0]["start"] == yesterday.strftime("%Y-%m-%d")
+        assert new[0]["start"] == "2024-01-01"
+        assert len(new) > 1
+        assert resumed[-1]["end"] == new[-1]["end"] == today
+
+    def test_backfill_rejects_unknown_interval(self, tmp_path, capsys):
+        with pytest.raises(SystemExit):
+            main(["backfill", "m1", "--store", str(tmp_path), "--interval", "P2D"])
+        assert "invalid choice: 'P2D'" in capsys.readouterr().err
+
+    def test_backfill_without_start(self, tmp_path, capsys):
+        code = main(
+            ["--api-key", "k", "--quiet", "backfill", "m1"]
+            + ["--store", str(tmp_path), "--end", "2024-01-01"]
+        )
+        assert code == 1
+        assert "--start" in _summary(capsys)["failed"]["m1"]
+
+    def test_failed_readings_set_exit_code(self, tmp_path, capsys):
+        path = tmp_path / "readings.csv"
+        pd.DataFrame(
+            {"timestamp": ["2024-01-01T00:00:00Z"] * 2, "value": [1.0, 2.0]}
+        ).to_csv(path, index=False)
+
+        async def upload_readings(self, meter_id, ts, **kwargs):
+            return pd.DataFrame({"status": ["sent", "failed"]}, index=ts.index)
+
+        with patch.object(PandasClient, "upload_readings", upload_readings):
+            code = main(
+                ["--api-key", "k", "--quiet", "import", str(path)] + ["--meter-id", "a"]
+            )
+        assert code == 1
+        summary = _summary(capsys)
+        assert summary["meters"] == {"a": {"sent": 1, "failed": 1}}
+        assert summary["failed"] == {"a": "1 readings failed"}
+
+    def test_harvest_shows_progress(self, tmp_path, capsys):
+        async def get_group_data(self, on_progress=None, **kwargs):
+            for i in range(2):
+                on_progress(i + 1, 2)
+            index = pd.date_range("2024-01-01", periods=2, freq="D", tz="UTC")
+            return RecordDataCube.from_series(
+                [(1, "x", pd.Series([1.0, 2.0], index=index))]
+            )
+
+        output = tmp_path / "group.csv"
+        with patch.object(PandasClient, "get_group_data", get_group_data):
+            code = main(
+                ["--api-key", "k", "harvest", "g1", "--metric", "x"]
+                + ["--start", "2024-01-01", "--end", "2024-01-03"]
+                + ["--output", str(output)]
+            )
+        assert code == 0
+        captured = capsys.readouterr()
+        assert "requests: 2/2 requests" in captured.err
+        assert json.loads(captured.out)["rows"] == 2
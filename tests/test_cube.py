@@ -0,0 +1,58 @@
+"""Tests for the record data cube."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from energyid import RecordDataCube
+
+
+def _daily(values, tz="UTC"):
+    index = pd.date_range("2024-01-01", periods=len(values), freq="D", tz=tz)
+    return pd.Series(values, index=index.tz_convert("UTC"), dtype="float64")
+
+
+class TestRecordDataCube:
+    def setup_method(self):
+        self.cube = RecordDataCube.from_series(
+            [
+                (1, "electricityImport", _daily([1, 2, 3])),
+                (1, "gasImport", _daily([10, 20, 30])),
+                (2, "electricityImport", _daily([3, 4, 5], tz="Europe/Brussels")),
+                (2, "gasImport", pd.Series(dtype="float64")),
+            ],
+            timezones={1: "UTC", 2: "Europe/Brussels"},
+        )
+
+    def test_shape_aligns_local_time(self):
+        assert self.cube.shape == (2, 3, 2)
+        assert self.cube.timestamps[0] == pd.Timestamp("2024-01-01")
+        assert self.cube.timestamps.tz is None
+
+    def test_dst_fall_back(self):
+        index = pd.date_range("2024-10-27 00:00", periods=6, freq="h", tz="UTC")
+        series = [(1, "electricityImport", pd.Series(1.0, index=index))]
+        # 02:00-03:00 local happens twice; local labels would merge it
+        with pytest.raises(ValueError, match="local_time=False"):
+            RecordDataCube.from_series(series, timezones={1: "Europe/Brussels"})
+
+        cube = RecordDataCube.from_series(
+            series, timezones={1: "Europe/Brussels"}, local_time=False
+        )
+        assert cube.shape == (1, 6, 1)
+        assert cube.totals().loc[1, "electricityImport"] == 6.0
+        assert str(cube.timestamps.tz) == "UTC"
+
+    def test_reductions(self):
+        total = self.cube.sum()
+        assert total.loc["2024-01-01", "electricityImport"] == 4
+        assert self.cube.mean().loc["2024-01-03", "electricityImport"] == 4
+        assert self.cube.percentile(50).loc["2024-01-02", "gasImport"] == 20
+        assert self.cube.totals().loc[2, "electricityImport"] == 12
+
+    def test_normalize(self):
+        profile = self.cube.normalize()
+        assert profile.record(1)["electricityImport"].sum() == pytest.approx(1.0)
+        per_m2 = self.cube.normalize(by={1: 2.0, 2: 4.0})
+        assert per_m2.metric("electricityImport").loc["2024-01-01", 2] == 0.75
+        assert np.isnan(per_m2.record(2)["gasImport"]).all()
@@ -0,0 +1,194 @@
+"""Tests for the data parsing helpers."""
+
+import datetime as dt
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from energyid.aio.clients.data_helpers import (
+    compact,
+    parse_meter_data,
+    parse_meter_data_multiple,
+    parse_record_data,
+    parse_timestamps,
+)
+
+
+def _chunk(*points):
+    return {"data": [{"timestamp": t, "value": v} for t, v in points]}
+
+
+class TestParseMeterData:
+    def test_multiple_chunks(self):
+        ts = parse_meter_data_multiple(
+            [
+                _chunk(("2024-01-01T00:00:00Z", 1), ("2024-01-02T00:00:00Z", 2)),
+                _chunk(("2024-01-03T00:00:00Z", None)),
+            ],
+            meter_id="m1",
+        )
+        assert ts.name == "m1"
+        assert ts.index.name == "timestamp"
+        assert str(ts.index.tz) == "UTC"
+        assert ts.dtype == "float64"
+        assert len(ts) == 3
+        assert np.isnan(ts.iloc[-1])
+
+    def test_unordered_chunks_are_sorted(self):
+        ts = parse_meter_data_multiple(
+            [
+                _chunk(("2024-01-03T00:00:00Z", 3)),
+                _chunk(("2024-01-01T00:00:00Z", 1), ("2024-01-02T00:00:00Z", 2)),
+            ],
+            meter_id="m1",
+        )
+        assert ts.index.is_monotonic_increasing
+        assert ts.tolist() == [1.0, 2.0, 3.0]
+
+    def test_boundary_duplicates_later_chunk_wins(self):
+        ts = parse_meter_data_multiple(
+            [
+                _chunk(("2024-01-01T00:00:00Z", 1), ("2024-01-02T00:00:00Z", 2)),
+                _chunk(("2024-01-02T00:00:00Z", 20), ("2024-01-03T00:00:00Z", 3)),
+                _chunk(("2024-01-03T00:00:00Z", 30)),
+            ],
+            meter_id="m1",
+        )
+        assert ts.index.is_unique
+        assert ts.tolist() == [1.0, 20.0, 30.0]
+
+    def test_empty(self):
+        ts = parse_meter_data({"data": []}, meter_id="m1")
+        assert ts.empty
+        assert ts.name == "m1"
+        assert isinstance(ts.index, pd.DatetimeIndex)
+
+
+def _points(*values):
+    return [
+        {"timestamp": f"2024-01-0{i + 1}T00:00:00Z", "value": v}
+        for i, v in enumerate(values)
+    ]
+
+
+class TestParseRecordData:
+    def test_single_series(self):
+        ts = parse_record_data({"value": [{"data": _points(1)}]}, name="energy")
+        assert ts.name == "energy"
+        assert ts.index.name is None
+        assert ts.tolist() == [1.0]
+
+    def test_multiple_series(self):
+        d = {
+            "value": [
+                {
+                    "name": "a",
+                    "series": [
+                        {"name": "s1", "data": _points(1, 2, 3)},
+                        {"name": "s2", "data": _points(4, 5)},
+                        {"name": "empty", "data": []},
+                    ],
+                }
+            ]
+        }
+        df = parse_record_data(d, name="energy")
+        assert list(df.columns) == [("energy", "s1"), ("energy", "s2")]
+        assert isinstance(df.columns, pd.MultiIndex)
+        assert np.isnan(df[("energy", "s2")].iloc[-1])
+
+    def test_multiple_values(self):
+        d = {
+            "value": [
+                {"name": "a", "series": [{"name": "s1", "data": _points(1, 2)}]},
+                {"name": "b", "series": [{"name": "s1", "data": _points(3, 4, 5)}]},
+            ]
+        }
+        df = parse_record_data(d, name="ignored")
+        assert list(df.columns) == [("a", "s1"), ("b", "s1")]
+        assert df.shape == (3, 2)
+        assert str(df.index.tz) == "UTC"
+        assert df.loc["2024-01-02", ("b", "s1")].item() == 4.0
+
+    def test_no_values(self):
+        assert parse_record_data({"value": []}, name="x").empty
+
+
+class TestParseTimestamps:
+    @pytest.mark.parametrize(
+        "stamps",
+        [
+            ["2024-01-01T00:00:00Z", "2024-01-01T00:15:00Z"],
+            ["2024-01-01T00:00:00.0000000Z", "2024-01-01T00:15:00.5000000Z"],
+            ["2024-01-01T01:00:00+01:00", "2024-01-01T01:15:00+01:00"],
+            ["2024-03-31T01:00:00+01:00", "2024-03-31T04:00:00+02:00"],
+            ["2024-01-01T00:00:00-03:30"],
+            ["2024-01-01", "2024-01-02"],
+            ["2024-01-01T00:00:00Z", "2024-01-01T01:00:00+01:00"],
+        ],
+    )
+    def test_matches_pandas(self, stamps):
+        expected = pd.to_datetime(stamps, utc=True, format="ISO8601")
+        assert (parse_timestamps(stamps) == expected.as_unit("ns").asi8).all()
+
+    @pytest.mark.parametrize(
+        "stamps",
+        [
+            ["2024-01-01T00:00:00"] * 3 + ["2024-01-01T01:00:00Z"],
+            ["2024-01-01T00:00:00"] * 3 + ["2024-01-01T01:00:00+01:00"],
+            ["2024-01-01", "2024-01-02T09:00:00-05:00"],
+            [dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc), "2024-01-01T01:00Z"],
+        ],
+    )
+    def test_mixed_layouts_fall_back(self, stamps):
+        expected = pd.to_datetime(stamps, utc=True, format="ISO8601")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = parse_timestamps(stamps)
+        assert (result == expected.as_unit("ns").asi8).all()
+
+    def test_empty(self):
+        assert parse_timestamps([]).dtype == np.int64
+
+
+class TestCompact:
+    def setup_method(self):
+        self.df = pd.DataFrame(
+            {
+                "value": np.arange(100, dtype="float64"),
+                "status": ["VAL", "EST"] * 50,
+                "key": [str(i) for i in range(100)],
+            }
+        )
+
+    def test_float32(self):
+        out = compact(self.df)
+        assert out["value"].dtype == "float32"
+        assert isinstance(out["status"].dtype, pd.CategoricalDtype)
+        assert out["key"].dtype == object
+        assert out.attrs["memory_saved"] > 0
+        assert self.df["value"].dtype == "float64"
+
+    def test_nullable(self):
+        ts = pd.Series([1.0, np.nan])
+        out = compact(ts, values="nullable")
+        assert out.dtype == "Float32"
+        assert out.isna().iloc[1]
+
+    @pytest.mark.parametrize(
+        "data, dtype, expected",
+        [
+            ([1, 2, 300], "uint64", "UInt16"),
+            ([1, 2, None], "UInt32", "UInt8"),
+            ([-1, 2, 3], "int64", "Int8"),
+        ],
+    )
+    def test_nullable_integers(self, data, dtype, expected):
+        out = compact(pd.Series(data, dtype=dtype), values="nullable")
+        assert out.dtype == expected
+        assert out.iloc[1] == 2
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError):
+            compact(self.df, values="float16")
@@ -0,0 +1,108 @@
+"""Tests for the Parquet account export."""
+
+import json
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+ds = pytest.importorskip("pyarrow.dataset")
+
+from energyid.aio import JSONClient  # noqa: E402
+from energyid.aio.export import AccountExport  # noqa: E402
+
+PAGES = {
+    "m1": [
+        (
+            [
+                {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0},
+                {"timestamp": "2024-01-01T01:00:00Z", "value": 2.0},
+            ],
+            "next",
+        ),
+        ([{"timestamp": "2024-01-01T02:00:00Z", "value": 3}], None),
+    ],
+    "m2": [([{"timestamp": "2024-01-01T00:00:00Z", "value": 5.0}], None)],
+    "m3": [([{"timestamp": "2024-01-01T00:00:00Z", "value": 7.0}], None)],
+}
+
+
+class TestAccountExport:
+    def setup_method(self):
+        self.client = JSONClient(api_key="test-key")
+        self.failing = {"m3"}
+        self.failing_records = set()
+        self.reading_requests = []
+
+    async def fake_request(self, method, endpoint, **kwargs):
+        if endpoint == "members/me/records":
+            return [
+                {"id": 1, "displayName": "Home", "address": {"city": "Gent"}},
+                {"id": 2, "displayName": "Office"},
+            ]
+        if endpoint.split("/")[1] in self.failing_records:
+            raise aiohttp.ClientError("listing failed")
+        if endpoint == "records/1/meters":
+            return [{"id": "m1", "metric": "electricity"}, {"id": "m2"}]
+        if endpoint == "records/2/meters":
+            return [{"id": "m3", "metric": "gas", "unit": "m³"}]
+        meter_id = endpoint.split("/")[1]
+        self.reading_requests.append(meter_id)
+        if meter_id in self.failing:
+            raise aiohttp.ClientError("boom")
+        page = 1 if kwargs.get("nextRowKey") else 0
+        readings, next_row_key = PAGES[meter_id][page]
+        return {"readings": readings, "nextRowKey": next_row_key}
+
+    @pytest.mark.asyncio
+    async def test_export_and_resume(self, tmp_path):
+        with patch.object(self.client, "_request", side_effect=self.fake_request):
+            summary = await AccountExport(self.client, tmp_path, take=2).run()
+
+        assert (summary.records, summary.meters, summary.readings) == (2, 3, 4)
+        assert list(summary.failed) == ["m3"]
+
+        records = pq.read_table(tmp_path / "records.parquet")
+        assert "address.city" in records.column_names
+        meters = pq.read_table(tmp_path / "meters.parquet")
+        assert meters["recordId"].to_pylist() == [1, 1, 2]
+        assert "unit" in meters.column_names
+
+        readings = ds.dataset(
+            tmp_path / "readings", format="parquet", partitioning="hive"
+        ).to_table()
+        assert readings.num_rows == 4
+        assert sorted(readings["meter_id"].to_pylist()) == ["m1", "m1", "m1", "m2"]
+        assert readings.schema.field("timestamp").type == pa.timestamp("ns", "UTC")
+        # The failed meter left nothing behind
+        assert list((tmp_path / "readings" / "record_id=2").iterdir()) == []
+
+        # A second run only fetches the meter that failed
+        self.failing = set()
+        self.reading_requests = []
+        with patch.object(self.client, "_request", side_effect=self.fake_request):
+            summary = await AccountExport(self.client, tmp_path).run()
+        assert self.reading_requests == ["m3"]
+        assert (summary.skipped, summary.readings, summary.failed) == (2, 1, {})
+
+    @pytest.mark.asyncio
+    async def test_failed_listing_is_retried(self, tmp_path):
+        self.failing, self.failing_records = set(), {"2"}
+        with patch.object(self.client, "_request", side_effect=self.fake_request):
+            summary = await AccountExport(self.client, tmp_path).run()
+
+        assert (summary.meters, summary.readings) == (2, 4)
+        assert list(summary.failed_records) == ["2"]
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert list(checkpoint["failed_records"]) == ["2"]
+        assert sorted(checkpoint["meters"]) == ["m1", "m2"]
+
+        self.failing_records, self.reading_requests = set(), []
+        with patch.object(self.client, "_request", side_effect=self.fake_request):
+            summary = await AccountExport(self.client, tmp_path).run()
+        assert self.reading_requests == ["m3"]
+        assert summary.failed_records == {}
+        checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+        assert checkpoint["failed_records"] == {}
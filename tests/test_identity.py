@@ -0,0 +1,110 @@
+"""Tests for the identity map of model objects."""
+
+import gc
+from unittest.mock import patch
+
+import pytest
+
+from energyid.aio import JSONClient, PandasClient
+from energyid.aio.identity import IdentityMap
+from energyid.aio.models import Meter, Record
+
+
+class TestIdentityMap:
+    def test_resolve_merges_partial_payloads(self):
+        identity = IdentityMap()
+        a = identity.resolve(Record, {"id": 1, "displayName": "Home"}, client=None)
+        b = identity.resolve(Record, {"id": "1", "timeZone": "UTC"}, client=None)
+        assert a is b
+        # The id keeps its first type, so it matches ids seen before
+        assert a == {"id": 1, "displayName": "Home", "timeZone": "UTC"}
+        # Same id, other type
+        assert identity.resolve(Meter, {"id": 1}, client=None) is not a
+
+    def test_record_id_fallback_and_missing_id(self):
+        identity = IdentityMap()
+        a = identity.resolve(Record, {"recordId": 7}, client=None)
+        assert identity.get(Record, 7) is a
+        assert identity.resolve(Record, {}, client=None) is not identity.resolve(
+            Record, {}, client=None
+        )
+
+    def test_weak_retention(self):
+        identity = IdentityMap()
+        identity.resolve(Record, {"id": 1}, client=None)
+        gc.collect()
+        assert identity.get(Record, 1) is None
+
+    def test_lru_retention(self):
+        identity = IdentityMap(retention="lru", maxsize=2)
+        identity.resolve(Record, {"id": 1}, client=None)
+        identity.resolve(Record, {"id": 2}, client=None)
+        identity.get(Record, 1)
+        identity.resolve(Record, {"id": 3}, client=None)
+        assert identity.get(Record, 1) is not None
+        assert identity.get(Record, 2) is None
+        assert len(identity) == 2
+
+    def test_invalid_retention(self):
+        with pytest.raises(ValueError):
+            IdentityMap(retention="forever")
+
+
+class TestClientIdentityMap:
+    @pytest.mark.asyncio
+    async def test_listing_and_get_share_one_object(self):
+        client = JSONClient(api_key="test-key", identity_map="weak")
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "groups/g1/records":
+                return [{"id": 1, "displayName": "Home"}]
+            return {"id": 1, "timeZone": "Europe/Brussels"}
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            (listed,) = await client.get_group_records("g1")
+            await listed.extend_info()
+            fetched = await client.get_record(1)
+        assert fetched is listed
+        assert listed.timezone == "Europe/Brussels"
+        assert listed["displayName"] == "Home"
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        client = JSONClient(api_key="test-key")
+        assert client.identity_map is None
+        with patch.object(client, "_request", return_value={"id": 1}):
+            assert await client.get_record(1) is not await client.get_record(1)
+
+    @pytest.mark.asyncio
+    async def test_delete_forgets(self):
+        client = JSONClient(api_key="test-key", identity_map="lru")
+        with patch.object(client, "_request", return_value={"id": 1}):
+            await client.get_record(1)
+            await client.delete_record(1)
+        assert client.identity_map.get(Record, 1) is None
+
+    @pytest.mark.asyncio
+    async def test_record_data_timezone_from_cache(self):
+        client = PandasClient(api_key="test-key", identity_map="weak")
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "records/1":
+                return {"id": 1, "timeZone": "Europe/Brussels"}
+            return {
+                "value": [
+                    {
+                        "name": "x",
+                        "data": [{"timestamp": "2024-01-01T00:00:00Z", "value": 1}],
+                    }
+                ]
+            }
+
+        with patch.object(client, "_request", side_effect=fake_request) as req:
+            record = await client.get_record(1)
+            ts = await client.get_record_data(1, "x", start="a", end="b")
+        assert record.timezone == "Europe/Brussels"
+        assert [c.args[1] for c in req.call_args_list] == [
+            "records/1",
+            "records/1/data/x",
+        ]
+        assert str(ts.index.tz) == "Europe/Brussels"
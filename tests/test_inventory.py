@@ -0,0 +1,82 @@
+"""Tests for the indexed meter inventory."""
+
+from unittest.mock import patch
+
+import pytest
+
+from energyid.aio import JSONClient, MeterInventory
+
+
+def meter(id, metric="electricity", unit="kWh", **kwargs):
+    return {
+        "id": id,
+        "metric": metric,
+        "unit": unit,
+        "readingType": "counter",
+        **kwargs,
+    }
+
+
+class TestMeterInventory:
+    def setup_method(self):
+        self.inventory = MeterInventory(
+            [
+                meter("a", recordId=1),
+                meter("b", metric="gas", unit="m³", recordId=1),
+                meter("c", recordId=2, hidden=True),
+                meter("d", metric="water", unit="m³", recordId=2, closed=True),
+            ]
+        )
+
+    def ids(self, **criteria):
+        return sorted(m["id"] for m in self.inventory.query(**criteria))
+
+    def test_queries(self):
+        assert self.ids(metric="electricity") == ["a", "c"]
+        assert self.ids(metric="electricity", hidden=False) == ["a"]
+        assert self.ids(unit="m³", record=2) == ["d"]
+        assert self.ids(metric=["gas", "water"], closed=False) == ["b"]
+        assert self.ids(metric="solar") == []
+        # Unindexed fields are checked on the candidates
+        assert self.ids(record=1, id="b") == ["b"]
+        assert len(self.ids()) == 4
+
+    def test_add_reindexes_and_remove(self):
+        self.inventory.add(meter("a", metric="gas"))
+        assert self.ids(metric="gas") == ["a", "b"]
+        # The record is kept when the new payload lacks it
+        assert self.ids(record=1) == ["a", "b"]
+        self.inventory.remove("b")
+        assert self.ids(metric="gas") == ["a"]
+        assert "b" not in self.inventory
+        assert self.inventory.counts("metric") == {
+            "gas": 1,
+            "electricity": 1,
+            "water": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_from_member_and_refresh(self):
+        client = JSONClient(api_key="test-key")
+        listings = {
+            "records/1/meters": [meter("a"), meter("b", metric="gas")],
+            "records/2/meters": [meter("c")],
+        }
+
+        async def fake_request(method, endpoint, **kwargs):
+            if endpoint == "members/me/records":
+                return [{"id": 1}, {"id": 2}]
+            return listings[endpoint]
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            inventory = await MeterInventory.from_member(client)
+            assert sorted(m["id"] for m in inventory.query(metric="electricity")) == [
+                "a",
+                "c",
+            ]
+            listings["records/1/meters"] = [meter("a", hidden=True), meter("e")]
+            await inventory.refresh(client)
+
+        assert "b" not in inventory
+        assert sorted(m["id"] for m in inventory.query(record=1)) == ["a", "e"]
+        assert [m["id"] for m in inventory.query(hidden=True)] == ["a"]
@@ -0,0 +1,86 @@
+"""Tests for the mutation journal."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from energyid.aio import MutationJournal
+
+
+class TestMutationJournal:
+    @pytest.mark.asyncio
+    async def test_resume_skips_applied(self, tmp_path):
+        calls = []
+
+        async def create_record(display_name):
+            calls.append(display_name)
+            if display_name == "bad":
+                raise RuntimeError("network down")
+            return {"id": len(calls), "displayName": display_name}
+
+        with MutationJournal(tmp_path / "journal.db") as journal:
+            first = await journal.run(create_record, display_name="a")
+            with pytest.raises(RuntimeError):
+                await journal.run(create_record, display_name="bad")
+            assert journal.summary() == {"applied": 1, "failed": 1}
+
+        # A restarted job replays the same mutations
+        with MutationJournal(tmp_path / "journal.db") as journal:
+            again = await journal.run(create_record, display_name="a")
+            await journal.run(create_record, display_name="b")
+            failed = journal.failed()
+
+        assert again == first
+        assert calls == ["a", "bad", "b"]
+        assert failed[0]["arguments"] == {"display_name": "bad"}
+        assert "network down" in failed[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_intent_is_written_before_sending(self, tmp_path):
+        journal = MutationJournal(tmp_path / "journal.db")
+
+        async def delete_record(record_id):
+            assert [e["status"] for e in journal.in_doubt()] == ["pending"]
+
+        await journal.run(delete_record, idempotency_key="delete-1", record_id=1)
+        assert journal.status("delete-1") == "applied"
+        assert journal.in_doubt() == []
+        journal.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_share_one_mutation(self, tmp_path):
+        calls = []
+
+        async def create_record(display_name):
+            calls.append(display_name)
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        with MutationJournal(tmp_path / "journal.db") as journal:
+            results = await asyncio.gather(
+                *[journal.run(create_record, display_name="a") for _ in range(3)]
+            )
+            assert journal.entries()[0]["attempts"] == 1
+        assert calls == ["a"]
+        assert results == [{"id": 1}] * 3
+
+    @pytest.mark.asyncio
+    async def test_writes_run_off_the_event_loop(self, tmp_path):
+        threads = []
+
+        async def create_record(display_name):
+            return {}
+
+        with MutationJournal(tmp_path / "journal.db") as journal:
+            write = journal._write
+
+            def record_thread(*args):
+                threads.append(threading.get_ident())
+                write(*args)
+
+            with patch.object(journal, "_write", side_effect=record_thread):
+                await journal.run(create_record, display_name="a")
+        assert len(threads) == 2
+        assert threading.get_ident() not in threads
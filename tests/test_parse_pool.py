@@ -0,0 +1,117 @@
+"""Tests for parsing meter data in worker processes."""
+
+import asyncio
+import json
+import os
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from energyid.aio import PandasClient, ProcessParser
+from energyid.aio.clients.data_helpers import parse_meter_data_multiple
+from energyid.aio.clients.parse_pool import (
+    _discard_points,
+    _parse_meter_points,
+    _take_points,
+)
+
+
+def _chunks() -> list[dict]:
+    # Two chunks sharing their boundary point, as build_meter_data_calls makes
+    return [
+        {
+            "data": [
+                {"timestamp": "2024-01-01T00:00:00Z", "value": 1.0},
+                {"timestamp": "2024-01-01T02:00:00+01:00", "value": 2.0},
+                {"timestamp": "2024-01-02T00:00:00Z", "value": 3.0},
+            ]
+        },
+        {
+            "data": [
+                {"timestamp": "2024-01-02T00:00:00Z", "value": 30.0},
+                {"timestamp": "2024-01-02T06:00:00Z", "value": 4.0},
+            ]
+        },
+    ]
+
+
+@pytest.fixture(scope="module")
+def parser():
+    parser = ProcessParser(max_workers=2)
+    yield parser
+    parser.shutdown()
+
+
+class TestProcessParser:
+    async def test_matches_in_process_parser(self, parser):
+        payloads = [json.dumps(c).encode() for c in _chunks()]
+        ts = await parser.meter_data(payloads, meter_id="m1")
+        pd.testing.assert_series_equal(
+            ts, parse_meter_data_multiple(_chunks(), meter_id="m1")
+        )
+        assert ts.iloc[2] == 30.0
+
+    async def test_empty(self, parser):
+        ts = await parser.meter_data([b'{"data": []}'], meter_id="m1")
+        assert ts.empty
+        assert ts.name == "m1"
+        assert str(ts.index.tz) == "UTC"
+
+    def test_worker_block_is_released(self):
+        name, n = _parse_meter_points([json.dumps(_chunks()[0]).encode()])
+        assert n == 3
+        stamps, values = _take_points(name, n)
+        assert values.tolist() == [1.0, 2.0, 3.0]
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+    def test_abandoned_block_is_released(self):
+        future = Future()
+        future.set_result(_parse_meter_points([json.dumps(_chunks()[0]).encode()]))
+        _discard_points(future)
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=future.result()[0])
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs /dev/shm")
+    async def test_cancelled_parse_leaves_no_block(self):
+        points = [
+            {"timestamp": f"2024-01-01T00:00:{i % 60:02d}Z", "value": float(i)}
+            for i in range(200_000)
+        ]
+        payloads = [json.dumps({"data": points}).encode()]
+        parser = ProcessParser(max_workers=1)
+        try:
+            # Start the worker first, so the cancel hits a running parse
+            await parser.meter_data([b'{"data": []}'], "warmup")
+            before = set(os.listdir("/dev/shm"))
+            task = asyncio.ensure_future(parser.meter_data(payloads, "m1"))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            parser.shutdown(wait=True)
+        assert set(os.listdir("/dev/shm")) <= before
+
+
+class TestPandasClientParseProcesses:
+    async def test_get_meter_data_uses_raw_bodies(self, parser):
+        bodies = [json.dumps(c).encode() for c in _chunks()]
+        calls = []
+
+        async def request_bytes(self, method, endpoint, **params):
+            calls.append(params)
+            return bodies[len(calls) - 1]
+
+        async with PandasClient(api_key="k", parse_processes=parser) as client:
+            with patch.object(PandasClient, "_request_bytes", request_bytes):
+                ts = await client.get_meter_data(
+                    "m1", start="2024-01-01", end="2024-01-03", interval="PT5M"
+                )
+        assert len(calls) == 2
+        assert ts.tolist() == [1.0, 2.0, 30.0, 4.0]
+        # A shared parser outlives the client
+        assert (await parser.meter_data([b'{"data": []}'], "m")).empty
@@ -0,0 +1,60 @@
+"""Tests for the memory-mapped readings store."""
+
+import numpy as np
+import pandas as pd
+
+from energyid import ReadingsStore
+
+
+def _series(start: str, periods: int, offset: float = 0.0) -> pd.Series:
+    index = pd.date_range(start, periods=periods, freq="15min", tz="UTC")
+    return pd.Series(np.arange(periods, dtype="float64") + offset, index=index)
+
+
+class TestReadingsStore:
+    def test_roundtrip_is_zero_copy(self, tmp_path):
+        store = ReadingsStore(tmp_path)
+        assert store.append("m1", _series("2024-01-01", 10)) == 10
+
+        ts = store.get("m1")
+        assert len(ts) == 10
+        assert ts.name == "m1"
+        # Copies would be writeable; views on the read-only maps are not
+        assert not ts.to_numpy().flags.writeable
+        assert not ts.index.asi8.flags.writeable
+        assert ts.index[0] == pd.Timestamp("2024-01-01")
+
+    def test_append_skips_overlap(self, tmp_path):
+        store = ReadingsStore(tmp_path)
+        store.append("m1", _series("2024-01-01", 10))
+        written = store.append("m1", _series("2024-01-01 02:00", 10, offset=100))
+        assert written == 8
+        assert store.length("m1") == 18
+        assert store.get("m1").index.is_monotonic_increasing
+
+    def test_index_persists(self, tmp_path):
+        store = ReadingsStore(tmp_path)
+        store.append("m1", _series("2024-01-01", 3))
+        store.append("m2", _series("2024-01-01", 5))
+
+        reopened = ReadingsStore(tmp_path)
+        assert reopened.meter_ids == ["m1", "m2"]
+        assert "m2" in reopened
+        frame = reopened.to_frame()
+        assert frame.shape == (5, 2)
+        assert reopened.get("m1", tz="Europe/Brussels").index.tz is not None
+
+    def test_interrupted_append(self, tmp_path):
+        store = ReadingsStore(tmp_path)
+        store.append("m1", _series("2024-01-01", 4))
+        # Timestamps of the next append written, values not
+        ts_path, val_path = store._files("m1")
+        with open(ts_path, "ab") as f:
+            f.write(np.arange(3, dtype="int64").tobytes())
+
+        reopened = ReadingsStore(tmp_path)
+        assert reopened.length("m1") == 4
+        assert len(reopened.timestamps("m1")) == len(reopened.values("m1")) == 4
+        assert reopened.append("m1", _series("2024-01-01 01:00", 2, offset=10)) == 2
+        assert reopened.get("m1").tolist() == [0.0, 1.0, 2.0, 3.0, 10.0, 11.0]
+        assert ts_path.stat().st_size == val_path.stat().st_size
@@ -0,0 +1,145 @@
+"""Tests for the buffered meter-reading uploader."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from energyid.aio import JSONClient, MeterReadingUploader, MutationJournal
+
+
+class TestMeterReadingUploader:
+    def setup_method(self):
+        self.client = JSONClient(api_key="test-key")
+
+    @pytest.mark.asyncio
+    async def test_sends_all_and_deduplicates(self):
+        sent = []
+
+        async def fake_create(meter_id, value, timestamp):
+            await asyncio.sleep(0)
+            sent.append((meter_id, timestamp, value))
+            return {"value": value}
+
+        with patch.object(self.client, "create_meter_reading", side_effect=fake_create):
+            async with self.client.meter_reading_uploader(concurrency=2) as uploader:
+                for i in range(10):
+                    await uploader.put("m1", f"2024-01-01T00:{i:02d}:00Z", i)
+                await uploader.put("m1", "2024-01-01T00:09:00Z", 99)
+
+        assert len(sent) == 10
+        assert ("m1", "2024-01-01T00:09:00Z", 99) in sent
+        assert uploader.sent == 10
+        assert uploader.deduplicated == 1
+        assert uploader.errors == []
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_stall_close(self):
+        async def fake_create(meter_id, value, timestamp):
+            return {"value": value}
+
+        def on_result(result):
+            raise RuntimeError(f"callback failed for {result.value}")
+
+        with patch.object(self.client, "create_meter_reading", side_effect=fake_create):
+            uploader = self.client.meter_reading_uploader(
+                concurrency=1, on_result=on_result
+            )
+            for i in range(5):
+                await uploader.put("m1", f"2024-01-01T00:{i:02d}:00Z", i)
+            await asyncio.wait_for(uploader.close(), timeout=1)
+
+        assert uploader.sent == 5
+        assert len(uploader.callback_errors) == 5
+        assert "callback failed for 4" in str(uploader.callback_errors[-1])
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_is_a_reading_error(self):
+        uploader = MeterReadingUploader(self.client, concurrency=1)
+        with patch.object(uploader, "_send", side_effect=RuntimeError("boom")):
+            await uploader.put("m1", "0", 5)
+            await asyncio.wait_for(uploader.close(), timeout=1)
+
+        assert uploader.callback_errors == []
+        (result,) = uploader.errors
+        assert (result.meter_id, result.timestamp, result.value) == ("m1", "0", 5)
+        assert isinstance(result.error, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_put_does_not_drop_reading(self):
+        release = asyncio.Event()
+        sent = []
+
+        async def fake_create(meter_id, value, timestamp):
+            await release.wait()
+            sent.append(timestamp)
+            return {}
+
+        uploader = MeterReadingUploader(self.client, concurrency=1, max_pending=1)
+        with patch.object(self.client, "create_meter_reading", side_effect=fake_create):
+            await uploader.put("m1", "0", 0)
+            await uploader.put("m1", "1", 1)
+            blocked = asyncio.create_task(uploader.put("m1", "2", 2))
+            await asyncio.sleep(0.01)
+            blocked.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await blocked
+
+            retry = asyncio.create_task(uploader.put("m1", "2", 2))
+            release.set()
+            await retry
+            await uploader.close()
+
+        assert sorted(sent) == ["0", "1", "2"]
+        assert uploader.deduplicated == 0
+
+    @pytest.mark.asyncio
+    async def test_backpressure_and_errors(self):
+        release = asyncio.Event()
+        results = []
+
+        async def fake_create(meter_id, value, timestamp):
+            await release.wait()
+            if value < 0:
+                raise ValueError("bad value")
+            return {}
+
+        uploader = MeterReadingUploader(
+            self.client, concurrency=1, max_pending=2, on_result=results.append
+        )
+        with patch.object(self.client, "create_meter_reading", side_effect=fake_create):
+            # One in flight plus two waiting fills the uploader
+            for i in range(3):
+                await uploader.put("m1", str(i), -i)
+            blocked = asyncio.create_task(uploader.put("m1", "3", 3))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+
+            release.set()
+            await blocked
+            await uploader.close()
+
+        assert len(results) == 4
+        assert [r.timestamp for r in uploader.errors] == ["1", "2"]
+        assert isinstance(uploader.errors[0].error, ValueError)
+        with pytest.raises(RuntimeError):
+            await uploader.put("m1", "4", 4)
+
+    @pytest.mark.asyncio
+    async def test_journal_skips_applied_readings(self, tmp_path):
+        sent = []
+
+        async def fake_create(meter_id, value, timestamp):
+            sent.append(timestamp)
+            return {}
+
+        with patch.object(self.client, "create_meter_reading", side_effect=fake_create):
+            for _ in range(2):
+                with MutationJournal(tmp_path / "journal.db") as journal:
+                    async with self.client.meter_reading_uploader(
+                        journal=journal
+                    ) as uploader:
+                        for i in range(3):
+                            await uploader.put("m1", str(i), i)
+
+        assert sorted(sent) == ["0", "1", "2"]